@@ -2,13 +2,29 @@ import os
 from typing import Optional, Type
 
 from apiflask import APIFlask
-from flask import jsonify, send_from_directory
+from flask import jsonify, request
 
+from app.commands import register_commands
 from app.config import Config, config_by_name, get_config_name
 from app.controllers import register_blueprints, register_error_handlers
-from app.extensions import db, jwt, ma, migrate
+from app.extensions import (
+    compression,
+    db,
+    jwt,
+    ma,
+    metrics,
+    migrate,
+    password_hasher,
+    report_cache,
+    request_instrumentation,
+    static_assets,
+    token_versions,
+)
 from app.models import Period, User
 from app.services import UserService
+from app.services.auth_service import TokenIdentity
+from app.utils.pooling import engine_options
+from app.utils.sqlite import configure_sqlite
 
 
 def create_app(config_name: Optional[str] = None) -> APIFlask:
@@ -50,12 +66,34 @@ def create_app(config_name: Optional[str] = None) -> APIFlask:
         app.logger.error(f"Could not create instance folder at {app.instance_path}")
         pass  # Handle error appropriately
 
+    # Explicit SQLALCHEMY_ENGINE_OPTIONS override the DB_POOL_* settings
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        **engine_options(app.config),
+        **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    }
+
     # Initialize extensions
     db.init_app(app)
+    configure_sqlite(app)
     ma.init_app(app)
     # Pass db and model base class (or specific models) to Migrate
     migrate.init_app(app, db)
     jwt.init_app(app)
+    report_cache.init_app(app)
+    token_versions.init_app(app)
+    password_hasher.init_app(app)
+    request_instrumentation.init_app(app)
+    metrics.init_app(app)
+    static_assets.init_app(app)
+    compression.init_app(app)
+
+    # --- JWT Revocation Callback ---
+    # Tokens carry the user's token version in the "ver" claim (tokens issued
+    # before the claim existed count as version 0). A deleted user or a bumped
+    # version revokes the token, checked against a short-lived cache.
+    @jwt.token_in_blocklist_loader
+    def token_revoked_callback(_jwt_header, jwt_data):
+        return not UserService.is_token_current(jwt_data["sub"], jwt_data.get("ver", 0))
 
     # --- JWT User Loading Callback ---
     # This function is called whenever a protected endpoint is accessed,
@@ -68,9 +106,17 @@ def create_app(config_name: Optional[str] = None) -> APIFlask:
         and a valid JWT is present.
         The 'jwt_data' argument contains the payload of the JWT.
         The 'identity' is stored in the 'sub' claim by default.
+
+        Only views marked with ``@requires_current_user`` load the user row;
+        the others get a ``TokenIdentity`` built from the (already verified)
+        token.
         """
         identity = jwt_data["sub"]
 
+        view = app.view_functions.get(request.endpoint)
+        if not getattr(view, "requires_current_user", False):
+            return TokenIdentity(int(identity))
+
         # Use the UserService to find the user by ID based on the identity
         user = UserService.get_user_by_id(identity)
 
@@ -100,6 +146,11 @@ def create_app(config_name: Optional[str] = None) -> APIFlask:
         """Return JSON response for expired tokens."""
         return {"message": "The token has expired.", "error": "token_expired"}, 401
 
+    @jwt.revoked_token_loader
+    def revoked_token_callback(_jwt_header, _jwt_payload):
+        """Return JSON response for revoked tokens."""
+        return {"message": "The token has been revoked.", "error": "token_revoked"}, 401
+
     @jwt.unauthorized_loader
     def unauthorized_callback(callback_options):
         """Return JSON response when no token is present."""
@@ -115,6 +166,9 @@ def create_app(config_name: Optional[str] = None) -> APIFlask:
     # Register error handlers
     register_error_handlers(app)
 
+    # Register CLI commands
+    register_commands(app)
+
     # Shell context for Flask CLI (optional)
     @app.shell_context_processor
     def make_shell_context():
@@ -128,24 +182,9 @@ def create_app(config_name: Optional[str] = None) -> APIFlask:
     @app.route("/", defaults={"path": ""})
     @app.route("/<path:path>")
     def serve_vue_app(path):
-        # Construct the full path to the requested file within the static directory
-        file_path = os.path.join(app.static_folder, path)
-
-        # Check if the requested path exists as an actual file within the static folder
-        # This handles requests for files placed at the static root by Vite build (like manifest.webmanifest)
-        # Flask's default static handler at /static/ handles assets within subdirectories like /static/js/app.js
-        if path != "" and os.path.exists(file_path):
-            # If the file exists in the static directory, serve it directly
-            # send_from_directory is safe and prevents directory traversal
-            return send_from_directory(app.static_folder, path)
-        elif path == "":
-            # Handle the root path specifically by serving index.html
-            return send_from_directory(app.static_folder, "index.html")
-        else:
-            # For any other path that was not an API route, not a /static/ asset,
-            # and not a file explicitly found at the static root,
-            # assume it's a client-side route and serve the index.html fallback.
-            return send_from_directory(app.static_folder, "index.html")
+        # Files of the Vite build are served from memory; any other path is a
+        # client-side route and gets index.html
+        return static_assets.serve(path)
 
     app.logger.info(f"App created with config: {config_name}")
     app.logger.info(f"Database URI: {app.config['SQLALCHEMY_DATABASE_URI']}")
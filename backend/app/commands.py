@@ -0,0 +1,191 @@
+import csv
+import json
+import random
+import time
+
+import click
+from flask import Flask, current_app
+from flask.cli import AppGroup, with_appcontext
+from sqlalchemy import select
+
+from app.extensions import db
+from app.models import User
+from app.services import CycleSummaryService
+from app.services.population_analytics import PopulationAnalytics
+from app.services.seed_service import SeedService
+from app.utils.static_assets import precompress
+
+cycle_summary_cli = AppGroup("cycle-summary", help="Maintain user cycle summaries.")
+analytics_cli = AppGroup("analytics", help="Population-level batch analytics.")
+
+
+@cycle_summary_cli.command("check")
+@click.option("--user-id", type=int, help="Only check this user.")
+@click.option("--fix", is_flag=True, help="Rebuild summaries that are inconsistent.")
+def check_cycle_summaries(user_id: int | None, fix: bool) -> None:
+    """Compare stored summaries with a full recompute of each user's history."""
+    if user_id is not None:
+        user_ids = [user_id]
+    else:
+        user_ids = db.session.execute(select(User.id).order_by(User.id)).scalars()
+
+    checked = inconsistent = 0
+    for uid in user_ids:
+        checked += 1
+        mismatches = CycleSummaryService.check(uid)
+        if not mismatches:
+            continue
+        inconsistent += 1
+        details = ", ".join(
+            f"{field}: {stored!r} != {expected!r}"
+            for field, (stored, expected) in mismatches.items()
+        )
+        click.echo(f"user {uid}: {details}")
+        if fix:
+            CycleSummaryService.rebuild(uid)
+            db.session.commit()
+
+    click.echo(f"Checked {checked} users, {inconsistent} inconsistent.")
+    if inconsistent and not fix:
+        raise SystemExit(1)
+
+
+@analytics_cli.command("population")
+@click.option(
+    "--users-csv",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write per-user statistics to this CSV file.",
+)
+@click.option(
+    "--summary-json",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the population summary to this JSON file.",
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=500_000,
+    show_default=True,
+    help="Periods fetched per batch.",
+)
+def population_analytics(
+    users_csv: str | None, summary_json: str | None, chunk_size: int
+) -> None:
+    """Cycle-length, period-duration and prediction-accuracy distributions."""
+    started = time.perf_counter()
+    try:
+        analytics = PopulationAnalytics()
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from e
+
+    on_users = None
+    users_file = open(users_csv, "w", newline="") if users_csv else None
+    try:
+        if users_file is not None:
+            writer = csv.writer(users_file)
+            header_written = False
+
+            def on_users(columns: dict) -> None:
+                nonlocal header_written
+                if not header_written:
+                    writer.writerow(columns)
+                    header_written = True
+                writer.writerows(zip(*(column.tolist() for column in columns.values())))
+
+        summary = analytics.run(chunk_size=chunk_size, on_users=on_users)
+    finally:
+        if users_file is not None:
+            users_file.close()
+
+    rendered = json.dumps(summary, indent=2)
+    if summary_json:
+        with open(summary_json, "w") as f:
+            f.write(rendered + "\n")
+    else:
+        click.echo(rendered)
+    click.echo(
+        f"Processed {summary['periods']} periods of {summary['users']} users "
+        f"in {time.perf_counter() - started:.1f}s.",
+        err=True,
+    )
+
+
+@click.command("seed")
+@click.option("--users", "user_count", type=int, required=True, help="Users to add.")
+@click.option(
+    "--periods-per-user",
+    type=int,
+    default=12,
+    show_default=True,
+    help="History length.",
+)
+@click.option(
+    "--password",
+    default="password",
+    show_default=True,
+    help="Password of every seeded user (hashed once).",
+)
+@click.option("--prefix", default="seed", show_default=True, help="Username prefix.")
+@click.option("--random-seed", type=int, help="Seed for reproducible data.")
+@click.option(
+    "--batch-size",
+    type=int,
+    default=50_000,
+    show_default=True,
+    help="Periods inserted per batch (one commit each).",
+)
+@with_appcontext
+def seed(
+    user_count: int,
+    periods_per_user: int,
+    password: str,
+    prefix: str,
+    random_seed: int | None,
+    batch_size: int,
+) -> None:
+    """Bulk-insert synthetic users and period histories for load testing."""
+    started = time.perf_counter()
+    users, periods = SeedService.seed(
+        user_count,
+        periods_per_user,
+        password=password,
+        prefix=prefix,
+        rng=random.Random(random_seed),
+        batch_size=batch_size,
+    )
+    click.echo(
+        f"Seeded {users} users and {periods} periods "
+        f"in {time.perf_counter() - started:.1f}s."
+    )
+
+
+@click.command("compress-static")
+@click.option(
+    "--directory",
+    type=click.Path(exists=True, file_okay=False),
+    help="Defaults to the app's static folder.",
+)
+@click.option(
+    "--min-size",
+    type=int,
+    default=1024,
+    show_default=True,
+    help="Smaller files are left uncompressed.",
+)
+@with_appcontext
+def compress_static(directory: str | None, min_size: int) -> None:
+    """Write .br and .gz variants of the built frontend (run at build time)."""
+    directory = directory or current_app.static_folder
+    files = saved = 0
+    for _path, saving in precompress(directory, min_size=min_size):
+        files += 1
+        saved += saving
+    click.echo(f"Compressed {files} files, saving {saved / 1024:.0f} KiB.")
+
+
+def register_commands(app: Flask) -> None:
+    """Registers custom CLI commands with the Flask app."""
+    app.cli.add_command(cycle_summary_cli)
+    app.cli.add_command(analytics_cli)
+    app.cli.add_command(seed)
+    app.cli.add_command(compress_static)
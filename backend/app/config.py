@@ -50,6 +50,130 @@ class Config:
 
         SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path.resolve()}"
 
+    # SQLite pragmas set on every connection (unset ones keep SQLite's
+    # defaults). WAL lets readers run while a writer commits, and with
+    # synchronous=NORMAL a commit only syncs at checkpoints (a power loss can
+    # lose the last commits, never corrupt the file). SQLITE_BUSY_TIMEOUT is
+    # how long, in ms, a writer waits for the lock before "database is
+    # locked"; a negative SQLITE_CACHE_SIZE is in KiB.
+    SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get("SQLITE_BUSY_TIMEOUT", 5000))
+    SQLITE_CACHE_SIZE = int(os.environ.get("SQLITE_CACHE_SIZE", -65536))
+    SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+    SQLITE_TEMP_STORE = os.environ.get("SQLITE_TEMP_STORE", "MEMORY")
+    SQLITE_FOREIGN_KEYS = os.environ.get("SQLITE_FOREIGN_KEYS", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Connection pool, per process: "queue" holds up to DB_POOL_SIZE open
+    # connections and opens up to DB_MAX_OVERFLOW more under load, waiting
+    # DB_POOL_TIMEOUT seconds for one before answering 503; "null" opens a
+    # connection per checkout, for running behind PgBouncer in transaction
+    # pooling mode. Connections older than DB_POOL_RECYCLE seconds are
+    # replaced (-1: never) and DB_POOL_PRE_PING tests each one on checkout.
+    # A process uses at most one connection per concurrent request (one per
+    # sync worker, GUNICORN_THREADS per gthread worker), and pods x workers x
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW) must stay under the server's
+    # max_connections.
+    DB_POOL_MODE = os.environ.get("DB_POOL_MODE", "queue").lower()
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    DB_POOL_RETRY_AFTER = int(os.environ.get("DB_POOL_RETRY_AFTER", 1))
+
+    # Report cache: "memory" (per-process LRU), "redis" (shared) or "null".
+    # Off unless a Redis URL is given: with several workers, a per-process
+    # cache serves stale reports from workers that did not see the write
+    REPORT_CACHE_REDIS_URL = os.environ.get("REPORT_CACHE_REDIS_URL")
+    REPORT_CACHE_BACKEND = os.environ.get(
+        "REPORT_CACHE_BACKEND", "redis" if REPORT_CACHE_REDIS_URL else "null"
+    ).lower()
+    REPORT_CACHE_TTL = int(os.environ.get("REPORT_CACHE_TTL", 300))
+    REPORT_CACHE_MAXSIZE = int(os.environ.get("REPORT_CACHE_MAXSIZE", 10000))
+
+    # Public user count (/reports/general): cached for USER_COUNT_CACHE_TTL
+    # seconds in the report cache backend; "approximate" reads PostgreSQL's
+    # planner estimate instead of counting rows
+    USER_COUNT_MODE = os.environ.get("USER_COUNT_MODE", "exact").lower()
+    USER_COUNT_CACHE_TTL = int(os.environ.get("USER_COUNT_CACHE_TTL", 60))
+
+    # Token version cache checked on every authenticated request; the TTL is
+    # how long a revocation can take to reach other workers ("memory" backend)
+    USER_CACHE_BACKEND = os.environ.get("USER_CACHE_BACKEND", "memory").lower()
+    USER_CACHE_TTL = int(os.environ.get("USER_CACHE_TTL", 30))
+    USER_CACHE_MAXSIZE = int(os.environ.get("USER_CACHE_MAXSIZE", 10000))
+    USER_CACHE_REDIS_URL = os.environ.get(
+        "USER_CACHE_REDIS_URL", REPORT_CACHE_REDIS_URL
+    )
+
+    # Password hashing: any werkzeug method ("scrypt", "pbkdf2:sha256:600000",
+    # ...). Stored hashes made with other parameters are upgraded on login.
+    # Hashing runs on a per-worker process pool of PASSWORD_HASH_WORKERS
+    # processes (0 = inline); beyond PASSWORD_HASH_MAX_PENDING queued
+    # operations, requests get a 503 with Retry-After. Only workers serving
+    # several requests at once (gthread, gevent) can queue more than one.
+    PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt")
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 1))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get("PASSWORD_HASH_MAX_PENDING", 8))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get("PASSWORD_HASH_TIMEOUT", 10))
+    PASSWORD_HASH_RETRY_AFTER = int(os.environ.get("PASSWORD_HASH_RETRY_AFTER", 2))
+
+    # Cycle length predictor behind predictions, ovulation and cycle context:
+    # "mean" (all cycles), "ewma" (exponentially weighted, CYCLE_PREDICTOR_ALPHA)
+    # or "rolling" (last CYCLE_PREDICTOR_WINDOW cycles without the
+    # CYCLE_PREDICTOR_TRIM shortest and longest). Summaries built with another
+    # setting are replayed lazily on next read.
+    CYCLE_PREDICTOR = os.environ.get("CYCLE_PREDICTOR", "mean").lower()
+    CYCLE_PREDICTOR_ALPHA = float(os.environ.get("CYCLE_PREDICTOR_ALPHA", 0.3))
+    CYCLE_PREDICTOR_WINDOW = int(os.environ.get("CYCLE_PREDICTOR_WINDOW", 6))
+    CYCLE_PREDICTOR_TRIM = int(os.environ.get("CYCLE_PREDICTOR_TRIM", 1))
+
+    # Per-request SQL query count and timing: a Server-Timing header and a
+    # JSON access-log line ("app.access" logger) per request; requests taking
+    # REQUEST_SLOW_THRESHOLD_MS or more also log their SQL statements
+    REQUEST_TIMING_ENABLED = os.environ.get(
+        "REQUEST_TIMING_ENABLED", "false"
+    ).lower() in ("1", "true", "yes")
+    REQUEST_SLOW_THRESHOLD_MS = float(os.environ.get("REQUEST_SLOW_THRESHOLD_MS", 500))
+
+    # Prometheus metrics at METRICS_PATH; set PROMETHEUS_MULTIPROC_DIR in the
+    # environment to aggregate across gunicorn workers (see gunicorn.conf.py)
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() != "false"
+    METRICS_PATH = os.environ.get("METRICS_PATH", "/metrics")
+
+    # Negotiated gzip/brotli compression of API responses of these types
+    # (streamed exports included) from COMPRESSION_MIN_SIZE bytes up
+    COMPRESSION_ENABLED = (
+        os.environ.get("COMPRESSION_ENABLED", "true").lower() != "false"
+    )
+    COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.environ.get("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BR_QUALITY = int(os.environ.get("COMPRESSION_BR_QUALITY", 4))
+    COMPRESSION_MIMETYPES = tuple(
+        os.environ.get(
+            "COMPRESSION_MIMETYPES",
+            "application/json,application/x-ndjson,text/csv,text/plain",
+        ).split(",")
+    )
+
+    # Built frontend, held in memory: files other than Vite's fingerprinted
+    # bundles are cached for STATIC_MAX_AGE seconds (0: revalidated each time
+    # against their ETag); files over STATIC_MEMORY_MAX_FILE_SIZE bytes are
+    # sent from disk
+    STATIC_MAX_AGE = int(os.environ.get("STATIC_MAX_AGE", 0))
+    STATIC_MEMORY_MAX_FILE_SIZE = int(
+        os.environ.get("STATIC_MEMORY_MAX_FILE_SIZE", 1024 * 1024)
+    )
+
     # Add other configurations as needed
     PROPAGATE_EXCEPTIONS = True  # Let Flask-JWT-Extended handle its errors
 
@@ -59,6 +183,7 @@ class DevelopmentConfig(Config):
 
     DEBUG = True
     FLASK_ENV = "development"
+    REQUEST_TIMING_ENABLED = True
 
 
 class TestingConfig(Config):
@@ -71,6 +196,13 @@ class TestingConfig(Config):
     JWT_SECRET_KEY = "test-jwt-secret"
     SECRET_KEY = "test-secret-key"
     WTF_CSRF_ENABLED = False  # Disable CSRF for testing forms if needed
+    # Tests write users and periods directly through the models, bypassing
+    # invalidation
+    REPORT_CACHE_BACKEND = "null"
+    USER_CACHE_BACKEND = "null"
+    # Cheap, inline hashing keeps the suite fast
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    PASSWORD_HASH_WORKERS = 0
 
 
 class ProductionConfig(Config):
@@ -1,7 +1,8 @@
 from flask import Flask, jsonify, request
 from marshmallow import ValidationError as MarshmallowValidationError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
-from app.utils.exceptions import BaseAppException
+from app.utils.exceptions import BaseAppException, ServiceUnavailableError
 from app.utils.exceptions import ValidationError as CustomValidationError
 
 from .auth_controller import auth_bp
@@ -35,6 +36,22 @@ def register_error_handlers(app: Flask) -> None:
         custom_error = CustomValidationError(payload=error.messages)
         return jsonify(custom_error.to_dict()), custom_error.status_code
 
+    @app.errorhandler(ServiceUnavailableError)
+    def handle_service_unavailable(error: ServiceUnavailableError):
+        """Handles saturation errors, telling clients when to retry."""
+        app.logger.warning(f"Service Unavailable: {error.args[0]}")
+        return jsonify(error.to_dict()), error.status_code, error.headers
+
+    @app.errorhandler(PoolTimeoutError)
+    def handle_pool_timeout(error: PoolTimeoutError):
+        """Handles connection pool exhaustion like other saturation errors."""
+        return handle_service_unavailable(
+            ServiceUnavailableError(
+                "No database connection available.",
+                retry_after=app.config.get("DB_POOL_RETRY_AFTER", 1),
+            )
+        )
+
     @app.errorhandler(BaseAppException)
     def handle_app_exception(error: BaseAppException):
         """Handles custom application exceptions."""
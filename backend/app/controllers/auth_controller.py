@@ -4,7 +4,12 @@ from flask_jwt_extended import get_jwt_identity, jwt_required
 from app.schemas import LoginSchema, TokenSchema, UserRegistrationSchema, UserSchema
 from app.schemas.auth import AccessTokenSchema
 from app.services import AuthService
-from app.utils.exceptions import AuthenticationError, RegistrationError, ValidationError
+from app.utils.exceptions import (
+    AuthenticationError,
+    RegistrationError,
+    ServiceUnavailableError,
+    ValidationError,
+)
 
 auth_bp = APIBlueprint("auth", __name__, url_prefix="/auth")
 
@@ -22,6 +27,7 @@ def register(validated_data: dict):
         201: User created successfully. Returns user data (excluding password).
         400: Invalid input data (e.g., username taken, email taken, passwords don't match).
         422: Validation error (from decorator).
+        503: Too many password operations in progress; retry later.
     """
     try:
         # Pass validated data directly to the service
@@ -31,6 +37,10 @@ def register(validated_data: dict):
     except ValidationError as e:
         # This handles validation errors caught *before* the service call if any
         return abort(e.status_code, message=str(e), detail={"error": str(e)})
+    except ServiceUnavailableError as e:
+        return abort(
+            e.status_code, message=str(e), detail={"error": str(e)}, headers=e.headers
+        )
 
 
 @auth_bp.route("/login", methods=["POST"])
@@ -46,6 +56,7 @@ def login(validated_data: dict):
         200: Login successful. Returns access token.
         401: Invalid credentials.
         422: Validation error (from decorator).
+        503: Too many logins in progress; retry after the Retry-After delay.
     """
     try:
         return AuthService.login_user(validated_data)
@@ -53,6 +64,10 @@ def login(validated_data: dict):
         return abort(e.status_code, message=str(e), detail={"error": str(e)})
     except ValidationError as e:
         return abort(e.status_code, message=str(e), detail={"error": str(e)})
+    except ServiceUnavailableError as e:
+        return abort(
+            e.status_code, message=str(e), detail={"error": str(e)}, headers=e.headers
+        )
 
 
 @auth_bp.route("/refresh", methods=["POST"])
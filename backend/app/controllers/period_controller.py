@@ -1,13 +1,26 @@
+import csv
+import io
+import json
+
 from apiflask import APIBlueprint, EmptySchema, abort
-from flask import jsonify, request
+from flask import Response, jsonify, request, stream_with_context
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
-from app.schemas import PeriodCreateSchema, PeriodSchema, PeriodUpdateSchema
-from app.services import PeriodService
+from app.schemas import (
+    PeriodCreateSchema,
+    PeriodImportResultSchema,
+    PeriodSchema,
+    PeriodUpdateSchema,
+)
+from app.services import PeriodService, ReportService
+from app.utils.decorators import conditional_on_data_version
 from app.utils.exceptions import NotFoundError, PeriodLogicError, ValidationError
 
 period_bp = APIBlueprint("periods", __name__, url_prefix="/periods")
 
+EXPORT_MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_COLUMNS = ("id", "start_date", "end_date", "duration", "created_at")
+
 
 @period_bp.route("", methods=["POST"])
 @period_bp.input(PeriodCreateSchema, arg_name="validated_data")
@@ -36,6 +49,46 @@ def create_period(validated_data: dict):
         return abort(e.status_code, message=str(e), detail={"error": str(e)})
 
 
+@period_bp.route("/bulk", methods=["POST"])
+@period_bp.output(PeriodImportResultSchema, 201)
+@period_bp.doc(security="bearerAuth")
+@jwt_required()
+def import_periods():
+    """
+    Import many periods at once for the logged-in user.
+    ---
+    Security: JWT Bearer Token required.
+    Body:
+        application/json: an array of {start_date, end_date} objects
+            (end_date optional, YYYY-MM-DD).
+        multipart/form-data: a CSV file in the 'file' field.
+        text/csv: CSV content.
+        CSV content needs a header row with start_date and end_date columns.
+    Responses:
+        201: All periods imported. Returns the number of imported periods.
+        400: Database error during import.
+        401: Unauthorized.
+        422: Invalid payload, or invalid/overlapping rows. Nothing is
+             imported; per-row errors are listed in detail.messages.rows.
+    """
+    user_id = get_jwt_identity()
+    try:
+        upload = request.files.get("file")
+        if upload is not None:
+            records = PeriodService.read_import_csv(upload.read())
+        elif request.mimetype == "text/csv":
+            records = PeriodService.read_import_csv(request.get_data())
+        else:
+            records = request.get_json(silent=True)
+            if not isinstance(records, list):
+                raise ValidationError(
+                    "Expected a JSON array of periods or a CSV upload."
+                )
+        return {"imported": PeriodService.import_periods(user_id, records)}
+    except (PeriodLogicError, ValidationError) as e:
+        return abort(e.status_code, message=str(e), detail=e.to_dict())
+
+
 @period_bp.route("/<int:period_id>", methods=["PUT"])
 @period_bp.input(PeriodUpdateSchema, arg_name="validated_data")
 @period_bp.output(PeriodSchema)
@@ -73,29 +126,122 @@ def update_period(validated_data: dict, period_id: int):
 @period_bp.output(PeriodSchema(many=True))
 @period_bp.doc(security="bearerAuth")
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_periods():
     """
     Get a list of all periods for the logged-in user.
-    Supports pagination via query parameters 'page' and 'per_page'.
+    Supports offset pagination via 'page' and 'per_page', or cursor
+    pagination via 'cursor' and 'limit'.
     ---
     Security: JWT Bearer Token required.
     Query Parameters:
         page (int, optional): Page number (default: 1).
         per_page (int, optional): Items per page (default: 10).
+        cursor (str, optional): Opaque cursor from a previous X-Next-Cursor header.
+        limit (int, optional): Items per page in cursor mode (default: 10, max: 100).
     Responses:
-        200: List of periods returned successfully.
+        200: List of periods returned successfully. In cursor mode the
+             X-Next-Cursor header holds the cursor of the next page, and is
+             absent on the last page.
         401: Unauthorized.
+        422: Invalid cursor.
     """
     user_id = get_jwt_identity()
+    if "cursor" in request.args or "limit" in request.args:
+        try:
+            periods, next_cursor = PeriodService.get_periods_page_for_user(
+                user_id,
+                cursor=request.args.get("cursor"),
+                limit=request.args.get("limit", 10, type=int),
+            )
+        except ValidationError as e:
+            return abort(e.status_code, message=str(e), detail={"error": str(e)})
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        return periods, 200, headers
+
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
     return PeriodService.get_all_periods_for_user(user_id, page=page, per_page=per_page)
 
 
+@period_bp.route("/export", methods=["GET"])
+@period_bp.doc(security="bearerAuth")
+@jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
+def export_periods():
+    """
+    Export the logged-in user's full period history as a stream.
+    ---
+    Security: JWT Bearer Token required.
+    Query Parameters:
+        format (str, optional): 'ndjson' (default) or 'csv'.
+    Responses:
+        200: Periods streamed oldest first, one per line.
+        400: Unsupported format.
+        401: Unauthorized.
+    """
+    user_id = get_jwt_identity()
+    export_format = request.args.get("format", "ndjson").lower()
+    if export_format not in EXPORT_MIMETYPES:
+        return abort(
+            400,
+            message=f"Unsupported export format '{export_format}'.",
+            detail={"error": "format must be one of: ndjson, csv"},
+        )
+
+    batches = PeriodService.iter_periods_for_export(user_id)
+    if export_format == "csv":
+        body = _export_csv(batches)
+    else:
+        body = _export_ndjson(batches)
+    return Response(
+        stream_with_context(body),
+        mimetype=EXPORT_MIMETYPES[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename=periods.{export_format}"
+        },
+    )
+
+
+def _export_values(row) -> tuple:
+    """Serialises an export row to the PeriodSchema representation."""
+    period_id, start_date, end_date, created_at = row
+    return (
+        period_id,
+        start_date.isoformat(),
+        end_date.isoformat() if end_date else None,
+        (end_date - start_date).days + 1 if end_date else None,
+        created_at.isoformat() if created_at else None,
+    )
+
+
+def _export_ndjson(batches):
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, _export_values(row)))) + "\n"
+            for row in batch
+        )
+
+
+def _export_csv(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in batches:
+        writer.writerows(_export_values(row) for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header only, for an empty history
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
 @period_bp.route("/<int:period_id>", methods=["GET"])
 @period_bp.output(PeriodSchema)
 @period_bp.doc(security="bearerAuth")
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_period(period_id: int):
     """
     Get details of a specific period for the logged-in user.
@@ -123,6 +269,7 @@ def get_period(period_id: int):
 @period_bp.output(PeriodSchema)
 @period_bp.doc(security="bearerAuth")
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_active_period():
     """
     Get last active period for the logged-in user.
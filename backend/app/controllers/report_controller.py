@@ -1,14 +1,16 @@
-from apiflask import APIBlueprint
+from apiflask import APIBlueprint, abort
+from flask import current_app, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
-from app.models import User
 from app.schemas import CycleStatsSchema, PeriodStatsSchema
 from app.schemas.report import (
     CycleContextSchema,
+    DashboardSchema,
     OvulationWindowSchema,
     PredictionSchema,
 )
 from app.services import ReportService
+from app.utils.decorators import conditional_on_data_version
 
 report_bp = APIBlueprint("reports", __name__, url_prefix="/reports")
 
@@ -16,6 +18,7 @@ report_bp = APIBlueprint("reports", __name__, url_prefix="/reports")
 @report_bp.route("/period-stats", methods=["GET"])
 @report_bp.output(PeriodStatsSchema)
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_period_statistics():
     """
     Get statistics about the logged-in user's period durations.
@@ -33,6 +36,7 @@ def get_period_statistics():
 @report_bp.route("/cycle-stats", methods=["GET"])
 @report_bp.output(CycleStatsSchema)
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_cycle_statistics():
     """
     Get statistics about the logged-in user's cycle lengths.
@@ -50,6 +54,7 @@ def get_cycle_statistics():
 @report_bp.route("/predicted-next-period", methods=["GET"])
 @report_bp.output(PredictionSchema)
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_predicted_next_period():
     """
     Predict the user's next period start date using average cycle length.
@@ -64,6 +69,7 @@ def get_predicted_next_period():
 @report_bp.route("/ovulation-window", methods=["GET"])
 @report_bp.output(OvulationWindowSchema)
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version)
 def get_ovulation_window():
     """
     Estimate ovulation date and fertile window based on predicted next period.
@@ -78,6 +84,7 @@ def get_ovulation_window():
 @report_bp.route("/cycle-context", methods=["GET"])
 @report_bp.output(CycleContextSchema)
 @jwt_required()
+@conditional_on_data_version(ReportService.get_data_version, date_sensitive=True)
 def get_cycle_context():
     """
     Provide a comprehensive snapshot of the user's current cycle context.
@@ -90,6 +97,57 @@ def get_cycle_context():
     return context
 
 
+@report_bp.route("/dashboard", methods=["GET"])
+@report_bp.output(DashboardSchema)
+@jwt_required()
+def get_dashboard():
+    """
+    Everything the dashboard shows, in one response.
+    Bundles /users/me, /periods/active and the cycle-context, cycle-stats,
+    period-stats, predicted-next-period and ovulation-window reports,
+    computed from a single read of the user's data.
+    ---
+    Security: JWT Bearer Token required.
+    Query Parameters:
+        include (str, optional): Comma-separated sections to return
+            (user, active_period, cycle_context, cycle_stats, period_stats,
+            predicted_next_period, ovulation_window). Defaults to all.
+    Responses:
+        200: The requested sections, keyed by name.
+        400: Unknown section in include.
+        401: Unauthorized.
+    """
+    user_id = get_jwt_identity()
+    include = ReportService.DASHBOARD_SECTIONS
+    if "include" in request.args:
+        include = [s.strip() for s in request.args["include"].split(",") if s.strip()]
+        unknown = sorted(set(include) - set(ReportService.DASHBOARD_SECTIONS))
+        if unknown:
+            return abort(
+                400,
+                message=f"Unknown dashboard sections: {', '.join(unknown)}.",
+                detail={
+                    "error": "include must list sections from: "
+                    + ", ".join(ReportService.DASHBOARD_SECTIONS)
+                },
+            )
+    return ReportService.get_dashboard(user_id, include)
+
+
 @report_bp.route("/general", methods=["GET"])
 def get_app_stats():
-    return {"number_of_users": User.query.count()}
+    """
+    Public application statistics (number of registered users).
+    ---
+    The count is cached server-side and the response may be cached by
+    clients and proxies for ``USER_COUNT_CACHE_TTL`` seconds.
+    Responses:
+        200: Statistics returned successfully.
+        304: Unchanged since the ETag sent in If-None-Match.
+    """
+    count = ReportService.get_user_count()
+    response = jsonify({"number_of_users": count})
+    response.set_etag(f"users-{count}")
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get("USER_COUNT_CACHE_TTL")
+    return response.make_conditional(request)
@@ -4,6 +4,8 @@ from flask_jwt_extended import current_user, jwt_required
 from app.schemas import UserSchema
 from app.schemas.user import ChangePasswordSchema, UserUpdateSchema
 from app.services import UserService
+from app.utils.decorators import requires_current_user
+from app.utils.exceptions import ServiceUnavailableError
 
 users_bp = APIBlueprint("users", __name__, url_prefix="/users")
 
@@ -11,6 +13,7 @@ users_bp = APIBlueprint("users", __name__, url_prefix="/users")
 @users_bp.route("/me")
 @users_bp.output(UserSchema)
 @jwt_required()
+@requires_current_user
 def get_own_user():
     return current_user
 
@@ -19,6 +22,7 @@ def get_own_user():
 @users_bp.input(UserUpdateSchema)
 @users_bp.output(UserSchema)
 @jwt_required()
+@requires_current_user
 def patch_own_user(json_data: dict):
     user = None
     if "username" in json_data:
@@ -33,6 +37,7 @@ def patch_own_user(json_data: dict):
 @users_bp.route("/me", methods=["DELETE"])
 @users_bp.output(EmptySchema, 204)
 @jwt_required()
+@requires_current_user
 def delete_own_user():
     return UserService.delete_user(current_user)
 
@@ -41,12 +46,18 @@ def delete_own_user():
 @users_bp.input(ChangePasswordSchema, arg_name="data")
 @users_bp.output(EmptySchema, 200)
 @jwt_required()
+@requires_current_user
 def change_own_password(data):
-    if not current_user.check_password(data["current_password"]):
+    try:
+        if not current_user.check_password(data["current_password"]):
+            abort(
+                400,
+                message="Current password does not match",
+                detail={"error": "password error"},
+            )
+        UserService.update_password(current_user, data["new_password"])
+    except ServiceUnavailableError as e:
         abort(
-            400,
-            message="Current password does not match",
-            detail={"error": "password error"},
+            e.status_code, message=str(e), detail={"error": str(e)}, headers=e.headers
         )
-    UserService.update_password(current_user, data["new_password"])
     return
@@ -3,7 +3,23 @@ from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
+from app.utils.cache import ReportCache, TokenVersionCache
+from app.utils.compression import ResponseCompression
+from app.utils.hashing import PasswordHasher
+from app.utils.instrumentation import RequestInstrumentation
+from app.utils.metrics import Metrics
+from app.utils.static_assets import StaticAssets
+
+# Engine and pool options come from the DB_POOL_* settings (see
+# app.utils.pooling.engine_options, applied in create_app)
 db = SQLAlchemy()
 ma = Marshmallow()
 migrate = Migrate()
 jwt = JWTManager()
+report_cache = ReportCache()
+token_versions = TokenVersionCache()
+password_hasher = PasswordHasher()
+request_instrumentation = RequestInstrumentation()
+metrics = Metrics()
+static_assets = StaticAssets()
+compression = ResponseCompression()
@@ -1,4 +1,5 @@
+from .cycle_summary import UserCycleSummary
 from .period import Period
 from .user import User
 
-__all__ = ["User", "Period"]
+__all__ = ["User", "Period", "UserCycleSummary"]
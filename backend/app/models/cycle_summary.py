@@ -0,0 +1,51 @@
+from sqlalchemy import Date
+
+from app.extensions import db
+
+
+class UserCycleSummary(db.Model):
+    """
+    Incrementally maintained aggregates of a user's period history.
+
+    One row per user, updated in the same transaction as every period write
+    so that statistics are primary-key reads instead of history scans.
+    """
+
+    __tablename__ = "user_cycle_summary"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+
+    period_count = db.Column(db.Integer, nullable=False, default=0)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+
+    # Durations of completed periods, in days (inclusive)
+    duration_sum = db.Column(db.Integer, nullable=False, default=0)
+    duration_sq_sum = db.Column(db.BigInteger, nullable=False, default=0)
+    duration_min = db.Column(db.Integer, nullable=True)
+    duration_max = db.Column(db.Integer, nullable=True)
+
+    # Cycle lengths (start to next start), in days
+    cycle_count = db.Column(db.Integer, nullable=False, default=0)
+    cycle_sum = db.Column(db.Integer, nullable=False, default=0)
+    cycle_sq_sum = db.Column(db.BigInteger, nullable=False, default=0)
+    cycle_min = db.Column(db.Integer, nullable=True)
+    cycle_max = db.Column(db.Integer, nullable=True)
+
+    last_start_date = db.Column(Date, nullable=True)
+    active_period_id = db.Column(db.Integer, nullable=True)
+    active_start_date = db.Column(Date, nullable=True)
+
+    # Cycle predictor key (e.g. "ewma:0.3") and its constant-size state
+    predictor = db.Column(db.String(32), nullable=True)
+    predictor_state = db.Column(db.JSON, nullable=True)
+
+    # Bumped on every update; identifies the state of the user's period data
+    # for conditional GETs (ETags)
+    data_version = db.Column(
+        db.BigInteger, nullable=False, default=0, server_default="0"
+    )
+
+    user = db.relationship("User", back_populates="cycle_summary")
+
+    def __repr__(self) -> str:
+        return f"<UserCycleSummary user={self.user_id} periods={self.period_count}>"
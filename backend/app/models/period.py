@@ -1,7 +1,7 @@
 import datetime
 from typing import Optional
 
-from sqlalchemy import Date  # Use SQLAlchemy's Date type
+from sqlalchemy import Date, text
 
 from app.extensions import db
 from app.models.base import BaseModel
@@ -11,6 +11,19 @@ class Period(BaseModel):
     """Period model for tracking menstrual cycles."""
 
     __tablename__ = "periods"
+    __table_args__ = (
+        # Per-user history ordered by start date (reports, listings)
+        db.Index("ix_periods_user_id_start_date", "user_id", "start_date"),
+        # Ownership-checked lookups by id
+        db.Index("ix_periods_user_id_id", "user_id", "id"),
+        # Only ongoing periods are indexed, so the "active period" probe stays tiny
+        db.Index(
+            "ix_periods_user_id_active",
+            "user_id",
+            postgresql_where=text("end_date IS NULL"),
+            sqlite_where=text("end_date IS NULL"),
+        ),
+    )
 
     start_date = db.Column(Date, nullable=False)
     end_date = db.Column(Date, nullable=True)  # Can be null if period is ongoing
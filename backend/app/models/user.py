@@ -1,9 +1,8 @@
 from typing import Optional
 
-from sqlalchemy import func
-from werkzeug.security import check_password_hash, generate_password_hash
+from sqlalchemy import case, func, or_
 
-from app.extensions import db
+from app.extensions import db, password_hasher
 from app.models.base import BaseModel
 
 
@@ -15,21 +14,38 @@ class User(BaseModel):
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(256), nullable=False)  # Increased length
+    # Carried in the "ver" claim; bumping it revokes every issued token
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # Case-insensitive uniqueness; also serves lower(username) lookups
+        db.Index("uq_users_username_lower", func.lower(username), unique=True),
+    )
 
     # Relationship to periods (one-to-many)
     periods = db.relationship(
         "Period", back_populates="user", lazy=True, cascade="all, delete-orphan"
     )
+    cycle_summary = db.relationship(
+        "UserCycleSummary",
+        back_populates="user",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
 
     def set_password(self, password: str) -> None:
         """Hashes and sets the user's password."""
         if not password:
             raise ValueError("Password cannot be empty.")
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
         """Checks if the provided password matches the stored hash."""
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+
+    def password_needs_rehash(self) -> bool:
+        """Checks if the stored hash predates the configured hash method."""
+        return password_hasher.needs_rehash(self.password_hash)
 
     @classmethod
     def find_by_username(cls, username: str) -> Optional["User"]:
@@ -41,5 +57,22 @@ class User(BaseModel):
         """Finds a user by their email address."""
         return cls.query.filter_by(email=email).first()
 
+    @classmethod
+    def find_by_login(cls, login: str) -> Optional["User"]:
+        """
+        Finds a user by email or (case-insensitive) username in one query.
+
+        Both branches of the OR are indexed; an email match wins if the
+        login matches one user's email and another's username.
+        """
+        email_match = User.email == login
+        return (
+            cls.query.filter(
+                or_(email_match, func.lower(User.username) == login.lower())
+            )
+            .order_by(case((email_match, 0), else_=1))
+            .first()
+        )
+
     def __repr__(self) -> str:
         return f"<User {self.username}>"
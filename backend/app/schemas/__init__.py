@@ -1,7 +1,13 @@
 from apiflask import Schema, fields
 
 from .auth import LoginSchema, TokenSchema, UserRegistrationSchema
-from .period import PeriodCreateSchema, PeriodSchema, PeriodUpdateSchema
+from .period import (
+    PeriodCreateSchema,
+    PeriodImportResultSchema,
+    PeriodImportRowSchema,
+    PeriodSchema,
+    PeriodUpdateSchema,
+)
 from .report import CycleStatsSchema, PeriodStatsSchema
 from .user import UserSchema
 
@@ -13,6 +19,8 @@ __all__ = [
     "PeriodSchema",
     "PeriodCreateSchema",
     "PeriodUpdateSchema",
+    "PeriodImportRowSchema",
+    "PeriodImportResultSchema",
     "PeriodStatsSchema",
     "CycleStatsSchema",
     "ErrorSchema",
@@ -35,6 +35,29 @@ class PeriodCreateSchema(Schema):
     start_date = fields.Date(required=True)
 
 
+class PeriodImportRowSchema(Schema):
+    """Schema for one row of a bulk period import."""
+
+    start_date = fields.Date(required=True)
+    end_date = fields.Date(required=False, allow_none=True)
+
+    @validates_schema
+    def validate_dates(self, data, **kwargs):
+        """Ensure end_date is not before start_date."""
+        start = data.get("start_date")
+        end = data.get("end_date")
+        if start and end and end < start:
+            raise ValidationError(
+                "End date cannot be before start date.", field_name="end_date"
+            )
+
+
+class PeriodImportResultSchema(Schema):
+    """Schema for the result of a bulk period import."""
+
+    imported = fields.Integer(required=True)
+
+
 class PeriodUpdateSchema(Schema):
     """Schema specifically for updating a period (only end_date)."""
 
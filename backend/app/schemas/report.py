@@ -1,5 +1,8 @@
 from apiflask import Schema, fields
 
+from .period import PeriodSchema
+from .user import UserSchema
+
 
 class PeriodStatsSchema(Schema):
     """Schema for period statistics report."""
@@ -63,3 +66,15 @@ class OvulationWindowSchema(Schema):
     ovulation_date = fields.Date(required=True)
     fertile_window_start = fields.Date(required=True)
     fertile_window_end = fields.Date(required=True)
+
+
+class DashboardSchema(Schema):
+    """Bundle of the dashboard's data; sections not requested are omitted."""
+
+    user = fields.Nested(UserSchema, allow_none=True)
+    active_period = fields.Nested(PeriodSchema, allow_none=True)
+    cycle_context = fields.Nested(CycleContextSchema)
+    cycle_stats = fields.Nested(CycleStatsSchema)
+    period_stats = fields.Nested(PeriodStatsSchema)
+    predicted_next_period = fields.Nested(PredictionSchema)
+    ovulation_window = fields.Nested(OvulationWindowSchema)
@@ -1,6 +1,15 @@
 from .auth_service import AuthService
+from .cycle_snapshot import CycleSnapshot
+from .cycle_summary_service import CycleSummaryService
 from .period_service import PeriodService
 from .report_service import ReportService
 from .user_service import UserService
 
-__all__ = ["AuthService", "PeriodService", "ReportService", "UserService"]
+__all__ = [
+    "AuthService",
+    "CycleSnapshot",
+    "CycleSummaryService",
+    "PeriodService",
+    "ReportService",
+    "UserService",
+]
@@ -2,12 +2,24 @@ from typing import Any, Dict, Optional
 
 from flask_jwt_extended import create_access_token, create_refresh_token
 
-from app.extensions import db
+from app.extensions import db, report_cache
 from app.models import User
 from app.services.user_service import UserService
 from app.utils.exceptions import AuthenticationError, RegistrationError
 
 
+class TokenIdentity:
+    """Stand-in for ``current_user`` on views that only need the token identity."""
+
+    __slots__ = ("id",)
+
+    def __init__(self, user_id: int):
+        self.id = user_id
+
+    def __repr__(self) -> str:
+        return f"<TokenIdentity {self.id}>"
+
+
 class AuthService:
     """Service layer for authentication logic."""
 
@@ -29,7 +41,7 @@ class AuthService:
         new_user.set_password(password)
 
         try:
-            return new_user.save()
+            new_user.save()
         except Exception as e:
             db.session.rollback()
             # Log the exception e
@@ -37,6 +49,9 @@ class AuthService:
                 "Could not register user due to a database error."
             ) from e
 
+        report_cache.invalidate_user_count()
+        return new_user
+
     @staticmethod
     def login_user(login_data: Dict[str, Any]) -> dict[str, str]:
         """Logs in a user and returns an access token."""
@@ -46,10 +61,19 @@ class AuthService:
         user = UserService.get_user_by_login(login_identifier)
 
         if user and user.check_password(password):
-            # Identity can be user ID or any unique identifier
-            access_token = create_access_token(identity=str(user.id))
+            if user.password_needs_rehash():
+                # Transparently upgrade the hash while the password is known
+                user.set_password(password)
+                db.session.commit()
+
+            # Identity can be user ID or any unique identifier; "ver" lets
+            # tokens be revoked without a per-request user lookup
+            claims = {"ver": user.token_version}
+            access_token = create_access_token(
+                identity=str(user.id), additional_claims=claims
+            )
             refresh_token = create_refresh_token(
-                identity=str(user.id)
+                identity=str(user.id), additional_claims=claims
             )  # Create refresh token
             return {"access_token": access_token, "refresh_token": refresh_token}
         else:
@@ -61,7 +85,9 @@ class AuthService:
         user = UserService.get_user_by_id(int(identity))
 
         if user:
-            new_access_token = create_access_token(identity=identity)
+            new_access_token = create_access_token(
+                identity=identity, additional_claims={"ver": user.token_version}
+            )
             return new_access_token
         else:
             raise AuthenticationError("Invalid refresh token.")
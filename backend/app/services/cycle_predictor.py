@@ -0,0 +1,159 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+PredictorState = Dict[str, Any]
+
+
+class CyclePredictor:
+    """
+    Predicts the next cycle length from a constant-size per-user state.
+
+    Cycles are fed in start-date order through ``update``, which returns the
+    new state in O(1); the state is a small JSON-serialisable dict persisted
+    in ``UserCycleSummary.predictor_state``. ``key`` identifies the predictor
+    and its parameters, so stored states built by another configuration can
+    be detected and replayed.
+
+    Predictors that weigh cycles by position need the whole history replayed
+    when a cycle is inserted before the latest one or removed. Those whose
+    state does not depend on order set ``order_independent`` and implement
+    ``remove``, so such changes are applied in O(1) as well.
+    """
+
+    #: Name used in the ``CYCLE_PREDICTOR`` setting
+    name = ""
+    #: Whether cycles may be fed through ``update`` and ``remove`` in any order
+    order_independent = False
+
+    @property
+    def key(self) -> str:
+        return self.name
+
+    def initial_state(self) -> PredictorState:
+        raise NotImplementedError
+
+    def update(self, state: PredictorState, length: int) -> PredictorState:
+        """Returns the state after observing one more cycle of ``length`` days."""
+        raise NotImplementedError
+
+    def remove(self, state: PredictorState, length: int) -> PredictorState:
+        """Returns the state without one cycle of ``length`` days."""
+        raise NotImplementedError(f"{self.key} cannot forget a cycle")
+
+    def predict(self, state: PredictorState) -> Optional[float]:
+        """Predicted length of the next cycle, or None without any cycle."""
+        raise NotImplementedError
+
+
+class MeanPredictor(CyclePredictor):
+    """Plain mean of every cycle so far (the historical behaviour)."""
+
+    name = "mean"
+    order_independent = True
+
+    def initial_state(self) -> PredictorState:
+        return {"sum": 0, "count": 0}
+
+    def update(self, state: PredictorState, length: int) -> PredictorState:
+        return {"sum": state["sum"] + length, "count": state["count"] + 1}
+
+    def remove(self, state: PredictorState, length: int) -> PredictorState:
+        return {"sum": state["sum"] - length, "count": state["count"] - 1}
+
+    def predict(self, state: PredictorState) -> Optional[float]:
+        return state["sum"] / state["count"] if state["count"] else None
+
+
+class EwmaPredictor(CyclePredictor):
+    """
+    Exponentially weighted mean: each new cycle gets weight ``alpha``, so
+    recent cycles dominate and old ones fade out geometrically.
+    """
+
+    name = "ewma"
+
+    def __init__(self, alpha: float = 0.3):
+        if not 0 < alpha <= 1:
+            raise ValueError("EWMA alpha must be in (0, 1].")
+        self.alpha = alpha
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{self.alpha:g}"
+
+    def initial_state(self) -> PredictorState:
+        return {"mean": None}
+
+    def update(self, state: PredictorState, length: int) -> PredictorState:
+        mean = state["mean"]
+        if mean is None:
+            return {"mean": float(length)}
+        return {"mean": mean + self.alpha * (length - mean)}
+
+    def predict(self, state: PredictorState) -> Optional[float]:
+        return state["mean"]
+
+
+class RollingPredictor(CyclePredictor):
+    """
+    Mean of the last ``window`` cycles, dropping the ``trim`` shortest and
+    longest ones first (when enough cycles remain) to ignore outliers.
+    """
+
+    name = "rolling"
+
+    def __init__(self, window: int = 6, trim: int = 1):
+        if window < 1 or trim < 0:
+            raise ValueError("Rolling window must be positive and trim non-negative.")
+        self.window = window
+        self.trim = trim
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{self.window}:{self.trim}"
+
+    def initial_state(self) -> PredictorState:
+        return {"lengths": []}
+
+    def update(self, state: PredictorState, length: int) -> PredictorState:
+        return {"lengths": [*state["lengths"], length][-self.window :]}
+
+    def predict(self, state: PredictorState) -> Optional[float]:
+        lengths = sorted(state["lengths"])
+        if not lengths:
+            return None
+        if len(lengths) > 2 * self.trim:
+            lengths = lengths[self.trim : len(lengths) - self.trim]
+        return sum(lengths) / len(lengths)
+
+
+PREDICTORS = {cls.name: cls for cls in (MeanPredictor, EwmaPredictor, RollingPredictor)}
+
+
+@lru_cache(maxsize=None)
+def get_predictor(key: Optional[str] = None) -> CyclePredictor:
+    """
+    Builds the predictor identified by ``key``, e.g. ``"ewma:0.3"`` or
+    ``"rolling:6:1"``; parameters left out take their defaults.
+    """
+    name, *params = (key or MeanPredictor.name).split(":")
+    if name not in PREDICTORS:
+        raise ValueError(f"Unknown cycle predictor: {name!r}")
+    cls = PREDICTORS[name]
+    if cls is EwmaPredictor:
+        return EwmaPredictor(*map(float, params))
+    if cls is RollingPredictor:
+        return RollingPredictor(*map(int, params))
+    return cls()
+
+
+def predictor_from_config(config: Any) -> CyclePredictor:
+    """Builds the predictor selected by the ``CYCLE_PREDICTOR*`` settings."""
+    name = config.get("CYCLE_PREDICTOR", MeanPredictor.name)
+    if name == EwmaPredictor.name:
+        return get_predictor(f"{name}:{config.get('CYCLE_PREDICTOR_ALPHA', 0.3):g}")
+    if name == RollingPredictor.name:
+        window = config.get("CYCLE_PREDICTOR_WINDOW", 6)
+        trim = config.get("CYCLE_PREDICTOR_TRIM", 1)
+        return get_predictor(f"{name}:{window}:{trim}")
+    return get_predictor(name)
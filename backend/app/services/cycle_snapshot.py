@@ -0,0 +1,341 @@
+import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.services.cycle_predictor import (
+    CyclePredictor,
+    PredictorState,
+    get_predictor,
+)
+
+PeriodRow = Tuple[datetime.date, Optional[datetime.date], int]
+
+
+class CycleSnapshot:
+    """
+    Aggregated, in-memory view of a user's period history.
+
+    A snapshot is built from a single ``(start_date, end_date, id)`` series
+    and every report (period stats, cycle stats, prediction, ovulation and
+    cycle context) is derived from it without touching the database again.
+
+    Predictions use the cycle predictor identified by ``predictor`` (see
+    ``cycle_predictor``), whose state is advanced one cycle at a time as
+    periods are appended to the history.
+    """
+
+    #: Attributes persisted one-to-one in ``UserCycleSummary``
+    FIELDS = (
+        "period_count",
+        "completed_count",
+        "duration_sum",
+        "duration_sq_sum",
+        "duration_min",
+        "duration_max",
+        "cycle_count",
+        "cycle_sum",
+        "cycle_sq_sum",
+        "cycle_min",
+        "cycle_max",
+        "last_start_date",
+        "active_period_id",
+        "active_start_date",
+        "predictor",
+        "predictor_state",
+    )
+
+    def __init__(
+        self,
+        period_count: int = 0,
+        completed_count: int = 0,
+        duration_sum: int = 0,
+        duration_sq_sum: int = 0,
+        duration_min: Optional[int] = None,
+        duration_max: Optional[int] = None,
+        cycle_count: int = 0,
+        cycle_sum: int = 0,
+        cycle_sq_sum: int = 0,
+        cycle_min: Optional[int] = None,
+        cycle_max: Optional[int] = None,
+        last_start_date: Optional[datetime.date] = None,
+        active_period_id: Optional[int] = None,
+        active_start_date: Optional[datetime.date] = None,
+        predictor: Optional[str] = None,
+        predictor_state: Optional[PredictorState] = None,
+        data_version: int = 0,
+    ):
+        self.period_count = period_count
+        self.completed_count = completed_count
+        self.duration_sum = duration_sum
+        self.duration_sq_sum = duration_sq_sum
+        self.duration_min = duration_min
+        self.duration_max = duration_max
+        self.cycle_count = cycle_count
+        self.cycle_sum = cycle_sum
+        self.cycle_sq_sum = cycle_sq_sum
+        self.cycle_min = cycle_min
+        self.cycle_max = cycle_max
+        self.last_start_date = last_start_date
+        self.active_period_id = active_period_id
+        self.active_start_date = active_start_date
+        self.predictor = get_predictor(predictor).key
+        self.predictor_state = (
+            predictor_state
+            if predictor_state is not None
+            else get_predictor(predictor).initial_state()
+        )
+        # Version of the stored summary this snapshot was read from; not an
+        # aggregate, so it is not part of FIELDS
+        self.data_version = data_version
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[PeriodRow], predictor: Optional[CyclePredictor] = None
+    ) -> "CycleSnapshot":
+        """
+        Builds a snapshot from period rows ordered by start date ascending.
+
+        Cycle length is the number of days between two consecutive starts;
+        zero-length intervals (duplicate start dates) are ignored. The
+        predictor (the plain mean by default) is fed every cycle in order.
+        """
+        snapshot = cls(predictor=predictor.key if predictor else None)
+        previous_start: Optional[datetime.date] = None
+
+        for start_date, end_date, period_id in rows:
+            snapshot.period_count += 1
+
+            if end_date is not None:
+                snapshot.add_duration((end_date - start_date).days + 1)
+            else:
+                # Rows are ordered by start date, so the last ongoing one wins
+                snapshot.active_period_id = period_id
+                snapshot.active_start_date = start_date
+
+            if previous_start is not None:
+                snapshot.add_cycle((start_date - previous_start).days)
+                snapshot.update_prediction((start_date - previous_start).days)
+
+            previous_start = start_date
+
+        snapshot.last_start_date = previous_start
+        return snapshot
+
+    @classmethod
+    def from_summary(cls, summary: Any) -> "CycleSnapshot":
+        """Builds a snapshot from a persisted ``UserCycleSummary`` row."""
+        return cls(
+            data_version=summary.data_version or 0,
+            **{field: getattr(summary, field) for field in cls.FIELDS},
+        )
+
+    def apply_to(self, summary: Any) -> None:
+        """Copies the aggregates onto a ``UserCycleSummary`` row."""
+        for field in self.FIELDS:
+            setattr(summary, field, getattr(self, field))
+
+    def add_duration(self, duration: int) -> None:
+        """Accounts for one completed period of ``duration`` days."""
+        self.completed_count += 1
+        self.duration_sum += duration
+        self.duration_sq_sum += duration * duration
+        self.duration_min = _min(self.duration_min, duration)
+        self.duration_max = _max(self.duration_max, duration)
+
+    def remove_duration(self, duration: int) -> bool:
+        """
+        Removes one completed period of ``duration`` days.
+
+        Returns False when min/max can no longer be known without a full
+        recompute (the removed value was an extreme).
+        """
+        self.completed_count -= 1
+        self.duration_sum -= duration
+        self.duration_sq_sum -= duration * duration
+        if not self.completed_count:
+            self.duration_min = self.duration_max = None
+            return True
+        return duration not in (self.duration_min, self.duration_max)
+
+    def add_cycle(self, length: int) -> None:
+        """Accounts for one cycle; non-positive lengths are ignored."""
+        if length <= 0:
+            return
+        self.cycle_count += 1
+        self.cycle_sum += length
+        self.cycle_sq_sum += length * length
+        self.cycle_min = _min(self.cycle_min, length)
+        self.cycle_max = _max(self.cycle_max, length)
+
+    def remove_cycle(self, length: int) -> bool:
+        """Removes one cycle; same contract as ``remove_duration``."""
+        if length <= 0:
+            return True
+        self.cycle_count -= 1
+        self.cycle_sum -= length
+        self.cycle_sq_sum -= length * length
+        if not self.cycle_count:
+            self.cycle_min = self.cycle_max = None
+            return True
+        return length not in (self.cycle_min, self.cycle_max)
+
+    def update_prediction(self, length: int) -> None:
+        """
+        Advances the predictor with the latest cycle, in O(1).
+
+        Only valid for a cycle appended after every known one; other changes
+        to the history go through ``insert_prediction`` and
+        ``remove_prediction``, or a replay (see ``from_rows``).
+        """
+        if length <= 0:
+            return
+        self.predictor_state = get_predictor(self.predictor).update(
+            self.predictor_state, length
+        )
+
+    def insert_prediction(self, length: int) -> bool:
+        """
+        Feeds the predictor a cycle that is not the latest one.
+
+        Returns False, leaving the state alone, when the predictor depends
+        on the order of cycles; the history must then be replayed.
+        """
+        predictor = get_predictor(self.predictor)
+        if not predictor.order_independent:
+            return False
+        if length > 0:
+            self.predictor_state = predictor.update(self.predictor_state, length)
+        return True
+
+    def remove_prediction(self, length: int) -> bool:
+        """Removes one cycle from the predictor; same contract as above."""
+        predictor = get_predictor(self.predictor)
+        if not predictor.order_independent:
+            return False
+        if length > 0:
+            self.predictor_state = predictor.remove(self.predictor_state, length)
+        return True
+
+    @property
+    def average_cycle_length(self) -> Optional[int]:
+        """Average cycle length rounded to whole days, if any cycle is known."""
+        if not self.cycle_count:
+            return None
+        return round(self.cycle_sum / self.cycle_count)
+
+    @property
+    def predicted_cycle_length(self) -> Optional[int]:
+        """Next cycle length from the predictor, rounded to whole days."""
+        predicted = get_predictor(self.predictor).predict(self.predictor_state)
+        return round(predicted) if predicted is not None else None
+
+    def period_stats(self) -> Dict[str, Optional[float | int]]:
+        """Statistics about period durations (completed periods only)."""
+        if not self.completed_count:
+            return {
+                "count": self.period_count,
+                "min_duration": None,
+                "max_duration": None,
+                "average_duration": None,
+            }
+
+        return {
+            "count": self.period_count,
+            "min_duration": self.duration_min,
+            "max_duration": self.duration_max,
+            "average_duration": round(self.duration_sum / self.completed_count, 2),
+        }
+
+    def cycle_stats(self) -> Dict[str, Optional[float | int]]:
+        """Statistics about cycle lengths (start to next start)."""
+        return {
+            "count": self.cycle_count,
+            "min_length": self.cycle_min,
+            "max_length": self.cycle_max,
+            "average_length": self.average_cycle_length,
+        }
+
+    def predicted_next_period(self) -> Optional[datetime.date]:
+        """Estimates the next period start date using the predicted cycle length."""
+        cycle_length = self.predicted_cycle_length
+        if cycle_length is None:
+            return None  # Not enough data to predict
+
+        return self.last_start_date + datetime.timedelta(days=cycle_length - 1)
+
+    def estimated_ovulation(self) -> Optional[Dict[str, datetime.date]]:
+        """Estimates ovulation day and fertile window."""
+        predicted_start = self.predicted_next_period()
+
+        if not predicted_start:
+            return None
+
+        # Assuming luteal phase ~14 days
+        ovulation_date = predicted_start - datetime.timedelta(days=14)
+        return {
+            "ovulation_date": ovulation_date,
+            "fertile_window_start": ovulation_date - datetime.timedelta(days=4),
+            "fertile_window_end": ovulation_date + datetime.timedelta(days=1),
+        }
+
+    def context(self, today: datetime.date) -> Optional[Dict[str, Any]]:
+        """
+        Contextual information about the current cycle as of ``today``.
+
+        See ``ReportService.get_cycle_context`` for the returned keys.
+        Returns None if there is no period history.
+        """
+        if not self.period_count:
+            return None
+
+        predicted_start = self.predicted_next_period()
+        ovulation = self.estimated_ovulation()
+        avg = self.predicted_cycle_length
+
+        days_running = None
+        status = "waiting"
+        days_until_next_period = None
+        if self.active_period_id is not None:
+            # Period in progress
+            days_running = (today - self.active_start_date).days + 1
+            status = "period"
+        elif predicted_start:
+            # If predicted date is today or in the past, days until is 0
+            days_until_next_period = max((predicted_start - today).days, 0)
+
+        last_start = self.last_start_date
+        cycle_day = (today - last_start).days + 1 if today > last_start else 1
+        progress_percent = None
+        if avg:
+            progress_percent = min(round((cycle_day / avg) * 100), 100.0)
+
+        return {
+            "status": status,
+            "current_period_id": self.active_period_id,
+            "days_running": days_running,
+            "cycle_day": cycle_day,
+            "cycle_length": avg,
+            "progress_percent": progress_percent,
+            "predicted_start": predicted_start,
+            "days_until_next_period": days_until_next_period,
+            "ovulation_date": ovulation.get("ovulation_date") if ovulation else None,
+            "fertile_window": {
+                "start": ovulation.get("fertile_window_start") if ovulation else None,
+                "end": ovulation.get("fertile_window_end") if ovulation else None,
+            },
+            "is_today_ovulation": ovulation
+            and ovulation.get("ovulation_date") == today,
+            "is_in_fertile_window": (
+                ovulation
+                and ovulation.get("fertile_window_start")
+                <= today
+                <= ovulation.get("fertile_window_end")
+            ),
+        }
+
+
+def _min(current: Optional[int], value: int) -> int:
+    return value if current is None or value < current else current
+
+
+def _max(current: Optional[int], value: int) -> int:
+    return value if current is None or value > current else current
@@ -0,0 +1,289 @@
+import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models import Period, UserCycleSummary
+from app.services.cycle_predictor import CyclePredictor, predictor_from_config
+from app.services.cycle_snapshot import CycleSnapshot
+
+
+class CycleSummaryService:
+    """
+    Service layer maintaining ``UserCycleSummary`` rows.
+
+    The ``on_period_*`` hooks must be called after the period change has been
+    flushed and before the caller commits, so the summary update lands in the
+    same transaction. Every update bumps the row's ``data_version``, which
+    identifies the state of the user's period data. Periods are ordered by
+    ``(start_date, id)``; inserts and deletes anywhere in the history only
+    touch their two neighbours, and fall back to a full recompute when a
+    removed value was the min or max.
+
+    The cycle predictor's state is advanced in O(1) when a period is
+    appended after the latest one. Order-independent predictors (the
+    default ``mean``) are also updated in O(1) by inserts and deletes
+    elsewhere; predictors that weigh cycles by position (``ewma``,
+    ``rolling``) replay the history then, as does a summary stored under
+    another ``CYCLE_PREDICTOR`` setting.
+    """
+
+    @staticmethod
+    def predictor() -> CyclePredictor:
+        """The cycle predictor selected by the app configuration."""
+        return predictor_from_config(current_app.config)
+
+    @staticmethod
+    def get_snapshot(user_id: int) -> CycleSnapshot:
+        """
+        Reads the user's summary by primary key, rebuilding it if missing.
+
+        Concurrent first reads may both try to insert the row; the one that
+        loses rolls back and reads the row the other one stored.
+        """
+        summary = db.session.get(UserCycleSummary, int(user_id))
+        if CycleSummaryService._is_stale(summary):
+            try:
+                snapshot = CycleSummaryService.rebuild(user_id)
+                db.session.commit()
+                return snapshot
+            except IntegrityError:
+                db.session.rollback()
+                summary = db.session.get(UserCycleSummary, int(user_id))
+        return CycleSnapshot.from_summary(summary)
+
+    @staticmethod
+    def compute(user_id: int) -> CycleSnapshot:
+        """Recomputes the aggregates from the full period history."""
+        rows = db.session.execute(
+            select(Period.start_date, Period.end_date, Period.id)
+            .where(Period.user_id == int(user_id))
+            .order_by(Period.start_date.asc(), Period.id.asc())
+        ).all()
+        return CycleSnapshot.from_rows(rows, CycleSummaryService.predictor())
+
+    @staticmethod
+    def rebuild(user_id: int) -> CycleSnapshot:
+        """Recomputes and stores the user's summary (caller commits)."""
+        user_id = int(user_id)
+        snapshot = CycleSummaryService.compute(user_id)
+        summary = db.session.get(UserCycleSummary, user_id)
+        if summary is None:
+            summary = UserCycleSummary(user_id=user_id)
+            db.session.add(summary)
+        CycleSummaryService._store(summary, snapshot)
+        return snapshot
+
+    @staticmethod
+    def on_period_added(period: Period) -> CycleSnapshot:
+        """Accounts for a newly inserted period, wherever it falls in history."""
+        summary = CycleSummaryService._locked_summary(period.user_id)
+        if CycleSummaryService._is_stale(summary):
+            return CycleSummaryService.rebuild(period.user_id)
+
+        snapshot = CycleSnapshot.from_summary(summary)
+        snapshot.period_count += 1
+        start = period.start_date
+
+        if period.end_date is not None:
+            snapshot.add_duration(period.duration)
+        elif snapshot.active_period_id is None or (start, period.id) > (
+            snapshot.active_start_date,
+            snapshot.active_period_id,
+        ):
+            snapshot.active_period_id = period.id
+            snapshot.active_start_date = start
+
+        previous_start, next_start = CycleSummaryService._neighbours(period)
+        exact = True
+        if previous_start and next_start:
+            # The new period splits an existing cycle in two
+            split = (next_start - previous_start).days
+            exact = snapshot.remove_cycle(split)
+            exact = snapshot.remove_prediction(split) and exact
+        if previous_start:
+            snapshot.add_cycle((start - previous_start).days)
+        if next_start:
+            snapshot.add_cycle((next_start - start).days)
+            # Later cycles were fed to the predictor already
+            exact = snapshot.insert_prediction((next_start - start).days) and exact
+            if previous_start:
+                exact = (
+                    snapshot.insert_prediction((start - previous_start).days) and exact
+                )
+        else:
+            snapshot.last_start_date = start
+            if previous_start:
+                snapshot.update_prediction((start - previous_start).days)
+
+        if not exact:
+            return CycleSummaryService.rebuild(period.user_id)
+        CycleSummaryService._store(summary, snapshot)
+        return snapshot
+
+    @staticmethod
+    def on_period_ended(period: Period) -> CycleSnapshot:
+        """Accounts for an end date being set on a previously ongoing period."""
+        summary = CycleSummaryService._locked_summary(period.user_id)
+        if CycleSummaryService._is_stale(summary):
+            return CycleSummaryService.rebuild(period.user_id)
+
+        snapshot = CycleSnapshot.from_summary(summary)
+        snapshot.add_duration(period.duration)
+        if snapshot.active_period_id == period.id:
+            snapshot.active_period_id, snapshot.active_start_date = (
+                CycleSummaryService._latest_active(period.user_id)
+            )
+        CycleSummaryService._store(summary, snapshot)
+        return snapshot
+
+    @staticmethod
+    def on_period_deleted(period: Period) -> CycleSnapshot:
+        """Accounts for a deleted period, merging the cycles around it."""
+        summary = CycleSummaryService._locked_summary(period.user_id)
+        if CycleSummaryService._is_stale(summary):
+            return CycleSummaryService.rebuild(period.user_id)
+
+        snapshot = CycleSnapshot.from_summary(summary)
+        snapshot.period_count -= 1
+        start = period.start_date
+        exact = True
+
+        if period.end_date is not None:
+            exact = snapshot.remove_duration(period.duration)
+
+        previous_start, next_start = CycleSummaryService._neighbours(period)
+        removed = []
+        if previous_start:
+            removed.append((start - previous_start).days)
+        if next_start:
+            removed.append((next_start - start).days)
+        for length in removed:
+            exact = snapshot.remove_cycle(length) and exact
+            exact = snapshot.remove_prediction(length) and exact
+        if previous_start and next_start:
+            merged = (next_start - previous_start).days
+            snapshot.add_cycle(merged)
+            exact = snapshot.insert_prediction(merged) and exact
+        if not next_start:
+            snapshot.last_start_date = previous_start
+
+        if snapshot.active_period_id == period.id:
+            snapshot.active_period_id, snapshot.active_start_date = (
+                CycleSummaryService._latest_active(period.user_id)
+            )
+
+        if not exact:
+            return CycleSummaryService.rebuild(period.user_id)
+        CycleSummaryService._store(summary, snapshot)
+        return snapshot
+
+    @staticmethod
+    def check(user_id: int) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Compares the stored summary with a full recompute.
+
+        Returns ``{field: (stored, expected)}`` for every mismatching field;
+        an empty dict means the summary is consistent. A missing row is fine
+        for a user without periods, since it is created lazily on first read.
+        """
+        expected = CycleSummaryService.compute(user_id)
+        summary = db.session.get(UserCycleSummary, int(user_id))
+        if summary is None and not expected.period_count:
+            return {}
+        mismatches = {}
+        for field in CycleSnapshot.FIELDS:
+            stored = getattr(summary, field) if summary is not None else None
+            if summary is None or stored != getattr(expected, field):
+                mismatches[field] = (stored, getattr(expected, field))
+        return mismatches
+
+    @staticmethod
+    def _store(summary: UserCycleSummary, snapshot: CycleSnapshot) -> None:
+        """Writes the aggregates onto the row and bumps its data version."""
+        snapshot.apply_to(summary)
+        summary.data_version = (summary.data_version or 0) + 1
+        snapshot.data_version = summary.data_version
+
+    @staticmethod
+    def _is_stale(summary: Optional[UserCycleSummary]) -> bool:
+        """True for a missing row or one built with another cycle predictor."""
+        return (
+            summary is None or summary.predictor != CycleSummaryService.predictor().key
+        )
+
+    @staticmethod
+    def _locked_summary(user_id: int) -> UserCycleSummary:
+        """
+        Loads the summary row, locking it on databases that support it.
+
+        A missing row is inserted first, empty and so rebuilt by the caller:
+        concurrent first writes then wait on the same row lock instead of
+        racing to insert it.
+        """
+        user_id = int(user_id)
+        summary = CycleSummaryService._select_for_update(user_id)
+        if summary is None:
+            insert = (
+                postgresql_insert
+                if db.engine.dialect.name == "postgresql"
+                else sqlite_insert
+            )
+            db.session.execute(
+                insert(UserCycleSummary)
+                .values(user_id=user_id)
+                .on_conflict_do_nothing(index_elements=["user_id"])
+            )
+            summary = CycleSummaryService._select_for_update(user_id)
+        return summary
+
+    @staticmethod
+    def _select_for_update(user_id: int) -> Optional[UserCycleSummary]:
+        return db.session.execute(
+            select(UserCycleSummary)
+            .where(UserCycleSummary.user_id == user_id)
+            .with_for_update()
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _neighbours(
+        period: Period,
+    ) -> Tuple[Optional[datetime.date], Optional[datetime.date]]:
+        """Start dates of the periods just before and after ``period``."""
+        start, period_id = period.start_date, period.id
+        base = select(Period.start_date).where(Period.user_id == int(period.user_id))
+        previous_start = db.session.execute(
+            base.where(
+                Period.start_date <= start,
+                or_(Period.start_date < start, Period.id < period_id),
+            )
+            .order_by(Period.start_date.desc(), Period.id.desc())
+            .limit(1)
+        ).scalar()
+        next_start = db.session.execute(
+            base.where(
+                Period.start_date >= start,
+                or_(Period.start_date > start, Period.id > period_id),
+            )
+            .order_by(Period.start_date.asc(), Period.id.asc())
+            .limit(1)
+        ).scalar()
+        return previous_start, next_start
+
+    @staticmethod
+    def _latest_active(
+        user_id: int,
+    ) -> Tuple[Optional[int], Optional[datetime.date]]:
+        """Id and start date of the latest ongoing period, if any."""
+        row = db.session.execute(
+            select(Period.id, Period.start_date)
+            .where(Period.user_id == int(user_id), Period.end_date.is_(None))
+            .order_by(Period.start_date.desc(), Period.id.desc())
+            .limit(1)
+        ).first()
+        return (row.id, row.start_date) if row else (None, None)
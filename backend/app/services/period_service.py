@@ -1,14 +1,26 @@
+import csv
 import datetime
-from typing import List, Optional
+import io
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from app.extensions import db
+from marshmallow import ValidationError as MarshmallowValidationError
+from sqlalchemy import insert, or_, select
+
+from app.extensions import db, report_cache
 from app.models import Period
-from app.utils.exceptions import NotFoundError, PeriodLogicError
+from app.schemas import PeriodImportRowSchema
+from app.services.cycle_summary_service import CycleSummaryService
+from app.utils.exceptions import NotFoundError, PeriodLogicError, ValidationError
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class PeriodService:
     """Service layer for period tracking logic."""
 
+    MAX_PAGE_SIZE = 100
+    MAX_IMPORT_ROWS = 20000
+    IMPORT_CHUNK_SIZE = 1000
+
     @staticmethod
     def record_period_start(user_id: int, start_date: datetime.date) -> Period:
         """Records the start of a new period for a user."""
@@ -21,13 +33,18 @@ class PeriodService:
 
         period = Period(user_id=user_id, start_date=start_date)
         try:
-            return period.save()
+            db.session.add(period)
+            db.session.flush()
+            CycleSummaryService.on_period_added(period)
+            db.session.commit()
         except Exception as e:
             db.session.rollback()
             # Log e
             raise PeriodLogicError(
                 "Could not record period start due to database error."
             ) from e
+        report_cache.invalidate(user_id)
+        return period
 
     @staticmethod
     def update_period_end(
@@ -47,13 +64,17 @@ class PeriodService:
 
         period.end_date = end_date
         try:
-            return period.save()
+            db.session.flush()
+            CycleSummaryService.on_period_ended(period)
+            db.session.commit()
         except Exception as e:
             db.session.rollback()
             # Log e
             raise PeriodLogicError(
                 "Could not update period end date due to database error."
             ) from e
+        report_cache.invalidate(user_id)
+        return period
 
     @staticmethod
     def get_period_by_id_for_user(user_id: int, period_id: int) -> Optional[Period]:
@@ -65,13 +86,196 @@ class PeriodService:
         user_id: int, page: int = 1, per_page: int = 10
     ) -> List[Period]:
         """Gets a paginated list of all periods for a user, ordered by start date descending."""
-        # Using paginate for better handling of large datasets
-        pagination = (
+        # Plain LIMIT/OFFSET: the total count is never exposed, so don't pay for it
+        page = page if page >= 1 else 1
+        per_page = per_page if per_page >= 1 else 20
+        return (
             Period.query.filter_by(user_id=user_id)
-            .order_by(Period.start_date.desc())
-            .paginate(page=page, per_page=per_page, error_out=False)
+            .order_by(Period.start_date.desc(), Period.id.desc())
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+            .all()
+        )
+
+    @staticmethod
+    def get_periods_page_for_user(
+        user_id: int, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Period], Optional[str]]:
+        """
+        Gets one page of a user's periods using keyset (cursor) pagination.
+
+        Periods are ordered by ``(start_date, id)`` descending and the page is
+        found with a seek predicate on that ordering, so the cost does not
+        grow with how deep the client pages. Returns the periods and the
+        cursor for the next page (None on the last page).
+        """
+        limit = min(max(limit, 1), PeriodService.MAX_PAGE_SIZE)
+        query = Period.query.filter_by(user_id=user_id)
+        if cursor:
+            start_date, period_id = decode_cursor(cursor)
+            # Equivalent to (start_date, id) < cursor, written with a plain
+            # upper bound on start_date so the index range seek is used
+            query = query.filter(
+                Period.start_date <= start_date,
+                or_(Period.start_date < start_date, Period.id < period_id),
+            )
+
+        # Fetch one extra row to know whether another page exists
+        periods = (
+            query.order_by(Period.start_date.desc(), Period.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        if len(periods) <= limit:
+            return periods, None
+        last = periods[limit - 1]
+        return periods[:limit], encode_cursor(last.start_date, last.id)
+
+    @staticmethod
+    def read_import_csv(data: bytes | str) -> List[Dict[str, Optional[str]]]:
+        """Parses a CSV upload with ``start_date`` and ``end_date`` columns."""
+        try:
+            text = data.decode("utf-8-sig") if isinstance(data, bytes) else data
+        except UnicodeDecodeError as e:
+            raise ValidationError("CSV upload must be UTF-8 encoded.") from e
+
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames or "start_date" not in reader.fieldnames:
+            raise ValidationError(
+                "CSV must have a header row with start_date and end_date columns."
+            )
+        return [
+            {
+                "start_date": (row.get("start_date") or "").strip() or None,
+                "end_date": (row.get("end_date") or "").strip() or None,
+            }
+            for row in reader
+        ]
+
+    @staticmethod
+    def import_periods(user_id: int, records: List[Any]) -> int:
+        """
+        Imports many periods at once, all or nothing.
+
+        Every record is validated in one pass, including ordering and overlaps
+        against each other and the existing history. If any record is invalid
+        nothing is written and a ValidationError carries the per-row errors
+        (rows are numbered from 1). Otherwise rows are written with one
+        batched INSERT per chunk in a single transaction, together with the
+        user's cycle summary. Returns the number of imported periods.
+
+        Each chunk is a Core executemany: PostgreSQL renders it as multi-row
+        INSERT ... VALUES pages, SQLite runs one prepared statement in a loop.
+        """
+        if len(records) > PeriodService.MAX_IMPORT_ROWS:
+            raise ValidationError(
+                f"At most {PeriodService.MAX_IMPORT_ROWS} periods can be "
+                "imported at once."
+            )
+
+        schema = PeriodImportRowSchema()
+        errors: Dict[int, List[str]] = {}
+        rows: List[Tuple[datetime.date, Optional[datetime.date], int]] = []
+        for number, record in enumerate(records, start=1):
+            try:
+                data = schema.load(record)
+            except MarshmallowValidationError as e:
+                errors[number] = _flatten_messages(e.messages)
+                continue
+            rows.append((data["start_date"], data.get("end_date"), number))
+
+        PeriodService._check_import_overlaps(user_id, rows, errors)
+        if errors:
+            raise ValidationError(
+                "Import rejected; no periods were imported.",
+                payload={
+                    "rows": [
+                        {"row": number, "errors": messages}
+                        for number, messages in sorted(errors.items())
+                    ]
+                },
+            )
+        if not rows:
+            return 0
+
+        created_at = datetime.datetime.utcnow()
+        values = [
+            {
+                "user_id": int(user_id),
+                "start_date": start_date,
+                "end_date": end_date,
+                "created_at": created_at,
+            }
+            for start_date, end_date, _ in rows
+        ]
+        chunk_size = PeriodService.IMPORT_CHUNK_SIZE
+        try:
+            for offset in range(0, len(values), chunk_size):
+                db.session.execute(
+                    insert(Period.__table__), values[offset : offset + chunk_size]
+                )
+            CycleSummaryService.rebuild(user_id)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            # Log e
+            raise PeriodLogicError(
+                "Could not import periods due to database error."
+            ) from e
+        report_cache.invalidate(user_id)
+        return len(values)
+
+    @staticmethod
+    def _check_import_overlaps(
+        user_id: int,
+        rows: List[Tuple[datetime.date, Optional[datetime.date], int]],
+        errors: Dict[int, List[str]],
+    ) -> None:
+        """
+        Records an error for every imported row overlapping another period.
+
+        Sweeps all periods by start date while tracking the furthest end date
+        seen so far; an ongoing period reaches indefinitely, so only the most
+        recent period may be left without an end date.
+        """
+        existing = db.session.execute(
+            select(Period.start_date, Period.end_date).where(
+                Period.user_id == int(user_id)
+            )
+        ).all()
+        intervals = [(start, end, None) for start, end in existing] + rows
+        # Existing periods sort first on ties, so the imported row gets the blame
+        intervals.sort(key=lambda interval: (interval[0], interval[2] is not None))
+
+        reach: Optional[datetime.date] = None
+        owner: Optional[int] = None
+        for start, end, number in intervals:
+            if reach is not None and start <= reach and (number or owner):
+                if number is None:
+                    number, other = owner, "an existing period"
+                else:
+                    other = f"row {owner}" if owner else "an existing period"
+                errors.setdefault(number, []).append(f"Overlaps {other}.")
+            stop = end or datetime.date.max
+            if reach is None or stop > reach:
+                reach, owner = stop, number
+
+    @staticmethod
+    def iter_periods_for_export(user_id: int, batch_size: int = 1000) -> Iterator[List]:
+        """
+        Yields a user's periods in batches of plain rows, oldest first.
+
+        Rows are ``(id, start_date, end_date, created_at)`` tuples read through
+        a server-side cursor, so memory stays bounded by ``batch_size`` however
+        long the history is.
+        """
+        result = db.session.execute(
+            select(Period.id, Period.start_date, Period.end_date, Period.created_at)
+            .where(Period.user_id == int(user_id))
+            .order_by(Period.start_date.asc(), Period.id.asc())
+            .execution_options(yield_per=batch_size)
         )
-        return pagination.items  # Or return the pagination object for more info
+        yield from result.partitions()
 
     @staticmethod
     def get_active_period_for_user(user_id: int):
@@ -88,11 +292,28 @@ class PeriodService:
             raise NotFoundError(f"Period with ID {period_id} not found for this user.")
 
         try:
-            period.delete()
-            return True
+            db.session.delete(period)
+            db.session.flush()
+            CycleSummaryService.on_period_deleted(period)
+            db.session.commit()
         except Exception as e:
             db.session.rollback()
             # Log e
             raise PeriodLogicError(
                 "Could not delete period due to database error."
             ) from e
+        report_cache.invalidate(user_id)
+        return True
+
+
+def _flatten_messages(messages: Any, prefix: str = "") -> List[str]:
+    """Flattens marshmallow error messages into ``"field: message"`` strings."""
+    if isinstance(messages, dict):
+        flattened = []
+        for field, value in messages.items():
+            name = "" if field == "_schema" else f"{prefix}{field}"
+            flattened.extend(_flatten_messages(value, f"{name}: " if name else ""))
+        return flattened
+    if isinstance(messages, list):
+        return [f"{prefix}{message}" for message in messages]
+    return [f"{prefix}{messages}"]
@@ -1,50 +1,63 @@
 import datetime
-from statistics import StatisticsError, mean
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional
 
-from app.extensions import db
-from app.models import Period
+from flask import current_app
+from sqlalchemy import and_, func, select, text
+
+from app.extensions import db, report_cache
+from app.models import Period, User
+from app.services.cycle_snapshot import CycleSnapshot
+from app.services.cycle_summary_service import CycleSummaryService
 
 
 class ReportService:
     """Service layer for generating cycle and period statistics."""
 
+    #: Sections of the dashboard bundle, in response order
+    DASHBOARD_SECTIONS = (
+        "user",
+        "active_period",
+        "cycle_context",
+        "cycle_stats",
+        "period_stats",
+        "predicted_next_period",
+        "ovulation_window",
+    )
+
     @staticmethod
-    def get_period_stats(user_id: int) -> Dict[str, Optional[float | int]]:
-        """Calculates statistics about period durations for a user."""
-        periods_with_duration: List[Period] = (
-            Period.query.filter(
-                Period.user_id == user_id,
-                Period.end_date.isnot(None),  # Only consider completed periods
-            )
-            .order_by(Period.start_date)
-            .all()
+    def get_snapshot(user_id: int) -> CycleSnapshot:
+        """
+        Returns the user's cycle snapshot, served from the report cache.
+
+        The snapshot holds no date-dependent values, so fields such as
+        ``cycle_day`` are always derived from it at request time.
+        """
+        return report_cache.get_or_load(
+            user_id, lambda: ReportService.load_snapshot(user_id)
         )
-        count = Period.query.filter(Period.user_id == user_id).count()
-
-        durations: List[int] = [
-            p.duration for p in periods_with_duration if p.duration is not None
-        ]
-
-        if not durations:
-            return {
-                "count": count,
-                "min_duration": None,
-                "max_duration": None,
-                "average_duration": None,
-            }
 
-        try:
-            avg_duration = round(mean(durations), 2)
-        except StatisticsError:
-            avg_duration = None  # Should not happen if durations list is not empty, but safety first
+    @staticmethod
+    def load_snapshot(user_id: int) -> CycleSnapshot:
+        """
+        Loads the user's aggregates with a single primary-key read of the
+        incrementally maintained ``user_cycle_summary`` row.
+        """
+        return CycleSummaryService.get_snapshot(user_id)
+
+    @staticmethod
+    def get_data_version(user_id: int) -> int:
+        """
+        Returns the version of the user's period data, bumped on every write.
+
+        Read from the cached snapshot, which the report served by the same
+        request then reuses: the ETag costs no extra query.
+        """
+        return ReportService.get_snapshot(user_id).data_version
 
-        return {
-            "count": count,
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "average_duration": avg_duration,
-        }
+    @staticmethod
+    def get_period_stats(user_id: int) -> Dict[str, Optional[float | int]]:
+        """Calculates statistics about period durations for a user."""
+        return ReportService.get_snapshot(user_id).period_stats()
 
     @staticmethod
     def get_cycle_stats(user_id: int) -> Dict[str, Optional[float | int]]:
@@ -53,107 +66,28 @@ class ReportService:
         Cycle length is defined as the time from the start of one period
         to the start of the next period.
         """
-        # Fetch all periods sorted by start date to calculate intervals
-        periods: List[Period] = (
-            Period.query.filter_by(user_id=user_id)
-            .order_by(Period.start_date.asc())
-            .all()
-        )
-
-        if len(periods) < 2:
-            # Need at least two periods to calculate one cycle length
-            return {
-                "count": 0,
-                "min_length": None,
-                "max_length": None,
-                "average_length": None,
-            }
-
-        cycle_lengths: List[int] = []
-        for i in range(len(periods) - 1):
-            start_date_current = periods[i].start_date
-            start_date_next = periods[i + 1].start_date
-            length = (start_date_next - start_date_current).days
-            if length > 0:  # Basic sanity check
-                cycle_lengths.append(length)
-
-        if not cycle_lengths:
-            return {
-                "count": 0,
-                "min_length": None,
-                "max_length": None,
-                "average_length": None,
-            }
-
-        try:
-            avg_length = round(mean(cycle_lengths))
-        except StatisticsError:
-            avg_length = None
-
-        return {
-            "count": len(cycle_lengths),
-            "min_length": min(cycle_lengths),
-            "max_length": max(cycle_lengths),
-            "average_length": avg_length,
-        }
+        return ReportService.get_snapshot(user_id).cycle_stats()
 
     @staticmethod
     def get_predicted_next_period(user_id: int) -> Optional[datetime.date]:
-        """Estimates the next period start date using average cycle length."""
-        periods: List[Period] = (
-            Period.query.filter_by(user_id=user_id)
-            .order_by(Period.start_date.asc())
-            .all()
-        )
-
-        if len(periods) < 2:
-            return None  # Not enough data to predict
-
-        # Use the last known start date
-        last_period_start = periods[-1].start_date
-
-        # Calculate average cycle length
-        cycle_lengths = [
-            (periods[i + 1].start_date - periods[i].start_date).days
-            for i in range(len(periods) - 1)
-            if (periods[i + 1].start_date - periods[i].start_date).days > 0
-        ]
-
-        if not cycle_lengths:
-            return None
-
-        avg_cycle_length = round(mean(cycle_lengths))
-        predicted_date = last_period_start + datetime.timedelta(
-            days=avg_cycle_length - 1
-        )
-        return predicted_date
+        """
+        Estimates the next period start date from the cycle length predicted
+        by the configured ``CYCLE_PREDICTOR`` (the plain average by default).
+        """
+        return ReportService.get_snapshot(user_id).predicted_next_period()
 
     @staticmethod
     def get_estimated_ovulation(user_id: int) -> Optional[Dict[str, datetime.date]]:
         """Estimates ovulation day and fertile window."""
-        predicted_start = ReportService.get_predicted_next_period(user_id)
-
-        if not predicted_start:
-            return None
-
-        # Assuming luteal phase ~14 days
-        ovulation_date = predicted_start - datetime.timedelta(days=14)
-        fertile_window_start = ovulation_date - datetime.timedelta(days=4)
-        fertile_window_end = ovulation_date + datetime.timedelta(days=1)
-
-        return {
-            "ovulation_date": ovulation_date,
-            "fertile_window_start": fertile_window_start,
-            "fertile_window_end": fertile_window_end,
-        }
+        return ReportService.get_snapshot(user_id).estimated_ovulation()
 
     @staticmethod
-    def get_cycle_context(user_id: int) -> Optional[Dict[str, any]]:
+    def get_cycle_context(user_id: int) -> Optional[Dict[str, Any]]:
         """
         Returns contextual information about the user's current menstrual cycle.
 
         This includes whether a period is ongoing, how many days it has lasted,
-        the current cycle day, progress through the cycle based on average length,
+        the current cycle day, progress through the cycle based on predicted length,
         and predictions such as next period start, ovulation date, and fertile window.
 
         Args:
@@ -170,9 +104,10 @@ class ReportService:
 
             - cycle_day (int or None): If not currently on a period, the number of days since the last period started.
 
-            - cycle_length (float or None): The average cycle length for the user (in days), based on past data.
+            - cycle_length (int or None): The predicted cycle length for the user (in days), from the
+              configured cycle predictor over past data.
 
-            - progress_percent (float or None): If not currently on a period and average cycle length is known,
+            - progress_percent (float or None): If not currently on a period and a cycle length is predicted,
               an estimate of how far the user is through their current cycle (as a percentage).
 
             - predicted_start (str or None): Predicted date for the next period to begin (ISO 8601 format).
@@ -192,75 +127,82 @@ class ReportService:
 
         Returns None if there is no period history for the user.
         """
-        from datetime import date
+        return ReportService.get_snapshot(user_id).context(datetime.date.today())
 
-        today = date.today()
-        periods = (
-            Period.query.filter_by(user_id=user_id)
-            .order_by(Period.start_date.asc())
-            .all()
-        )
+    @staticmethod
+    def get_dashboard(
+        user_id: int, include: Iterable[str] = DASHBOARD_SECTIONS
+    ) -> Dict[str, Any]:
+        """
+        Builds the dashboard bundle: the requested sections of the user's
+        profile, active period and reports, keyed by section name.
 
-        if not periods:
-            return None
+        Every report section comes from one snapshot. The user and the
+        active period (the latest ongoing one) are read together in a
+        single query, and only when one of them is requested.
+        """
+        include = set(include)
+        snapshot = ReportService.get_snapshot(user_id)
+        dashboard: Dict[str, Any] = {}
+
+        if include & {"user", "active_period"}:
+            row = db.session.execute(
+                select(User, Period)
+                .outerjoin(
+                    Period,
+                    and_(
+                        Period.user_id == User.id,
+                        Period.id == snapshot.active_period_id,
+                    ),
+                )
+                .where(User.id == int(user_id))
+            ).first()
+            user, active_period = row if row else (None, None)
+            if "user" in include:
+                dashboard["user"] = user
+            if "active_period" in include:
+                dashboard["active_period"] = active_period
+
+        if "cycle_context" in include:
+            dashboard["cycle_context"] = snapshot.context(datetime.date.today()) or {}
+        if "cycle_stats" in include:
+            dashboard["cycle_stats"] = snapshot.cycle_stats()
+        if "period_stats" in include:
+            dashboard["period_stats"] = snapshot.period_stats()
+        if "predicted_next_period" in include:
+            dashboard["predicted_next_period"] = {
+                "predicted_start": snapshot.predicted_next_period()
+            }
+        if "ovulation_window" in include:
+            dashboard["ovulation_window"] = snapshot.estimated_ovulation() or {}
+        return dashboard
 
-        cycle_stats = ReportService.get_cycle_stats(user_id)
-        predicted_start = ReportService.get_predicted_next_period(user_id)
-        ovulation = ReportService.get_estimated_ovulation(user_id)
+    @staticmethod
+    def get_user_count() -> int:
+        """
+        Returns the number of registered users for the public stats endpoint.
 
-        # Check if there's a running period
-        current_period = (
-            Period.query.filter_by(user_id=user_id)
-            .filter(Period.end_date.is_(None))
-            .order_by(Period.start_date.desc())
-            .first()
+        The value is cached for ``USER_COUNT_CACHE_TTL`` seconds and dropped on
+        registration and deletion. With ``USER_COUNT_MODE = "approximate"`` a
+        miss reads the planner's row estimate on PostgreSQL instead of
+        scanning ``users``.
+        """
+        return report_cache.get_user_count(
+            ReportService.count_users,
+            current_app.config.get("USER_COUNT_CACHE_TTL"),
         )
 
-        days_running = None
-        status = "waiting"
-        current_period_id = None
-        days_until_next_period = None
-        if current_period:
-            # Period in progress
-            days_running = (today - current_period.start_date).days + 1
-            status = "period"
-            current_period_id = current_period.id
-        else:
-            if predicted_start:
-                delta = predicted_start - today
-                # If predicted date is today or in the past, days until is 0
-                if delta.days <= 0:
-                    days_until_next_period = 0
-                else:
-                    days_until_next_period = delta.days
-
-        progress_percent = None
-        last_start = periods[-1].start_date
-        cycle_day = (today - last_start).days + 1 if today > last_start else 1
-        if cycle_stats and cycle_stats.get("average_length"):
-            avg = cycle_stats["average_length"]
-            progress_percent = min(round((cycle_day / avg) * 100), 100.0)
-
-        return {
-            "status": status,
-            "current_period_id": current_period_id,
-            "days_running": days_running,
-            "cycle_day": cycle_day,
-            "cycle_length": cycle_stats.get("average_length") if cycle_stats else None,
-            "progress_percent": progress_percent,
-            "predicted_start": predicted_start,
-            "days_until_next_period": days_until_next_period,
-            "ovulation_date": ovulation.get("ovulation_date") if ovulation else None,
-            "fertile_window": {
-                "start": ovulation.get("fertile_window_start") if ovulation else None,
-                "end": ovulation.get("fertile_window_end") if ovulation else None,
-            },
-            "is_today_ovulation": ovulation
-            and ovulation.get("ovulation_date") == today,
-            "is_in_fertile_window": (
-                ovulation
-                and ovulation.get("fertile_window_start")
-                <= today
-                <= ovulation.get("fertile_window_end")
-            ),
-        }
+    @staticmethod
+    def count_users() -> int:
+        """Counts users, exactly or from planner statistics (see get_user_count)."""
+        approximate = current_app.config.get("USER_COUNT_MODE") == "approximate"
+        if approximate and db.engine.dialect.name == "postgresql":
+            estimate = db.session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass"
+                )
+            ).scalar()
+            # -1 (or NULL) until the table has been vacuumed or analyzed
+            if estimate is not None and estimate >= 0:
+                return estimate
+        return db.session.execute(select(func.count()).select_from(User)).scalar()
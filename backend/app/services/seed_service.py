@@ -0,0 +1,109 @@
+import datetime
+import random
+from typing import Optional, Tuple
+
+from sqlalchemy import func, insert, select, text
+
+from app.extensions import db, password_hasher, report_cache
+from app.models import Period, User, UserCycleSummary
+from app.services.cycle_snapshot import CycleSnapshot
+from app.services.cycle_summary_service import CycleSummaryService
+from app.utils.synthetic import generate_periods
+
+
+class SeedService:
+    """Service layer bulk-loading synthetic users and periods for load tests."""
+
+    @staticmethod
+    def seed(
+        user_count: int,
+        periods_per_user: int,
+        password: str = "password",
+        prefix: str = "seed",
+        rng: Optional[random.Random] = None,
+        batch_size: int = 50_000,
+    ) -> Tuple[int, int]:
+        """
+        Inserts ``user_count`` users with ``periods_per_user`` plausible
+        periods each (see ``app.utils.synthetic``); returns the numbers of
+        users and periods written.
+
+        Rows are written with Core executemany batches of about
+        ``batch_size`` periods, one commit per batch, together with each
+        user's cycle summary so that reads never trigger a rebuild. Every
+        user gets the same password, hashed once. Ids are allocated up
+        front, so nothing else may insert users or periods meanwhile.
+        """
+        if user_count <= 0:
+            return 0, 0
+        rng = rng or random.Random()
+        password_hash = password_hasher.hash(password)
+        predictor = CycleSummaryService.predictor()
+        today = datetime.date.today()
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        next_user_id = (db.session.scalar(select(func.max(User.id))) or 0) + 1
+        next_period_id = (db.session.scalar(select(func.max(Period.id))) or 0) + 1
+        users_per_batch = max(batch_size // max(periods_per_user, 1), 1)
+
+        period_total = 0
+        for first in range(0, user_count, users_per_batch):
+            users, periods, summaries = [], [], []
+            for user_id in range(
+                next_user_id + first,
+                next_user_id + min(first + users_per_batch, user_count),
+            ):
+                username = f"{prefix}{user_id}"
+                users.append(
+                    {
+                        "id": user_id,
+                        "username": username,
+                        "email": f"{username}@example.com",
+                        "password_hash": password_hash,
+                        "created_at": created_at,
+                    }
+                )
+                history = []
+                for start_date, end_date in generate_periods(
+                    rng, periods_per_user, today=today
+                ):
+                    history.append((start_date, end_date, next_period_id))
+                    periods.append(
+                        {
+                            "id": next_period_id,
+                            "user_id": user_id,
+                            "start_date": start_date,
+                            "end_date": end_date,
+                            "created_at": created_at,
+                        }
+                    )
+                    next_period_id += 1
+                snapshot = CycleSnapshot.from_rows(history, predictor)
+                summaries.append(
+                    {
+                        "user_id": user_id,
+                        "data_version": 1,
+                        **{
+                            field: getattr(snapshot, field) for field in snapshot.FIELDS
+                        },
+                    }
+                )
+
+            db.session.execute(insert(User.__table__), users)
+            if periods:
+                db.session.execute(insert(Period.__table__), periods)
+            db.session.execute(insert(UserCycleSummary.__table__), summaries)
+            db.session.commit()
+            period_total += len(periods)
+
+        if db.engine.dialect.name == "postgresql":
+            # Explicit ids do not advance the serial sequences
+            for table in ("users", "periods"):
+                db.session.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"(SELECT MAX(id) FROM {table}))"
+                    )
+                )
+            db.session.commit()
+        report_cache.invalidate_user_count()
+        return user_count, period_total
@@ -1,5 +1,8 @@
 from typing import Optional
 
+from sqlalchemy import select
+
+from app.extensions import db, report_cache, token_versions
 from app.models import User
 
 
@@ -11,6 +14,34 @@ class UserService:
         """Finds a user by their ID."""
         return User.get_by_id(user_id)
 
+    @staticmethod
+    def get_token_version(user_id: int) -> int:
+        """
+        Returns the user's current token version from the short-lived cache.
+
+        Deleted users get ``TokenVersionCache.MISSING_USER``, which no token
+        carries.
+        """
+        user_id = int(user_id)
+        return token_versions.get_or_load(
+            user_id,
+            lambda: db.session.execute(
+                select(User.token_version).where(User.id == user_id)
+            ).scalar(),
+        )
+
+    @staticmethod
+    def is_token_current(user_id: int, version: int) -> bool:
+        """Checks a token's "ver" claim against the user's token version."""
+        return UserService.get_token_version(user_id) == version
+
+    @staticmethod
+    def revoke_tokens(user: User) -> None:
+        """Invalidates every access and refresh token issued to the user."""
+        user.token_version += 1
+        user.save()
+        token_versions.invalidate(user.id)
+
     @staticmethod
     def get_user_by_email(email: str) -> Optional[User]:
         """Finds a user by their email."""
@@ -24,23 +55,36 @@ class UserService:
     @staticmethod
     def get_user_by_login(login: str) -> Optional[User]:
         """Finds a user by either email or username."""
-        user = User.find_by_email(login)
-        if not user:
-            user = User.find_by_username(login)
-        return user
+        return User.find_by_login(login)
 
     @staticmethod
     def update_user(user: User, data: dict) -> User:
-        """Update a user"""
-        return user.update(**data)
+        """
+        Update a user.
+
+        Changing the username or email (the login identifiers) revokes every
+        token issued to the user.
+        """
+        credentials_changed = any(
+            field in data and data[field] != getattr(user, field)
+            for field in ("username", "email")
+        )
+        user = user.update(**data)
+        if credentials_changed:
+            UserService.revoke_tokens(user)
+        return user
 
     @staticmethod
     def update_password(user: User, new_password: str) -> None:
-        """Updates a user's password."""
+        """Updates a user's password and revokes every token issued to them."""
         user.set_password(new_password)
-        user.save()
+        UserService.revoke_tokens(user)
 
     @staticmethod
     def delete_user(user: User) -> None:
         """Deletes a user."""
+        user_id = user.id
         user.delete()
+        report_cache.invalidate(user_id)
+        report_cache.invalidate_user_count()
+        token_versions.invalidate(user_id)
@@ -0,0 +1,294 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from flask import g, has_request_context
+
+from app.utils.metrics import REPORT_CACHE_HITS, REPORT_CACHE_MISSES
+
+_MISSING = object()
+
+
+class CacheBackend:
+    """Minimal key/value interface shared by all cache backends."""
+
+    def get(self, key: str) -> Any:
+        """Returns the cached value, or None if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Stores a value, optionally expiring after ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Removes a key if present."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Removes every key."""
+        raise NotImplementedError
+
+
+class NullCache(CacheBackend):
+    """Backend that never stores anything (caching disabled)."""
+
+    def get(self, key: str) -> Any:
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        pass
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache with per-entry TTL.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is
+    reached; expired entries are dropped lazily when read.
+    """
+
+    def __init__(self, maxsize: int = 10000, default_ttl: Optional[int] = None):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[str, tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache(CacheBackend):
+    """
+    Shared backend storing pickled values in Redis.
+
+    Requires the optional ``redis`` package; lets several worker processes
+    and pods see each other's invalidations.
+    """
+
+    def __init__(self, url: str, default_ttl: Optional[int] = None, prefix: str = ""):
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "The 'redis' package is required for the redis cache backend."
+            ) from e
+        self.client = redis.Redis.from_url(url)
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any:
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=ttl or None)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(f"{self.prefix}*"):
+            self.client.delete(key)
+
+
+def create_backend(
+    name: str,
+    maxsize: int = 10000,
+    ttl: Optional[int] = None,
+    redis_url: Optional[str] = None,
+    prefix: str = "",
+) -> CacheBackend:
+    """Builds a cache backend from its configuration name."""
+    name = (name or "null").lower()
+    if name == "memory":
+        return MemoryCache(maxsize=maxsize, default_ttl=ttl)
+    if name == "redis":
+        if not redis_url:
+            raise RuntimeError("A Redis URL is required for the redis cache backend.")
+        return RedisCache(redis_url, default_ttl=ttl, prefix=prefix)
+    if name in ("null", "none", "off"):
+        return NullCache()
+    raise ValueError(f"Unknown cache backend '{name}'.")
+
+
+class ReportCache:
+    """
+    Per-user cache of report snapshots, keyed by user and data version.
+
+    Each user has a version token stored next to the cached entries.
+    Invalidation replaces the token, so any snapshot computed from older
+    data (including one written by a request racing with the invalidation)
+    becomes unreachable rather than having to be found and deleted.
+
+    The token lives in the cache backend, so only a shared backend (Redis)
+    is safe with several worker processes. With the in-process backend an
+    invalidation is seen only by the worker that handled the write; the
+    others keep serving older reports, and older ETags, for up to the TTL.
+
+    Within a request each user's snapshot is loaded at most once, so the
+    ETag check and the report it guards share one read, whatever the
+    backend (the null backend included).
+    """
+
+    def __init__(self, app=None):
+        self.backend: CacheBackend = NullCache()
+        self.ttl: Optional[int] = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.ttl = app.config.get("REPORT_CACHE_TTL")
+        self.backend = create_backend(
+            app.config.get("REPORT_CACHE_BACKEND", "null"),
+            maxsize=app.config.get("REPORT_CACHE_MAXSIZE", 10000),
+            ttl=self.ttl,
+            redis_url=app.config.get("REPORT_CACHE_REDIS_URL"),
+            prefix="cycle-tracker:",
+        )
+        app.teardown_request(self._forget_request_snapshots)
+        app.extensions["report_cache"] = self
+
+    @staticmethod
+    def _request_snapshots() -> dict:
+        """Snapshots loaded during the current request, by user id."""
+        if not has_request_context():
+            return {}
+        return g.setdefault("report_snapshots", {})
+
+    @staticmethod
+    def _forget_request_snapshots(exc=None) -> None:
+        # The app context, and so g, can outlive a request (tests push one)
+        g.pop("report_snapshots", None)
+
+    @staticmethod
+    def _version_key(user_id) -> str:
+        return f"reports:{user_id}:version"
+
+    def get_version(self, user_id) -> int:
+        """Returns the user's current data version, creating one if missing."""
+        version = self.backend.get(self._version_key(user_id))
+        if version is None:
+            # A fresh token can never collide with entries from before eviction
+            version = time.time_ns()
+            self.backend.set(self._version_key(user_id), version, self.ttl)
+        return version
+
+    def get_or_load(self, user_id, loader: Callable[[], Any]) -> Any:
+        """Returns the cached snapshot for the user, computing it on a miss."""
+        snapshots = self._request_snapshots()
+        if str(user_id) in snapshots:
+            return snapshots[str(user_id)]
+        key = f"reports:{user_id}:{self.get_version(user_id)}"
+        value = self.backend.get(key)
+        if value is None:
+            REPORT_CACHE_MISSES.inc()
+            value = loader()
+            self.backend.set(key, value, self.ttl)
+        else:
+            REPORT_CACHE_HITS.inc()
+        snapshots[str(user_id)] = value
+        return value
+
+    def invalidate(self, user_id) -> None:
+        """Drops every cached snapshot for the user by bumping the version."""
+        self._request_snapshots().pop(str(user_id), None)
+        self.backend.set(self._version_key(user_id), time.time_ns(), self.ttl)
+
+    def get_user_count(self, loader: Callable[[], int], ttl: Optional[int]) -> int:
+        """Returns the cached number of users, counting through ``loader`` on a miss."""
+        count = self.backend.get("reports:general:user-count")
+        if count is None:
+            count = loader()
+            self.backend.set("reports:general:user-count", count, ttl)
+        return count
+
+    def invalidate_user_count(self) -> None:
+        """Forgets the cached user count after a registration or deletion."""
+        self.backend.delete("reports:general:user-count")
+
+
+class TokenVersionCache:
+    """
+    Short-lived cache of each user's current token version.
+
+    Lets identity-only endpoints check that a token has not been revoked
+    without loading the user on every request. With the default in-process
+    backend, a revocation made by another worker is seen once the entry
+    expires, so the TTL bounds how long a revoked token keeps working.
+    """
+
+    #: Stored for users that no longer exist; never matches a token claim
+    MISSING_USER = -1
+
+    def __init__(self, app=None):
+        self.backend: CacheBackend = NullCache()
+        self.ttl: Optional[int] = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.ttl = app.config.get("USER_CACHE_TTL")
+        self.backend = create_backend(
+            app.config.get("USER_CACHE_BACKEND", "null"),
+            maxsize=app.config.get("USER_CACHE_MAXSIZE", 10000),
+            ttl=self.ttl,
+            redis_url=app.config.get("USER_CACHE_REDIS_URL"),
+            prefix="cycle-tracker:",
+        )
+        app.extensions["token_versions"] = self
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"users:{user_id}:token-version"
+
+    def get_or_load(self, user_id, loader: Callable[[], Optional[int]]) -> int:
+        """Returns the user's token version, reading it through ``loader`` on a miss."""
+        version = self.backend.get(self._key(user_id))
+        if version is None:
+            version = loader()
+            if version is None:
+                version = self.MISSING_USER
+            self.backend.set(self._key(user_id), version, self.ttl)
+        return version
+
+    def invalidate(self, user_id) -> None:
+        """Forgets the cached version after the user is changed or deleted."""
+        self.backend.delete(self._key(user_id))
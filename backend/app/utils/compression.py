@@ -0,0 +1,117 @@
+import zlib
+from typing import Iterable, Iterator, Optional
+
+import brotli
+from flask import current_app, request
+
+# Encodings in order of preference when a client accepts several equally
+ENCODINGS = ("br", "gzip")
+
+
+class ResponseCompression:
+    """
+    gzip/brotli compression of API responses, negotiated per request.
+
+    Responses of a ``COMPRESSION_MIMETYPES`` type are compressed with the
+    best encoding the client's ``Accept-Encoding`` allows: brotli at
+    ``COMPRESSION_BR_QUALITY``, else gzip at ``COMPRESSION_GZIP_LEVEL``.
+    Bodies under ``COMPRESSION_MIN_SIZE`` bytes are sent as they are, since
+    the saving would not pay for the CPU time. Streamed responses (exports)
+    are compressed chunk by chunk as they are produced, each chunk flushed
+    to the client, rather than buffered. Responses that already have a
+    Content-Encoding (precompressed static files) or are passed through
+    from a file are left alone.
+
+    A strong ETag becomes weak once compressed, as the bytes differ from the
+    uncompressed representation; If-None-Match compares weakly, so
+    conditional requests keep answering 304.
+
+    With ``COMPRESSION_ENABLED`` off no hook is registered.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        app.extensions["compression"] = self
+        if app.config.get("COMPRESSION_ENABLED", True):
+            app.after_request(self._compress)
+
+    def _compress(self, response):
+        config = current_app.config
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in config["COMPRESSION_MIMETYPES"]
+        ):
+            return response
+        response.vary.add("Accept-Encoding")
+
+        encoding = negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+        level = (
+            config["COMPRESSION_BR_QUALITY"]
+            if encoding == "br"
+            else config["COMPRESSION_GZIP_LEVEL"]
+        )
+
+        if response.is_streamed:
+            response.response = compress_stream(response.response, encoding, level)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < config["COMPRESSION_MIN_SIZE"]:
+                return response
+            response.set_data(compress(data, encoding, level))
+
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+def negotiate(accepted) -> Optional[str]:
+    """The preferred encoding among those the client accepts, if any."""
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        quality = accepted.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_stream(chunks: Iterable, encoding: str, level: int) -> Iterator[bytes]:
+    """Compresses ``chunks`` as they come, flushing after each one."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=level)
+        process, flush = compressor.process, compressor.flush
+        finish = compressor.finish
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        process = compressor.compress
+        flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)  # noqa: E731
+        finish = compressor.flush
+
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if chunk:
+                yield process(chunk) + flush()
+        yield finish()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
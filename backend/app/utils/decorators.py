@@ -1,12 +1,75 @@
+import datetime
 from functools import wraps
+from typing import Callable
 
-from flask import request
+from flask import Response, current_app, request
+from flask_jwt_extended import get_jwt_identity
 from marshmallow import Schema
 from marshmallow import ValidationError as MarshmallowValidationError
 
 from app.utils.exceptions import ValidationError  # Your custom validation error
 
 
+def requires_current_user(f):
+    """
+    Marks a JWT-protected view as needing the full ``current_user`` object.
+
+    Views without the marker only get the token identity, so the user row
+    is not loaded on every authenticated request.
+    """
+    f.requires_current_user = True
+    return f
+
+
+def conditional_on_data_version(
+    version_getter: Callable[[str], int], date_sensitive: bool = False
+):
+    """
+    Adds a strong ETag derived from the user's data version to a JWT view.
+
+    The tag is computed before the view runs: when it matches the request's
+    If-None-Match the view (and its serialisation) is skipped and a 304 is
+    returned. ``date_sensitive`` folds today's date into the tag for
+    responses that change with the calendar. Must be applied below
+    ``@jwt_required()``.
+
+    Response compression turns the tag of a compressed 200 weak, so
+    If-None-Match is compared weakly, and the 304 carries the tag in the
+    form the client holds: weak if its copy was compressed, strong if not.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            user_id = get_jwt_identity()
+            etag = f"{user_id}.{version_getter(user_id)}"
+            if date_sensitive:
+                etag = f"{etag}.{datetime.date.today().isoformat()}"
+            # Per-user data: cacheable by the client only, revalidated each time
+            headers = {"ETag": f'"{etag}"', "Cache-Control": "private, no-cache"}
+
+            if request.if_none_match.contains_weak(etag):
+                if not request.if_none_match.contains(etag):
+                    headers["ETag"] = f'W/"{etag}"'
+                return current_app.response_class(status=304, headers=headers)
+
+            rv = f(*args, **kwargs)
+            if isinstance(rv, Response):
+                rv.headers.update(headers)
+                return rv
+            if not isinstance(rv, tuple):
+                return rv, 200, headers
+            if len(rv) == 2 and not isinstance(rv[1], int):
+                return rv[0], 200, {**rv[1], **headers}
+            if len(rv) == 2:
+                return rv[0], rv[1], headers
+            return rv[0], rv[1], {**rv[2], **headers}
+
+        return decorated_function
+
+    return decorator
+
+
 def validate_schema(schema: Schema):
     """
     Decorator to validate request JSON data against a Marshmallow schema.
@@ -37,6 +37,26 @@ class NotFoundError(BaseAppException):
     status_code = 404  # Not Found
 
 
+class ServiceUnavailableError(BaseAppException):
+    """Exception raised when a bounded resource is saturated; clients should retry."""
+
+    status_code = 503  # Service Unavailable
+    message = "The service is temporarily overloaded."
+
+    def __init__(
+        self,
+        message: str | None = None,
+        status_code: int | None = None,
+        retry_after: int = 1,
+    ):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+    @property
+    def headers(self) -> dict:
+        return {"Retry-After": str(self.retry_after)}
+
+
 class ValidationError(BaseAppException):
     """Exception raised for schema validation errors (can wrap Marshmallow errors)."""
 
@@ -0,0 +1,153 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS,
+    check_password_hash,
+    generate_password_hash,
+)
+
+from app.utils.exceptions import ServiceUnavailableError
+from app.utils.metrics import PASSWORD_HASH_PENDING, PASSWORD_HASH_REJECTED
+
+
+def canonical_method(method: str) -> str:
+    """
+    Expands a werkzeug hash method to the prefix it writes into hashes.
+
+    ``"scrypt"`` and ``"pbkdf2"`` are shorthands for werkzeug's current
+    defaults, so they are spelled out for comparison with stored hashes.
+    """
+    name, *params = method.split(":")
+    if name == "scrypt":
+        defaults = ["32768", "8", "1"]
+    elif name == "pbkdf2":
+        defaults = ["sha256", str(DEFAULT_PBKDF2_ITERATIONS)]
+    else:
+        return method
+    return ":".join([name, *params, *defaults[len(params) :]])
+
+
+class PasswordHasher:
+    """
+    Runs password hashing and verification on a bounded process pool.
+
+    Hashing is deliberately CPU-heavy; running it in separate processes keeps
+    a burst of logins from holding the GIL of the web worker that serves every
+    other endpoint. At most ``max_pending`` operations are queued per worker
+    process; beyond that, callers get a ``ServiceUnavailableError`` (503 with
+    Retry-After) instead of piling up. A slot is held until the pool has
+    finished the operation, even when its caller gave up after ``timeout``,
+    so abandoned hashes still count against the limit. With ``workers = 0``
+    hashing runs inline, which is what the tests use.
+
+    The limit only rejects anything when a worker process serves several
+    requests at once (gthread or gevent workers). A sync gunicorn worker has
+    one request in flight, so it never queues more than one operation and
+    only ``timeout`` applies.
+    """
+
+    def __init__(self, app=None):
+        self.method = "scrypt"
+        self.workers = 0
+        self.max_pending = 0
+        self.timeout: Optional[float] = None
+        self.retry_after = 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        self.method = app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+        self.workers = app.config.get("PASSWORD_HASH_WORKERS", 0)
+        self.max_pending = app.config.get("PASSWORD_HASH_MAX_PENDING") or max(
+            self.workers * 4, 1
+        )
+        self.timeout = app.config.get("PASSWORD_HASH_TIMEOUT")
+        self.retry_after = app.config.get("PASSWORD_HASH_RETRY_AFTER", 1)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        app.extensions["password_hasher"] = self
+
+    def hash(self, password: str) -> str:
+        """Hashes a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        """Checks a password against a stored hash."""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """True when a stored hash was made with other method or parameters."""
+        return pwhash.split("$", 1)[0] != canonical_method(self.method)
+
+    def shutdown(self) -> None:
+        """Stops the pool's processes; a new pool is started on next use."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _run(self, fn: Callable, *args) -> Any:
+        if not self.workers:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            PASSWORD_HASH_REJECTED.inc()
+            raise ServiceUnavailableError(
+                "Too many password operations in progress.",
+                retry_after=self.retry_after,
+            )
+        PASSWORD_HASH_PENDING.inc()
+        release = _releaser(self._slots)
+        future = None
+        try:
+            future = self._get_executor().submit(fn, *args)
+            # Freed when the pool is done with it, not when this caller gives
+            # up: an operation that has started cannot be cancelled
+            future.add_done_callback(release)
+            return future.result(timeout=self.timeout)
+        except FuturesTimeoutError as e:
+            future.cancel()
+            raise ServiceUnavailableError(
+                "Password operation timed out.", retry_after=self.retry_after
+            ) from e
+        except BrokenProcessPool as e:
+            # A pool process died; start a fresh pool for the next caller
+            self.shutdown()
+            raise ServiceUnavailableError(
+                "Password hashing is unavailable.", retry_after=self.retry_after
+            ) from e
+        finally:
+            if future is None:
+                release()  # Never reached the pool
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Pools are per process: one inherited through fork (e.g. from a
+        # preloading gunicorn master) has no usable worker processes.
+        pid = os.getpid()
+        with self._lock:
+            if self._executor is None or self._executor_pid != pid:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._executor_pid = pid
+            return self._executor
+
+
+def _releaser(slots: threading.BoundedSemaphore) -> Callable[..., None]:
+    """A callback freeing one of ``slots``, whatever it is called with."""
+
+    def release(*_args) -> None:
+        PASSWORD_HASH_PENDING.dec()
+        slots.release()
+
+    return release
@@ -0,0 +1,145 @@
+import json
+import logging
+import time
+from typing import Any, List, Optional, Tuple
+
+from flask import g, has_app_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+
+access_logger = logging.getLogger("app.access")
+
+
+class RequestStats:
+    """Counters of the request being served."""
+
+    __slots__ = ("started", "queries", "db_time", "serialize_time", "statements")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.statements: List[Tuple[str, float]] = []
+
+
+def current_stats() -> Optional[RequestStats]:
+    """Stats of the request being served, if instrumentation is on."""
+    return g.get("request_stats") if has_app_context() else None
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider adding the time spent encoding to the request's stats."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        stats = current_stats()
+        if stats is None:
+            return super().dumps(obj, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            stats.serialize_time += time.perf_counter() - started
+
+
+class RequestInstrumentation:
+    """
+    Per-request SQL query counting and timing.
+
+    SQLAlchemy cursor events count the statements of each request and sum
+    their database time; JSON encoding is timed through the app's JSON
+    provider (schema dumps count as application time). Each response gets
+    a ``Server-Timing`` header (``db``, ``serialize``, ``total``) and a JSON
+    access-log line on the ``app.access`` logger; requests slower than
+    ``REQUEST_SLOW_THRESHOLD_MS`` also log their statements as a warning.
+
+    With ``REQUEST_TIMING_ENABLED`` off nothing is registered at all, so
+    there is no per-request or per-query cost.
+    """
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.slow_threshold: Optional[float] = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        app.extensions["request_instrumentation"] = self
+        self.enabled = app.config.get("REQUEST_TIMING_ENABLED", False)
+        if not self.enabled:
+            return
+        threshold = app.config.get("REQUEST_SLOW_THRESHOLD_MS")
+        self.slow_threshold = threshold / 1000 if threshold else None
+        if access_logger.level == logging.NOTSET:
+            access_logger.setLevel(logging.INFO)
+
+        db = app.extensions["sqlalchemy"]
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        app.json = TimedJSONProvider(app)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+
+    def _start(self) -> None:
+        g.request_stats = RequestStats()
+
+    def _finish(self, response):
+        stats = g.pop("request_stats", None)
+        if stats is None:
+            return response
+        total = time.perf_counter() - stats.started
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries", '
+            f"serialize;dur={stats.serialize_time * 1000:.2f}, "
+            f"total;dur={total * 1000:.2f}"
+        )
+        access_logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "endpoint": request.endpoint,
+                    "status": response.status_code,
+                    "duration_ms": round(total * 1000, 2),
+                    "db_ms": round(stats.db_time * 1000, 2),
+                    "db_queries": stats.queries,
+                    "serialize_ms": round(stats.serialize_time * 1000, 2),
+                }
+            )
+        )
+        if self.slow_threshold is not None and total >= self.slow_threshold:
+            access_logger.warning(
+                "Slow request %s %s: %.1f ms, %d queries\n%s",
+                request.method,
+                request.path,
+                total * 1000,
+                stats.queries,
+                "\n".join(
+                    f"  [{duration * 1000:.2f} ms] {statement}"
+                    for statement, duration in stats.statements
+                ),
+            )
+        return response
+
+    def _teardown(self, _exc) -> None:
+        # Responses that never reached after_request (unhandled errors)
+        g.pop("request_stats", None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_stats() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats()
+    started = conn.info.pop("query_started", None)
+    if stats is None or started is None:
+        return
+    duration = time.perf_counter() - started
+    stats.queries += 1
+    stats.db_time += duration
+    stats.statements.append((statement, duration))
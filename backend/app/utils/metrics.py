@@ -0,0 +1,124 @@
+import os
+import time
+
+from flask import Response, g, has_request_context, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+
+# Metrics live in the process-wide default registry. When the
+# PROMETHEUS_MULTIPROC_DIR environment variable is set before the app is
+# imported (as gunicorn.conf.py does), prometheus_client keeps every value
+# in per-process files in that directory and /metrics aggregates them, so
+# any worker can answer a scrape for all of them.
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests served.",
+    ["blueprint", "endpoint", "method", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving HTTP requests.",
+    ["blueprint", "endpoint"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed.", ["blueprint"])
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool (or opening one).",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT with every connection in use.",
+)
+REPORT_CACHE_REQUESTS = Counter(
+    "report_cache_requests_total",
+    "Report cache lookups; the hit rate is hit / (hit + miss).",
+    ["result"],
+)
+REPORT_CACHE_HITS = REPORT_CACHE_REQUESTS.labels("hit")
+REPORT_CACHE_MISSES = REPORT_CACHE_REQUESTS.labels("miss")
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Password operations queued or running on the hashing pool.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password operations turned away because the hashing pool was full.",
+)
+
+
+class Metrics:
+    """
+    Prometheus metrics and the ``/metrics`` endpoint.
+
+    Every request is counted and timed, labelled by blueprint and endpoint
+    (``auth``, ``periods``, ``reports``, ``users``; the SPA and health
+    routes have no blueprint), and every SQL statement is counted by
+    blueprint. The report cache, password hasher and connection pool record
+    their own metrics. With ``METRICS_ENABLED`` off no hooks or route are
+    registered.
+    """
+
+    def __init__(self, app=None):
+        self.enabled = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        app.extensions["metrics"] = self
+        self.enabled = app.config.get("METRICS_ENABLED", True)
+        if not self.enabled:
+            return
+
+        db = app.extensions["sqlalchemy"]
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, "after_cursor_execute", _count_query)
+        app.before_request(_start_timer)
+        app.after_request(_record_request)
+        app.add_url_rule(
+            app.config.get("METRICS_PATH", "/metrics"),
+            "metrics",
+            app.doc(hide=True)(render_metrics),
+        )
+
+
+def render_metrics() -> Response:
+    """Exposition of every metric, across worker processes if configured."""
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def _start_timer() -> None:
+    g.metrics_started = time.perf_counter()
+
+
+def _record_request(response):
+    started = g.pop("metrics_started", None)
+    if started is None or request.endpoint == "metrics":
+        return response
+    blueprint = request.blueprint or ""
+    endpoint = request.endpoint or ""
+    REQUEST_LATENCY.labels(blueprint, endpoint).observe(time.perf_counter() - started)
+    REQUESTS.labels(blueprint, endpoint, request.method, response.status_code).inc()
+    return response
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    blueprint = request.blueprint if has_request_context() else None
+    DB_QUERIES.labels(blueprint or "").inc()
@@ -0,0 +1,22 @@
+import base64
+import binascii
+import datetime
+from typing import Tuple
+
+from app.utils.exceptions import ValidationError
+
+
+def encode_cursor(start_date: datetime.date, record_id: int) -> str:
+    """Encodes a ``(start_date, id)`` position as an opaque, URL-safe cursor."""
+    raw = f"{start_date.isoformat()}:{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.date, int]:
+    """Decodes a cursor produced by ``encode_cursor``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start, record_id = base64.urlsafe_b64decode(padded).decode().split(":")
+        return datetime.date.fromisoformat(start), int(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor.") from e
@@ -0,0 +1,61 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.utils.metrics import POOL_CHECKOUT_TIMEOUTS, POOL_CHECKOUT_WAIT
+
+POOL_MODES = ("queue", "null")
+
+
+class _TimedCheckout:
+    """Records how long each checkout waits for (or opens) a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedNullPool(_TimedCheckout, NullPool):
+    pass
+
+
+def engine_options(config) -> dict:
+    """
+    SQLAlchemy engine options for the ``DB_POOL_*`` settings of ``config``.
+
+    ``queue`` keeps up to ``DB_POOL_SIZE`` connections open per process and
+    opens at most ``DB_MAX_OVERFLOW`` more under load; a checkout waits up to
+    ``DB_POOL_TIMEOUT`` seconds before failing (whole seconds, as
+    Flask-SQLAlchemy's ``engine_from_config`` truncates it). ``null`` opens a
+    connection for every checkout and closes it on return, leaving pooling
+    to PgBouncer (in transaction pooling mode each transaction may run on a
+    different server connection, which the app never relies on).
+    """
+    mode = config.get("DB_POOL_MODE", "queue")
+    if mode not in POOL_MODES:
+        raise ValueError(
+            f"DB_POOL_MODE must be one of {', '.join(POOL_MODES)}, not {mode!r}"
+        )
+    options = {"pool_pre_ping": config.get("DB_POOL_PRE_PING", False)}
+    if mode == "null":
+        options["poolclass"] = TimedNullPool
+        return options
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=config.get("DB_POOL_SIZE", 5),
+        max_overflow=config.get("DB_MAX_OVERFLOW", 10),
+        pool_timeout=config.get("DB_POOL_TIMEOUT", 30),
+        pool_recycle=config.get("DB_POOL_RECYCLE", -1),
+    )
+    return options
@@ -0,0 +1,53 @@
+from typing import List
+
+from sqlalchemy import event
+
+
+def sqlite_pragmas(config) -> List[str]:
+    """The ``PRAGMA`` statements for the ``SQLITE_*`` settings of ``config``."""
+    pragmas = {
+        "journal_mode": config.get("SQLITE_JOURNAL_MODE"),
+        "synchronous": config.get("SQLITE_SYNCHRONOUS"),
+        "busy_timeout": config.get("SQLITE_BUSY_TIMEOUT"),
+        "cache_size": config.get("SQLITE_CACHE_SIZE"),
+        "mmap_size": config.get("SQLITE_MMAP_SIZE"),
+        "temp_store": config.get("SQLITE_TEMP_STORE"),
+        "foreign_keys": config.get("SQLITE_FOREIGN_KEYS"),
+    }
+    statements = []
+    for name, value in pragmas.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "ON" if value else "OFF"
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def configure_sqlite(app) -> None:
+    """
+    Runs the configured ``PRAGMA`` statements on every new connection of the
+    app's SQLite engines; other engines are left alone.
+
+    Most pragmas only last as long as the connection, so they are set from
+    the pool's ``connect`` event rather than once. ``journal_mode = WAL`` is
+    stored in the database file itself and lets readers proceed while a
+    writer commits, instead of waiting behind it.
+    """
+    statements = sqlite_pragmas(app.config)
+    if not statements:
+        return
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    db = app.extensions["sqlalchemy"]
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", set_pragmas)
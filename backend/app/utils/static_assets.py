@@ -0,0 +1,193 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, Iterator, Optional, Tuple
+
+import brotli
+from flask import Response, current_app, request, send_file
+from werkzeug.exceptions import NotFound
+
+# Vite names bundled files <name>-<8 character content hash>.<ext>
+FINGERPRINTED = re.compile(r"(^|/)assets/[^/]+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Encodings in order of preference, with the suffix of their variant files
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE_TYPES = (
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+INDEX = "index.html"
+
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+
+
+class StaticAsset:
+    """A file of the built frontend, with its precompressed variants."""
+
+    __slots__ = ("path", "mimetype", "etag", "cache_control", "bodies", "disk_path")
+
+    def __init__(
+        self,
+        path: str,
+        mimetype: str,
+        etag: str,
+        cache_control: str,
+        bodies: Dict[str, bytes],
+        disk_path: Optional[str] = None,
+    ):
+        self.path = path
+        self.mimetype = mimetype
+        self.etag = etag
+        self.cache_control = cache_control
+        # Body per content coding ("identity", "br", "gzip"); empty for files
+        # too large to keep in memory, which are sent from disk_path
+        self.bodies = bodies
+        self.disk_path = disk_path
+
+
+class StaticAssets:
+    """
+    The built Vue app (``app/static``), served from memory.
+
+    At startup every file is read into a manifest, together with the ``.br``
+    and ``.gz`` variants written at image build time (``flask
+    compress-static``), so serving an asset or the ``index.html`` fallback
+    for client-side routes touches no files. Clients get the smallest
+    variant their ``Accept-Encoding`` allows. Vite's fingerprinted bundles
+    are cached for a year as immutable; everything else, index.html
+    included, is revalidated against its ETag (``STATIC_MAX_AGE`` 0) and
+    answered with 304 while unchanged.
+
+    Files above ``STATIC_MEMORY_MAX_FILE_SIZE`` bytes stay on disk. The
+    manifest is not refreshed: restart the app after a new frontend build.
+    Each app has its own manifest, in ``app.extensions["static_manifest"]``.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        app.extensions["static_assets"] = self
+        directory = app.config.get("STATIC_ASSETS_DIR") or app.static_folder
+        manifest = {}
+        if directory:
+            max_age = app.config.get("STATIC_MAX_AGE", 0)
+            max_file_size = app.config.get("STATIC_MEMORY_MAX_FILE_SIZE", 1 << 20)
+            manifest = dict(_load(directory, max_age, max_file_size))
+        app.extensions["static_manifest"] = manifest
+
+    def serve(self, path: str) -> Response:
+        """Responds with the file at ``path``, or index.html if there is none."""
+        manifest: Dict[str, StaticAsset] = current_app.extensions["static_manifest"]
+        asset = manifest.get(path) or manifest.get(INDEX)
+        if asset is None:
+            raise NotFound()
+
+        if not asset.bodies:
+            response = send_file(
+                asset.disk_path, mimetype=asset.mimetype, etag=asset.etag
+            )
+            response.headers["Cache-Control"] = asset.cache_control
+            return response
+
+        encoding = self._negotiate(asset)
+        response = Response(asset.bodies[encoding], mimetype=asset.mimetype)
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        if len(asset.bodies) > 1:
+            response.vary.add("Accept-Encoding")
+        # Each coding is a different representation with its own ETag
+        response.set_etag(
+            asset.etag if encoding == "identity" else f"{asset.etag}-{encoding}"
+        )
+        response.headers["Cache-Control"] = asset.cache_control
+        return response.make_conditional(request)
+
+    @staticmethod
+    def _negotiate(asset: StaticAsset) -> str:
+        accepted = request.accept_encodings
+        for encoding, _ in ENCODINGS:
+            if encoding in asset.bodies and accepted.quality(encoding) > 0:
+                return encoding
+        return "identity"
+
+
+def _load(
+    directory: str, max_age: int, max_file_size: int
+) -> Iterator[Tuple[str, StaticAsset]]:
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    for file_path in _walk(directory):
+        if file_path.endswith(suffixes):
+            continue  # Loaded with the file it compresses
+        path = os.path.relpath(file_path, directory).replace(os.sep, "/")
+        mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if FINGERPRINTED.search(path):
+            cache_control = IMMUTABLE
+        elif max_age:
+            cache_control = f"public, max-age={max_age}"
+        else:
+            cache_control = "no-cache"
+
+        if os.path.getsize(file_path) > max_file_size:
+            with open(file_path, "rb") as f:
+                etag = hashlib.sha1(f.read()).hexdigest()
+            yield path, StaticAsset(path, mimetype, etag, cache_control, {}, file_path)
+            continue
+
+        with open(file_path, "rb") as f:
+            bodies = {"identity": f.read()}
+        for encoding, suffix in ENCODINGS:
+            if os.path.exists(file_path + suffix):
+                with open(file_path + suffix, "rb") as f:
+                    bodies[encoding] = f.read()
+        etag = hashlib.sha1(bodies["identity"]).hexdigest()
+        yield path, StaticAsset(path, mimetype, etag, cache_control, bodies)
+
+
+def precompress(directory: str, min_size: int = 1024) -> Iterator[Tuple[str, int]]:
+    """
+    Writes ``.br`` and ``.gz`` variants next to each compressible file of at
+    least ``min_size`` bytes, at the highest compression levels (this runs
+    once, at build time). Variants that would not be smaller are not kept.
+
+    Yields each compressed file's path and the bytes its smallest variant
+    saves.
+    """
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    for file_path in _walk(directory):
+        if file_path.endswith(suffixes):
+            continue
+        mimetype = mimetypes.guess_type(file_path)[0] or ""
+        if not mimetype.startswith(COMPRESSIBLE_TYPES):
+            continue
+        with open(file_path, "rb") as f:
+            data = f.read()
+        if len(data) < min_size:
+            continue
+        variants = {
+            ".br": brotli.compress(data, quality=11),
+            ".gz": gzip.compress(data, compresslevel=9, mtime=0),
+        }
+        smallest = len(data)
+        for suffix, body in variants.items():
+            if len(body) >= len(data):
+                continue
+            with open(file_path + suffix, "wb") as f:
+                f.write(body)
+            smallest = min(smallest, len(body))
+        if smallest < len(data):
+            yield file_path, len(data) - smallest
+
+
+def _walk(directory: str) -> Iterator[str]:
+    for root, _dirs, files in os.walk(directory):
+        for name in sorted(files):
+            yield os.path.join(root, name)
@@ -0,0 +1,86 @@
+import datetime
+import random
+from typing import List, Optional, Tuple
+
+SyntheticPeriod = Tuple[datetime.date, Optional[datetime.date]]
+
+
+class CycleProfile:
+    """
+    A synthetic user's cycle habits, drawn once per user.
+
+    Regular users vary by a couple of days around their own mean cycle
+    length; irregular ones vary by about a week and now and then skip a
+    period entirely (a cycle of twice the usual length).
+    """
+
+    def __init__(
+        self,
+        cycle_mean: float,
+        cycle_sd: float,
+        duration_mean: float,
+        irregular: bool = False,
+    ):
+        self.cycle_mean = cycle_mean
+        self.cycle_sd = cycle_sd
+        self.duration_mean = duration_mean
+        self.irregular = irregular
+
+    @classmethod
+    def draw(
+        cls, rng: random.Random, irregular: Optional[bool] = None
+    ) -> "CycleProfile":
+        """Draws a profile; a random 15% of users are irregular by default."""
+        if irregular is None:
+            irregular = rng.random() < 0.15
+        return cls(
+            cycle_mean=_clamp(rng.gauss(29, 2.5), 22, 38),
+            cycle_sd=rng.uniform(5, 9) if irregular else rng.uniform(1, 3),
+            duration_mean=_clamp(rng.gauss(5, 1), 2, 8),
+            irregular=irregular,
+        )
+
+    def cycle_length(self, rng: random.Random) -> int:
+        length = round(_clamp(rng.gauss(self.cycle_mean, self.cycle_sd), 18, 60))
+        if self.irregular and rng.random() < 0.1:
+            length *= 2  # Skipped period
+        return length
+
+    def duration(self, rng: random.Random) -> int:
+        return round(_clamp(rng.gauss(self.duration_mean, 1), 1, 10))
+
+
+def generate_periods(
+    rng: random.Random,
+    count: int,
+    profile: Optional[CycleProfile] = None,
+    today: Optional[datetime.date] = None,
+) -> List[SyntheticPeriod]:
+    """
+    Generates ``count`` periods ending around ``today``, oldest first.
+
+    The latest period starts within one cycle before ``today``; when it is
+    still running on ``today`` it is ongoing (no end date), as for roughly
+    one user in six.
+    """
+    if count <= 0:
+        return []
+    profile = profile or CycleProfile.draw(rng)
+    today = today or datetime.date.today()
+
+    start = today - datetime.timedelta(days=rng.randrange(round(profile.cycle_mean)))
+    starts = [start]
+    for _ in range(count - 1):
+        start -= datetime.timedelta(days=profile.cycle_length(rng))
+        starts.append(start)
+    starts.reverse()
+
+    periods = []
+    for start in starts:
+        end = start + datetime.timedelta(days=profile.duration(rng) - 1)
+        periods.append((start, end if end < today else None))
+    return periods
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return min(max(value, low), high)
@@ -0,0 +1,190 @@
+"""
+Throughput of POST /auth/login under concurrent load.
+
+Runs ``--concurrency`` threads that log in repeatedly while another thread
+polls ``/health``, once with inline hashing and once per ``--workers``
+process-pool size. Reports login throughput and latency, how many logins
+were turned away with 503, and how long the cheap endpoint waited meanwhile
+(the starvation the pool is meant to prevent).
+
+With ``--url`` the same load is sent to a running server instead (start it
+with the configuration to measure, e.g. under gunicorn).
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.auth_login --concurrency 16 --logins 400 --workers 1 2
+    python -m benchmarks.auth_login --url http://localhost:5000 --password secret
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Optional
+
+from app.extensions import db, password_hasher
+from app.models import User
+from benchmarks.common import add_database_arguments, benchmark_app
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def http_post(url: str, body: dict) -> int:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def http_get(url: str) -> int:
+    with urllib.request.urlopen(url) as response:
+        return response.status
+
+
+def run_load(
+    login: Callable[[], int], health: Callable[[], int], concurrency: int, total: int
+) -> dict:
+    """Sends ``total`` logins from ``concurrency`` threads; polls health meanwhile."""
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    health_latencies: list[float] = []
+    remaining = iter(range(total))
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def login_worker():
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            status = login()
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] = statuses.get(status, 0) + 1
+
+    def health_worker():
+        while not done.is_set():
+            started = time.perf_counter()
+            health()
+            health_latencies.append(time.perf_counter() - started)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=login_worker) for _ in range(concurrency)]
+    prober = threading.Thread(target=health_worker)
+    started = time.perf_counter()
+    prober.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    done.set()
+    prober.join()
+
+    return {
+        "wall": wall,
+        "ok": statuses.get(200, 0),
+        "rejected": statuses.get(503, 0),
+        "other": sum(n for s, n in statuses.items() if s not in (200, 503)),
+        "login_p50": percentile(latencies, 0.5),
+        "login_p95": percentile(latencies, 0.95),
+        "health_p95": percentile(health_latencies, 0.95) if health_latencies else 0,
+        "health_max": max(health_latencies, default=0),
+    }
+
+
+def print_result(label: str, result: dict) -> None:
+    print(
+        f"{label:12s} {result['ok'] / result['wall']:7.1f} logins/s"
+        f"   p50 {result['login_p50'] * 1000:7.1f} ms"
+        f"   p95 {result['login_p95'] * 1000:7.1f} ms"
+        f"   503s {result['rejected']:4d}   other {result['other']:3d}"
+        f"   /health p95 {result['health_p95'] * 1000:6.1f} ms"
+        f" max {result['health_max'] * 1000:6.1f} ms"
+    )
+
+
+def run_in_process(args, workers: int) -> dict:
+    config = {
+        "PASSWORD_HASH_METHOD": args.method,
+        "PASSWORD_HASH_WORKERS": workers,
+    }
+    if args.max_pending:
+        config["PASSWORD_HASH_MAX_PENDING"] = args.max_pending
+    with benchmark_app(args.database_url, args.drop_tables, **config) as app:
+        user = User(username="bench", email="bench@example.com")
+        user.set_password("secret")
+        db.session.add(user)
+        db.session.commit()
+        try:
+
+            def login() -> int:
+                # Each request runs in its own app context, as under a server
+                with app.test_client() as client:
+                    response = client.post(
+                        "/auth/login", json={"login": "bench", "password": "secret"}
+                    )
+                    return response.status_code
+
+            def health() -> int:
+                with app.test_client() as client:
+                    return client.get("/health").status_code
+
+            return run_load(login, health, args.concurrency, args.logins)
+        finally:
+            password_hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--method", default="scrypt")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2],
+        help="Process-pool sizes to compare with inline hashing",
+    )
+    parser.add_argument("--max-pending", type=int)
+    add_database_arguments(parser)
+    parser.add_argument("--url", help="Load a running server instead")
+    parser.add_argument("--login", default="bench")
+    parser.add_argument("--password", default="secret")
+    args = parser.parse_args()
+
+    if args.url:
+        base = args.url.rstrip("/")
+        body = {"login": args.login, "password": args.password}
+        result = run_load(
+            lambda: http_post(f"{base}/auth/login", body),
+            lambda: http_get(f"{base}/health"),
+            args.concurrency,
+            args.logins,
+        )
+        print_result("server", result)
+        return
+
+    print_result("inline", run_in_process(args, workers=0))
+    for workers in args.workers:
+        print_result(f"pool x{workers}", run_in_process(args, workers))
+
+
+if __name__ == "__main__":
+    main()
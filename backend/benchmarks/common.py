@@ -0,0 +1,98 @@
+"""Helpers shared by the benchmark scripts."""
+
+import argparse
+import datetime
+import os
+import random
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.engine import make_url
+
+from app import create_app
+from app.config import ProductionConfig, config_by_name
+from app.extensions import db
+from app.models import Period, User
+
+
+def add_database_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds ``--database-url`` and ``--drop-tables`` for ``benchmark_app``."""
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument(
+        "--drop-tables",
+        action="store_true",
+        help="Allow a non-SQLite --database-url; every table is dropped on exit",
+    )
+
+
+@contextmanager
+def benchmark_app(
+    database_url: Optional[str] = None, drop_tables: bool = False, **config
+) -> Iterator:
+    """
+    Yields an app (with an active app context) bound to a throwaway database.
+
+    Defaults to a SQLite file in a temporary directory; tables are created on
+    entry and dropped on exit. Since that drops the tables of whatever
+    database is given, a non-SQLite ``database_url`` is refused unless
+    ``drop_tables`` is set.
+    """
+    tmpdir = None
+    if database_url is None:
+        tmpdir = tempfile.mkdtemp()
+        database_url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    elif make_url(database_url).get_backend_name() != "sqlite" and not drop_tables:
+        # repr() masks the password
+        raise SystemExit(
+            f"Refusing to use {make_url(database_url)!r}: the benchmark drops "
+            "every table on exit. Pass --drop-tables if it is a scratch database."
+        )
+
+    config_by_name["benchmark"] = type(
+        "BenchmarkConfig",
+        (ProductionConfig,),
+        {
+            "SQLALCHEMY_DATABASE_URI": database_url,
+            "REPORT_CACHE_BACKEND": "null",
+            **config,
+        },
+    )
+    app = create_app("benchmark")
+    try:
+        with app.app_context():
+            db.create_all()
+            try:
+                yield app
+            finally:
+                db.session.remove()
+                db.drop_all()
+    finally:
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir)
+
+
+def seed_user(username: str = "bench", period_count: int = 0) -> int:
+    """Inserts a user with ``period_count`` regular periods; returns its id."""
+    user = User(username=username, email=f"{username}@example.com")
+    user.password_hash = "x"  # Hashing is irrelevant to these benchmarks
+    db.session.add(user)
+    db.session.commit()
+
+    start = datetime.date(1900, 1, 1)
+    rows = []
+    for _ in range(period_count):
+        rows.append(
+            {
+                "user_id": user.id,
+                "start_date": start,
+                "end_date": start + datetime.timedelta(days=random.randint(3, 7)),
+            }
+        )
+        start += datetime.timedelta(days=random.randint(24, 35))
+    if rows:
+        db.session.execute(insert(Period), rows)
+        db.session.commit()
+    return user.id
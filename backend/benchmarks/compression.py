@@ -0,0 +1,100 @@
+"""
+CPU cost versus bytes saved of compressing API responses, per endpoint.
+
+Fetches the uncompressed bodies of the larger endpoints for a user with
+``--periods`` periods (dashboard bundle, cycle context, a page of
+periods and both exports), then compresses each one at several gzip
+levels and brotli qualities with the functions the response hook uses.
+Exports are compressed chunk by chunk with a flush after each chunk, as
+they are streamed, which costs some ratio over one-shot compression.
+
+For each endpoint and setting the median CPU time of ``--repeat``
+compressions is printed with the compressed size, the share of bytes
+saved and the bytes saved per millisecond of CPU.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.compression --periods 500
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from flask_jwt_extended import create_access_token
+
+from app.utils.compression import compress, compress_stream
+from benchmarks.common import add_database_arguments, benchmark_app, seed_user
+
+ENDPOINTS = [
+    "/reports/dashboard",
+    "/reports/cycle-context",
+    "/periods?per_page=100",
+    "/periods/export?format=csv",
+    "/periods/export?format=ndjson",
+]
+SETTINGS = [("gzip", 1), ("gzip", 6), ("gzip", 9), ("br", 1), ("br", 4), ("br", 11)]
+
+
+def cpu_time(func: Callable[[], bytes], repeat: int) -> float:
+    """Median CPU seconds of ``func``."""
+    samples = []
+    for _ in range(repeat):
+        started = time.process_time()
+        func()
+        samples.append(time.process_time() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--periods", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+
+    bodies: dict[str, List[bytes]] = {}
+    with benchmark_app(
+        args.database_url, args.drop_tables, COMPRESSION_ENABLED=False
+    ) as app:
+        user_id = seed_user(period_count=args.periods)
+        client = app.test_client()
+        headers = {
+            "Authorization": f"Bearer {create_access_token(identity=str(user_id))}"
+        }
+        for path in ENDPOINTS:
+            response = client.get(path, headers=headers)
+            assert response.status_code == 200, (path, response.status_code)
+            chunks = [bytes(chunk) for chunk in response.response]
+            # Buffered responses are compressed whole
+            bodies[path] = chunks if response.is_streamed else [b"".join(chunks)]
+
+    print(f"{args.periods} periods (median CPU time of {args.repeat} compressions)")
+    for path, chunks in bodies.items():
+        size = sum(map(len, chunks))
+        streamed = len(chunks) > 1
+        print(f"\n{path}  {size:,} bytes{', streamed' if streamed else ''}")
+        for encoding, level in SETTINGS:
+            if streamed:
+
+                def run(encoding=encoding, level=level):
+                    return b"".join(compress_stream(iter(chunks), encoding, level))
+
+            else:
+
+                def run(encoding=encoding, level=level):
+                    return compress(chunks[0], encoding, level)
+
+            compressed = len(run())
+            seconds = cpu_time(run, args.repeat)
+            saved = size - compressed
+            print(
+                f"  {encoding:4s} {level:2d}  {compressed:9,} bytes"
+                f"  saved {saved / size:6.1%}  cpu {seconds * 1000:8.3f} ms"
+                f"  {saved / max(seconds * 1000, 0.001):12,.0f} bytes/ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
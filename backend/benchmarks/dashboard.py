@@ -0,0 +1,92 @@
+"""
+End-to-end time of loading the dashboard: seven requests versus one bundle.
+
+Measures the server time of the seven calls the frontend makes on load
+(/users/me, /periods/active and five /reports/* endpoints) and of a single
+GET /reports/dashboard, then adds ``--rtt-ms`` of network latency per round
+trip. Two client models are shown for the separate calls: sequential
+requests, and ``--parallel`` requests in flight at once (browsers open about
+six connections per host over HTTP/1.1).
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.dashboard --periods 120 --rtt-ms 150
+"""
+
+import argparse
+import datetime
+import math
+import statistics
+import time
+
+from flask_jwt_extended import create_access_token
+
+from app.services import PeriodService
+from benchmarks.common import add_database_arguments, benchmark_app, seed_user
+
+SEPARATE_CALLS = [
+    "/users/me",
+    "/periods/active",
+    "/reports/cycle-context",
+    "/reports/cycle-stats",
+    "/reports/period-stats",
+    "/reports/predicted-next-period",
+    "/reports/ovulation-window",
+]
+
+
+def time_calls(client, headers, paths, repeat: int) -> list[float]:
+    """Server time (seconds) to answer every path once, per repetition."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for path in paths:
+            response = client.get(path, headers=headers)
+            assert response.status_code == 200, (path, response.status_code)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--periods", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=150.0)
+    parser.add_argument("--parallel", type=int, default=6)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+
+    with benchmark_app(args.database_url, args.drop_tables) as app:
+        user_id = seed_user(period_count=args.periods)
+        # An ongoing period, so /periods/active has something to return
+        PeriodService.record_period_start(user_id, datetime.date.today())
+        client = app.test_client()
+        headers = {
+            "Authorization": f"Bearer {create_access_token(identity=str(user_id))}"
+        }
+
+        separate = statistics.median(
+            time_calls(client, headers, SEPARATE_CALLS, args.repeat)
+        )
+        bundle = statistics.median(
+            time_calls(client, headers, ["/reports/dashboard"], args.repeat)
+        )
+
+    rtt = args.rtt_ms / 1000
+    round_trips = math.ceil(len(SEPARATE_CALLS) / args.parallel)
+    rows = [
+        ("7 calls, sequential", separate, separate + len(SEPARATE_CALLS) * rtt),
+        # Requests in flight together share the wire; server time still adds up
+        (f"7 calls, {args.parallel} parallel", separate, separate + round_trips * rtt),
+        ("1 dashboard call", bundle, bundle + rtt),
+    ]
+    print(f"{args.periods} periods, {args.rtt_ms:.0f} ms RTT (median server time)")
+    for label, server, total in rows:
+        print(
+            f"{label:22s} server {server * 1000:7.2f} ms"
+            f"   end-to-end {total * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
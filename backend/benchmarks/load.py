@@ -0,0 +1,165 @@
+"""
+Helpers for the load tests, which run the app in real server processes.
+
+Unlike ``benchmarks.common`` this module does not import the app at import
+time: the app reads its configuration from the environment when it is
+imported, so ``seeded_environment`` sets that up first.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from http.client import HTTPConnection
+from typing import Dict, Iterator, List, Tuple
+
+PATHS = [
+    "/reports/cycle-context",
+    "/reports/cycle-stats",
+    "/reports/period-stats",
+    "/reports/predicted-next-period",
+    "/periods?per_page=10",
+]
+
+
+def seeded_environment(
+    tmpdir: str, users: int, periods_per_user: int, **overrides: str
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Seeds a SQLite database in ``tmpdir`` with ``flask seed``.
+
+    Returns the environment for server processes using it (production
+    config) and an access token for each seeded user.
+    """
+    env = {
+        **os.environ,
+        "FLASK_APP": "app:create_app()",
+        "FLASK_ENV": "production",
+        "DB_TYPE": "sqlite",
+        "SQLITE_PATH": os.path.join(tmpdir, "load.db"),
+        "JWT_SECRET_KEY": "load-test",
+        "JWT_ACCESS_TOKEN_EXPIRES": "86400",
+        "PASSWORD_HASH_WORKERS": "0",
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(tmpdir, "metrics"),
+        **overrides,
+    }
+    os.makedirs(env["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+    os.environ.update(env)
+    from flask_jwt_extended import create_access_token
+
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        result = app.test_cli_runner().invoke(
+            args=[
+                "seed",
+                "--users",
+                str(users),
+                "--periods-per-user",
+                str(periods_per_user),
+            ]
+        )
+        assert result.exit_code == 0, result.output
+        tokens = [
+            create_access_token(identity=str(uid), additional_claims={"ver": 0})
+            for uid in range(1, users + 1)
+        ]
+    return env, tokens
+
+
+@contextmanager
+def serve(args: List[str], env: Dict[str, str], port: int) -> Iterator[None]:
+    """Runs ``python <args>`` until the block exits, once /health answers."""
+    server = subprocess.Popen(
+        [sys.executable, *args], env=env, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_up(port)
+        yield
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def wait_until_up(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health"):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+def run_load(port: int, tokens: List[str], concurrency: int, duration: float) -> dict:
+    """Keeps ``concurrency`` clients busy for ``duration`` seconds."""
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(concurrency + 1)
+    stop_at = 0.0
+
+    def client():
+        nonlocal errors
+        rng = random.Random()
+        connection = HTTPConnection("127.0.0.1", port, timeout=60)
+        local, failed = [], 0
+        start_barrier.wait()
+        while time.perf_counter() < stop_at:
+            headers = {"Authorization": f"Bearer {rng.choice(tokens)}"}
+            started = time.perf_counter()
+            try:
+                connection.request("GET", rng.choice(PATHS), headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+            except OSError:
+                failed += 1
+                connection.close()
+                connection = HTTPConnection("127.0.0.1", port, timeout=60)
+            local.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors += failed
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    stop_at = time.perf_counter() + duration
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / duration,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)],
+        "errors": errors,
+    }
+
+
+def measure(port: int, tokens: List[str], concurrency: int, duration: float) -> dict:
+    """``run_load`` after a short warm-up of caches and connection pools."""
+    run_load(port, tokens, 20, 2)
+    return run_load(port, tokens, concurrency, duration)
+
+
+def format_result(label: str, result: dict) -> str:
+    return (
+        f"{label:28s} {result['rps']:8.1f} req/s"
+        f"   p50 {result['p50'] * 1000:8.1f} ms"
+        f"   p99 {result['p99'] * 1000:8.1f} ms"
+        f"   errors {result['errors']}"
+    )
@@ -0,0 +1,62 @@
+"""
+Wall time of a bulk period import through POST /periods/bulk.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.period_import --rows 10000
+"""
+
+import argparse
+import datetime
+import time
+
+from flask_jwt_extended import create_access_token
+
+from benchmarks.common import add_database_arguments, benchmark_app, seed_user
+
+
+def build_records(count: int) -> list[dict]:
+    start = datetime.date(1200, 1, 1)
+    records = []
+    for _ in range(count):
+        end = start + datetime.timedelta(days=4)
+        records.append({"start_date": start.isoformat(), "end_date": end.isoformat()})
+        start += datetime.timedelta(days=28)
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+
+    records = build_records(args.rows)
+    csv_body = "start_date,end_date\n" + "".join(
+        f"{r['start_date']},{r['end_date']}\n" for r in records
+    )
+
+    with benchmark_app(args.database_url, args.drop_tables) as app:
+        client = app.test_client()
+        for fmt in ("json", "csv"):
+            user_id = seed_user(username=f"bench_{fmt}")
+            headers = {
+                "Authorization": f"Bearer {create_access_token(identity=str(user_id))}"
+            }
+            started = time.perf_counter()
+            if fmt == "json":
+                response = client.post("/periods/bulk", json=records, headers=headers)
+            else:
+                response = client.post(
+                    "/periods/bulk",
+                    data=csv_body,
+                    content_type="text/csv",
+                    headers=headers,
+                )
+            elapsed = time.perf_counter() - started
+            assert response.status_code == 201, response.get_json()
+            print(f"{fmt:4s}: {args.rows} rows imported in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Query plans and latencies of the per-user period queries, with and without
+the indexes declared on ``Period.__table_args__``.
+
+Seeds a standalone database (a temporary SQLite file unless ``--database-url``
+is given), runs the hot queries issued by ``PeriodService``/``ReportService``
+without the indexes, creates them, and runs the same queries again.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.period_indexes --rows 1000000 --users 10000
+    python -m benchmarks.period_indexes --database-url postgresql://...
+"""
+
+import argparse
+import datetime
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, select, text
+
+from app.models import Period, User
+
+periods = Period.__table__
+users = User.__table__
+
+
+def hot_queries(user_id: int, period_id: int) -> dict:
+    """The statements the services issue on every request, keyed by name."""
+    return {
+        "report_history": select(periods.c.start_date, periods.c.end_date, periods.c.id)
+        .where(periods.c.user_id == user_id)
+        .order_by(periods.c.start_date, periods.c.id),
+        "active_period": select(periods).where(
+            periods.c.user_id == user_id, periods.c.end_date.is_(None)
+        ),
+        "period_by_id": select(periods).where(
+            periods.c.id == period_id, periods.c.user_id == user_id
+        ),
+        "list_page": select(periods)
+        .where(periods.c.user_id == user_id)
+        .order_by(periods.c.start_date.desc())
+        .limit(10),
+    }
+
+
+def seed(engine, total_rows: int, user_count: int, batch_size: int = 50_000) -> None:
+    """Fills the (freshly created) tables with synthetic users and periods."""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(users),
+            [
+                {
+                    "id": uid,
+                    "username": f"bench{uid}",
+                    "email": f"bench{uid}@example.com",
+                    "password_hash": "x",
+                }
+                for uid in range(1, user_count + 1)
+            ],
+        )
+
+    per_user = max(total_rows // user_count, 1)
+    base = datetime.date(2000, 1, 1)
+    batch = []
+    with engine.begin() as conn:
+        for uid in range(1, user_count + 1):
+            start = base + datetime.timedelta(days=random.randint(0, 30))
+            for n in range(per_user):
+                ongoing = n == per_user - 1 and random.random() < 0.3
+                end = None if ongoing else start + datetime.timedelta(days=4)
+                batch.append({"user_id": uid, "start_date": start, "end_date": end})
+                start += datetime.timedelta(days=random.randint(24, 35))
+            if len(batch) >= batch_size:
+                conn.execute(insert(periods), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(periods), batch)
+
+
+def drop_indexes(engine) -> None:
+    for index in periods.indexes:
+        index.drop(engine, checkfirst=True)
+
+
+def create_indexes(engine) -> None:
+    for index in periods.indexes:
+        index.create(engine, checkfirst=True)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def explain(conn, statement) -> str:
+    compiled = statement.compile(conn, compile_kwargs={"literal_binds": True})
+    if conn.dialect.name == "sqlite":
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        return "\n".join(f"    {row[-1]}" for row in rows)
+    rows = conn.execute(text(f"EXPLAIN ANALYZE {compiled}")).all()
+    return "\n".join(f"    {row[0]}" for row in rows)
+
+
+def measure(engine, samples: list[tuple[int, int]]) -> dict[str, list[float]]:
+    """Runs every hot query for each sampled (user_id, period_id)."""
+    timings: dict[str, list[float]] = {}
+    with engine.connect() as conn:
+        for user_id, period_id in samples:
+            for name, statement in hot_queries(user_id, period_id).items():
+                started = time.perf_counter()
+                conn.execute(statement).all()
+                timings.setdefault(name, []).append(time.perf_counter() - started)
+    return timings
+
+
+def report(label: str, engine, samples, timings) -> None:
+    print(f"\n=== {label} ===")
+    with engine.connect() as conn:
+        for name, statement in hot_queries(*samples[0]).items():
+            values = sorted(timings[name])
+            p95 = values[int(len(values) * 0.95) - 1] if len(values) > 1 else values[0]
+            print(
+                f"{name:16s} mean {statistics.mean(values) * 1000:8.3f} ms"
+                f"   p95 {p95 * 1000:8.3f} ms"
+            )
+            print(explain(conn, statement))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    tmpdir = None
+    url = args.database_url
+    if url is None:
+        tmpdir = tempfile.mkdtemp()
+        url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+
+    engine = create_engine(url)
+    # Fails loudly on a non-empty database instead of touching existing tables
+    users.create(engine)
+    periods.create(engine)
+    drop_indexes(engine)
+    try:
+        started = time.perf_counter()
+        seed(engine, args.rows, args.users)
+        print(f"Seeded {args.rows} periods in {time.perf_counter() - started:.1f}s")
+
+        with engine.connect() as conn:
+            max_id = conn.execute(select(periods.c.id).order_by(periods.c.id.desc()))
+            max_id = max_id.scalar()
+        samples = [
+            (random.randint(1, args.users), random.randint(1, max_id))
+            for _ in range(args.samples)
+        ]
+
+        report("without indexes", engine, samples, measure(engine, samples))
+        create_indexes(engine)
+        report("with indexes", engine, samples, measure(engine, samples))
+    finally:
+        periods.drop(engine)
+        users.drop(engine)
+        engine.dispose()
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Latency of GET /periods pages with OFFSET versus cursor (keyset) pagination.
+
+Seeds one user with a long history and times page 1 and a deep page with
+both ``PeriodService.get_all_periods_for_user`` and
+``PeriodService.get_periods_page_for_user``. Keyset latency should stay flat.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.period_pagination --periods 20000 --deep-page 500
+"""
+
+import argparse
+import statistics
+import time
+
+from app.services import PeriodService
+from benchmarks.common import add_database_arguments, benchmark_app, seed_user
+
+
+def timed(func, repeat: int) -> float:
+    """Median wall time of ``func`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--periods", type=int, default=20_000)
+    parser.add_argument("--per-page", type=int, default=10)
+    parser.add_argument("--deep-page", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+
+    with benchmark_app(args.database_url, args.drop_tables):
+        user_id = seed_user(period_count=args.periods)
+
+        # Walk the cursors once to find the one pointing at the deep page
+        cursors = {1: None}
+        cursor = None
+        for page in range(2, args.deep_page + 1):
+            _, cursor = PeriodService.get_periods_page_for_user(
+                user_id, cursor, args.per_page
+            )
+            cursors[page] = cursor
+
+        print(f"{args.periods} periods, {args.per_page} per page")
+        for page in (1, args.deep_page):
+            offset_ms = timed(
+                lambda: PeriodService.get_all_periods_for_user(
+                    user_id, page=page, per_page=args.per_page
+                ),
+                args.repeat,
+            )
+            cursor_ms = timed(
+                lambda: PeriodService.get_periods_page_for_user(
+                    user_id, cursors[page], args.per_page
+                ),
+                args.repeat,
+            )
+            print(
+                f"page {page:5d}: offset {offset_ms:7.3f} ms   "
+                f"cursor {cursor_ms:7.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Connection pool behaviour as concurrency outgrows it.
+
+Runs ``--concurrency`` threads that each check out a connection, run a
+query and hold the connection for ``--hold-ms`` (standing in for query and
+network time on a remote database), for every pool setting below. Opening
+a connection sleeps ``--connect-ms``, standing in for the TCP, TLS and
+authentication handshake a PostgreSQL or PgBouncer connection costs.
+Reports throughput, checkout wait p50/p99 (the db_pool_checkout_wait_seconds
+metric) and checkouts that timed out after ``--pool-timeout`` seconds.
+
+- queue 5+0: five connections, no overflow
+- queue 5+10: the defaults
+- queue 30+10: a pool larger than the concurrency
+- null: a new connection per checkout (the PgBouncer mode)
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.pool_saturation --concurrency 8 32 64
+"""
+
+import argparse
+import threading
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.extensions import db
+from benchmarks.auth_login import percentile
+from benchmarks.common import benchmark_app
+
+POOLS = {
+    "queue 5+0": {"DB_POOL_SIZE": 5, "DB_MAX_OVERFLOW": 0},
+    "queue 5+10": {"DB_POOL_SIZE": 5, "DB_MAX_OVERFLOW": 10},
+    "queue 30+10": {"DB_POOL_SIZE": 30, "DB_MAX_OVERFLOW": 10},
+    "null": {"DB_POOL_MODE": "null"},
+}
+
+
+def run_load(engine, concurrency: int, checkouts: int, hold: float) -> dict:
+    """``checkouts`` checkouts, split over ``concurrency`` threads."""
+    waits: list[float] = []
+    timeouts = 0
+    lock = threading.Lock()
+    per_thread = checkouts // concurrency
+
+    def worker():
+        nonlocal timeouts
+        local, failed = [], 0
+        for _ in range(per_thread):
+            started = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    local.append(time.perf_counter() - started)
+                    connection.execute(text("SELECT 1"))
+                    time.sleep(hold)
+            except PoolTimeoutError:
+                failed += 1
+        with lock:
+            waits.extend(local)
+            timeouts += failed
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "rate": len(waits) / elapsed,
+        "p50": percentile(waits, 0.5) if waits else 0.0,
+        "p99": percentile(waits, 0.99) if waits else 0.0,
+        "timeouts": timeouts,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--checkouts", type=int, default=2000)
+    parser.add_argument("--hold-ms", type=float, default=5)
+    parser.add_argument("--connect-ms", type=float, default=3)
+    parser.add_argument("--pool-timeout", type=int, default=2)
+    args = parser.parse_args()
+
+    def slow_connect(dbapi_connection, connection_record):
+        time.sleep(args.connect_ms / 1000)
+
+    print(
+        f"hold {args.hold_ms} ms, connect {args.connect_ms} ms, "
+        f"pool timeout {args.pool_timeout} s; checkout wait p50/p99"
+    )
+    for label, settings in POOLS.items():
+        with benchmark_app(DB_POOL_TIMEOUT=args.pool_timeout, **settings):
+            engine = db.engine
+            event.listen(engine, "connect", slow_connect)
+            for concurrency in args.concurrency:
+                engine.dispose()
+                result = run_load(
+                    engine, concurrency, args.checkouts, args.hold_ms / 1000
+                )
+                print(
+                    f"{label:12s} x{concurrency:<4d}"
+                    f" {result['rate']:8.0f} checkouts/s"
+                    f"   wait p50 {result['p50'] * 1000:7.2f} ms"
+                    f"   p99 {result['p99'] * 1000:8.2f} ms"
+                    f"   timeouts {result['timeouts']}"
+                )
+            event.remove(engine, "connect", slow_connect)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Wall time of ``flask analytics population`` on a synthetic population.
+
+Seeds ``--rows`` periods spread over ``--users`` users, then runs the
+vectorised batch job (without writing the per-user CSV unless asked) and
+reports rows per second. The target is 10M periods in under a minute.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.population_analytics --rows 10000000 --users 200000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import insert
+
+from app.extensions import db
+from app.models import Period, User
+from app.services.population_analytics import PopulationAnalytics
+from benchmarks.common import add_database_arguments, benchmark_app
+
+
+def seed(total_rows: int, user_count: int, batch_size: int = 100_000) -> None:
+    db.session.execute(
+        insert(User),
+        [
+            {
+                "id": uid,
+                "username": f"bench{uid}",
+                "email": f"bench{uid}@example.com",
+                "password_hash": "x",
+            }
+            for uid in range(1, user_count + 1)
+        ],
+    )
+    per_user = max(total_rows // user_count, 1)
+    base = datetime.date(1900, 1, 1)
+    batch = []
+    for uid in range(1, user_count + 1):
+        start = base + datetime.timedelta(days=random.randint(0, 30))
+        for n in range(per_user):
+            ongoing = n == per_user - 1 and random.random() < 0.3
+            end = None if ongoing else start + datetime.timedelta(random.randint(3, 7))
+            batch.append({"user_id": uid, "start_date": start, "end_date": end})
+            start += datetime.timedelta(days=random.randint(24, 35))
+        if len(batch) >= batch_size:
+            db.session.execute(insert(Period), batch)
+            batch.clear()
+    if batch:
+        db.session.execute(insert(Period), batch)
+    db.session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--users-csv", action="store_true", help="Also write CSV")
+    add_database_arguments(parser)
+    args = parser.parse_args()
+
+    with benchmark_app(args.database_url, args.drop_tables) as app:
+        started = time.perf_counter()
+        seed(args.rows, args.users)
+        print(f"Seeded {args.rows} periods in {time.perf_counter() - started:.1f}s")
+
+        command = ["analytics", "population", "--chunk-size", str(args.chunk_size)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            command += ["--summary-json", os.path.join(tmpdir, "summary.json")]
+            if args.users_csv:
+                command += ["--users-csv", os.path.join(tmpdir, "users.csv")]
+            started = time.perf_counter()
+            result = app.test_cli_runner().invoke(args=command)
+            elapsed = time.perf_counter() - started
+        assert result.exit_code == 0, result.output
+
+        started = time.perf_counter()
+        PopulationAnalytics().run(chunk_size=args.chunk_size)
+        compute_only = time.perf_counter() - started
+
+    print(
+        f"analytics population: {elapsed:.1f}s "
+        f"({args.rows / elapsed / 1e6:.2f}M periods/s); "
+        f"without output: {compute_only:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+ReportService and period listing micro-benchmarks on synthetic histories.
+
+Seeds one user per ``--sizes`` entry (10, 100, 1,000 and 10,000 periods by
+default) and measures every report read plus ``get_all_periods_for_user``:
+median wall time over ``--repeat`` calls, SQL statements per call and peak
+Python memory of one call (tracemalloc). The report cache is disabled, so
+each call pays for its database reads. ``compute`` is the full-history
+recompute behind a summary rebuild, the one operation expected to grow
+with history length.
+
+Results are printed as JSON (or written to ``--output``) so runs can be
+compared across commits; ``--compare`` flags operations whose fastest
+call is slower than the baseline's by more than ``--threshold`` (and
+``--min-delta-ms``) or that issue more queries, and exits with status 1
+if there are any.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.reports --output baseline.json
+    python -m benchmarks.reports --compare baseline.json --threshold 0.2
+    python -m benchmarks.reports --database-url postgresql://localhost/bench --drop-tables
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+
+from app.extensions import db
+from app.services import CycleSummaryService, PeriodService, ReportService
+from benchmarks.common import add_database_arguments, benchmark_app, seed_user
+
+OPERATIONS: Dict[str, Callable[[int], object]] = {
+    "get_period_stats": ReportService.get_period_stats,
+    "get_cycle_stats": ReportService.get_cycle_stats,
+    "get_predicted_next_period": ReportService.get_predicted_next_period,
+    "get_estimated_ovulation": ReportService.get_estimated_ovulation,
+    "get_cycle_context": ReportService.get_cycle_context,
+    "get_all_periods_for_user": PeriodService.get_all_periods_for_user,
+    "compute": CycleSummaryService.compute,
+}
+
+
+def count_queries(func: Callable[[], object]) -> int:
+    """Number of SQL statements ``func`` executes."""
+    statements = []
+
+    def before_cursor_execute(*args):
+        statements.append(args[2])
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Peak bytes allocated by Python while running ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+        # Every call starts from an empty identity map, as a request would
+        db.session.expire_all()
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+        "queries": count_queries(func),
+        "peak_kb": round(peak_memory(func) / 1024, 1),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: List[int], repeat: int) -> Dict[str, object]:
+    results = []
+    for size in sizes:
+        user_id = seed_user(f"bench{size}", period_count=size)
+        # Builds the user's summary, as the first read after a deploy would
+        ReportService.get_snapshot(user_id)
+        db.session.commit()
+        for name, operation in OPERATIONS.items():
+            stats = measure(lambda: operation(user_id), repeat)
+            results.append({"operation": name, "periods": size, **stats})
+            print(
+                f"{name:28s} {size:6d} periods  {stats['median_ms']:9.3f} ms"
+                f"  {stats['queries']:3d} queries  {stats['peak_kb']:9.1f} KiB",
+                file=sys.stderr,
+            )
+    return {
+        "commit": git_commit(),
+        "database": db.engine.dialect.name,
+        "python": platform.python_version(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, object],
+    baseline: Dict[str, object],
+    threshold: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """Describes every operation that regressed against the baseline."""
+    previous = {(r["operation"], r["periods"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["operation"], result["periods"]))
+        if before is None:
+            continue
+        label = f"{result['operation']} ({result['periods']} periods)"
+        # Minimum times are the least noisy for sub-millisecond calls, and
+        # tiny absolute differences are not regressions
+        delta = result["min_ms"] - before["min_ms"]
+        if delta > min_delta_ms and delta > before["min_ms"] * threshold:
+            regressions.append(
+                f"{label}: {before['min_ms']:.3f} -> "
+                f"{result['min_ms']:.3f} ms (+{delta / before['min_ms']:.0%})"
+            )
+        if result["queries"] > before["queries"]:
+            regressions.append(
+                f"{label}: {before['queries']} -> {result['queries']} queries"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000]
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Baseline JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (default 0.2 = 20%%)",
+    )
+    parser.add_argument("--min-delta-ms", type=float, default=0.1)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+
+    with benchmark_app(args.database_url, args.drop_tables):
+        current = run(args.sizes, args.repeat)
+
+    rendered = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(rendered + "\n")
+    else:
+        print(rendered)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
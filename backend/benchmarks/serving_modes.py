@@ -0,0 +1,74 @@
+"""
+Load test of the read endpoints across gunicorn worker classes.
+
+Seeds a SQLite database with ``flask seed`` and serves it with gunicorn
+through ``gunicorn.conf.py`` once per ``--worker-classes`` entry (``sync``,
+``gthread`` with ``--threads`` threads, ``gevent`` with
+``--worker-connections``), each with ``--workers`` processes. Every run is
+driven by ``--concurrency`` keep-alive clients on /reports/* and GET
+/periods for ``--duration`` seconds; requests/sec, p50 and p99 latency and
+non-200 responses are reported per class.
+
+This is the comparison behind serving the app with threaded or green
+workers rather than through an ASGI server (see gunicorn.conf.py). gevent
+runs are skipped when the ``gevent`` extra is not installed.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.serving_modes --concurrency 200 --duration 15
+    python -m benchmarks.serving_modes --workers 3 --worker-classes sync gthread
+"""
+
+import argparse
+import importlib.util
+import tempfile
+
+from benchmarks.load import format_result, measure, seeded_environment, serve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--worker-classes", nargs="+", default=["sync", "gthread", "gevent"]
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--worker-connections", type=int, default=100)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--periods-per-user", type=int, default=24)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=5079)
+    args = parser.parse_args()
+
+    env, tokens = seeded_environment(
+        tempfile.mkdtemp(), args.users, args.periods_per_user
+    )
+    print(
+        f"{args.concurrency} clients, {args.duration:.0f}s per run, "
+        f"{args.users} users x {args.periods_per_user} periods"
+    )
+    for worker_class in args.worker_classes:
+        label = f"{worker_class} x{args.workers}"
+        if worker_class == "gthread":
+            label += f" ({args.threads} threads)"
+        elif worker_class == "gevent":
+            if importlib.util.find_spec("gevent") is None:
+                print(f"{label:28s} skipped: install the gevent extra")
+                continue
+            label += f" ({args.worker_connections} connections)"
+        run_env = {
+            **env,
+            "GUNICORN_BIND": f"127.0.0.1:{args.port}",
+            "GUNICORN_WORKER_CLASS": worker_class,
+            "GUNICORN_WORKERS": str(args.workers),
+            "GUNICORN_THREADS": str(args.threads),
+            "GUNICORN_WORKER_CONNECTIONS": str(args.worker_connections),
+        }
+        with serve(["-m", "gunicorn", "app:create_app()"], run_env, args.port):
+            result = measure(args.port, tokens, args.concurrency, args.duration)
+        print(format_result(label, result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Concurrent reads and writes on SQLite, with and without the tuned pragmas.
+
+Forks ``--readers`` and ``--writers`` processes (standing in for gunicorn
+workers) on one SQLite file for ``--duration`` seconds. Readers load a
+random user's cycle context and latest periods; writers import one period
+at a time for their own user, each import a write transaction that also
+rebuilds the user's cycle summary. Reports reads/s, writes/s, p99 read and
+write latency, and operations that failed with "database is locked", for:
+
+- rollback journal: SQLite's defaults (journal_mode=DELETE,
+  synchronous=FULL, no mmap, small page cache) with ``--busy-timeout-ms``
+- tuned: the SQLITE_* defaults of Config (WAL, synchronous=NORMAL, mmap,
+  a larger cache, temp_store=MEMORY)
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.sqlite_concurrency --readers 4 --writers 2
+"""
+
+import argparse
+import datetime
+import multiprocessing
+import random
+import time
+
+from sqlalchemy.exc import OperationalError
+
+from app.extensions import db
+from app.services import PeriodService, ReportService
+from app.utils.exceptions import PeriodLogicError
+from benchmarks.auth_login import percentile
+from benchmarks.common import benchmark_app, seed_user
+
+
+def variants(busy_timeout_ms: int) -> dict:
+    return {
+        "rollback journal": {
+            "SQLITE_JOURNAL_MODE": "DELETE",
+            "SQLITE_SYNCHRONOUS": "FULL",
+            "SQLITE_BUSY_TIMEOUT": busy_timeout_ms,
+            "SQLITE_CACHE_SIZE": None,
+            "SQLITE_MMAP_SIZE": None,
+            "SQLITE_TEMP_STORE": None,
+        },
+        "tuned": {"SQLITE_BUSY_TIMEOUT": busy_timeout_ms},
+    }
+
+
+def reader(user_ids, duration, results) -> None:
+    db.engine.dispose(close=False)
+    rng = random.Random()
+    latencies, locked = [], 0
+    stop_at = time.perf_counter() + duration
+    while time.perf_counter() < stop_at:
+        user_id = rng.choice(user_ids)
+        started = time.perf_counter()
+        try:
+            ReportService.get_cycle_context(user_id)
+            PeriodService.get_all_periods_for_user(user_id)
+            latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            locked += 1
+        finally:
+            db.session.remove()
+    results.put(("read", latencies, locked))
+
+
+def writer(user_id, duration, results) -> None:
+    db.engine.dispose(close=False)
+    start = datetime.date(1900, 1, 1)
+    latencies, locked = [], 0
+    stop_at = time.perf_counter() + duration
+    while time.perf_counter() < stop_at:
+        record = {
+            "start_date": start.isoformat(),
+            "end_date": (start + datetime.timedelta(days=4)).isoformat(),
+        }
+        started = time.perf_counter()
+        try:
+            PeriodService.import_periods(user_id, [record])
+            latencies.append(time.perf_counter() - started)
+            start += datetime.timedelta(days=28)
+        except (OperationalError, PeriodLogicError):
+            locked += 1
+        finally:
+            db.session.remove()
+    results.put(("write", latencies, locked))
+
+
+def run(settings: dict, args) -> dict:
+    with benchmark_app(**settings):
+        readable = [seed_user(f"reader{i}", args.periods) for i in range(args.users)]
+        writable = [seed_user(f"writer{i}") for i in range(args.writers)]
+        for user_id in readable:
+            ReportService.get_snapshot(user_id)  # Build the summaries up front
+        db.session.remove()
+        db.engine.dispose()
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        processes = [
+            context.Process(target=reader, args=(readable, args.duration, results))
+            for _ in range(args.readers)
+        ] + [
+            context.Process(target=writer, args=(user_id, args.duration, results))
+            for user_id in writable
+        ]
+        for process in processes:
+            process.start()
+        collected = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    reads = [x for kind, lat, _ in collected if kind == "read" for x in lat]
+    writes = [x for kind, lat, _ in collected if kind == "write" for x in lat]
+    return {
+        "reads": len(reads) / args.duration,
+        "writes": len(writes) / args.duration,
+        "read_p99": percentile(reads, 0.99) if reads else 0.0,
+        "write_p99": percentile(writes, 0.99) if writes else 0.0,
+        "locked": sum(locked for _, _, locked in collected),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--periods", type=int, default=60)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--busy-timeout-ms", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(
+        f"{args.readers} readers, {args.writers} writers, {args.duration:.0f}s, "
+        f"busy timeout {args.busy_timeout_ms} ms"
+    )
+    for label, settings in variants(args.busy_timeout_ms).items():
+        result = run(settings, args)
+        print(
+            f"{label:18s} {result['reads']:7.0f} reads/s"
+            f"   {result['writes']:6.0f} writes/s"
+            f"   read p99 {result['read_p99'] * 1000:7.1f} ms"
+            f"   write p99 {result['write_p99'] * 1000:7.1f} ms"
+            f"   locked {result['locked']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
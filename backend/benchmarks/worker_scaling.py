@@ -0,0 +1,69 @@
+"""
+Load test of gunicorn throughput against worker count.
+
+Seeds a SQLite database with ``flask seed``, then serves it with gunicorn
+through ``gunicorn.conf.py`` (so preloading, the post-fork engine reset and
+worker recycling are exercised) once per ``--workers`` value, and drives it
+with ``--concurrency`` keep-alive clients on the read routes for
+``--duration`` seconds. Reports requests/sec, p50 and p99 latency, and
+non-200 responses per worker count.
+
+Throughput stops growing once the workers saturate the CPUs: compare the
+counts with the ``cpus`` line, which is what the config derives its
+default (``2 * cpus + 1``) from.
+
+Usage (from the ``backend`` directory):
+
+    python -m benchmarks.worker_scaling --workers 1 2 4 8
+    python -m benchmarks.worker_scaling --worker-class gthread --threads 4
+"""
+
+import argparse
+import os
+import runpy
+import tempfile
+
+from benchmarks.load import format_result, measure, seeded_environment, serve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--worker-class", default="sync")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--periods-per-user", type=int, default=24)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--port", type=int, default=5078)
+    args = parser.parse_args()
+
+    env, tokens = seeded_environment(
+        tempfile.mkdtemp(), args.users, args.periods_per_user
+    )
+    conf = runpy.run_path(
+        os.path.join(os.path.dirname(__file__), "..", "gunicorn.conf.py")
+    )
+    print(
+        f"cpus {conf['cpus']}, {args.concurrency} clients, "
+        f"{args.duration:.0f}s per run, "
+        f"{args.users} users x {args.periods_per_user} periods"
+    )
+    for workers in args.workers:
+        run_env = {
+            **env,
+            "GUNICORN_BIND": f"127.0.0.1:{args.port}",
+            "GUNICORN_WORKER_CLASS": args.worker_class,
+            "GUNICORN_WORKERS": str(workers),
+            "GUNICORN_THREADS": str(args.threads),
+        }
+        with serve(["-m", "gunicorn", "app:create_app()"], run_env, args.port):
+            result = measure(args.port, tokens, args.concurrency, args.duration)
+        label = f"{args.worker_class} x{workers}"
+        if args.worker_class == "gthread":
+            label += f" ({args.threads} threads)"
+        print(format_result(label, result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Gunicorn settings, read from the working directory (``/app`` in the image).
+
+Every setting can be tuned through the environment (the Helm chart sets
+these from ``gunicorn`` in values.yaml):
+
+- GUNICORN_BIND: address to listen on (``0.0.0.0:5000``)
+- GUNICORN_WORKER_CLASS: ``sync``, ``gthread`` or ``gevent`` (``sync``)
+- GUNICORN_WORKERS: worker processes (``2 * CPUs + 1`` for sync and
+  gthread, ``CPUs`` for gevent)
+- GUNICORN_THREADS: threads per gthread worker (4)
+- GUNICORN_WORKER_CONNECTIONS: concurrent requests per gevent worker (100)
+- GUNICORN_PRELOAD: import the app once in the master before forking, so
+  workers share its memory and start faster (``true``)
+- GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER: recycle each
+  worker after about this many requests to bound slow leaks (1000 / 100)
+- GUNICORN_TIMEOUT: seconds before a silent worker is killed (30)
+
+There is no ASGI mode. Flask dispatches views synchronously, so an ASGI
+server would only run them on a thread pool, which is what gthread workers
+do; async database sessions would need async copies of the services
+without freeing any threads. ``python -m benchmarks.serving_modes``
+compares the worker classes with 200 clients on /reports/* and GET
+/periods. On one CPU with SQLite, one process each:
+
+    sync x1                  283 req/s   p50  659 ms   p99 1184 ms
+    gthread x1 (4 threads)   289 req/s   p50  341 ms   p99 5092 ms
+
+The reads are CPU-bound, so throughput is the same; threads halve the
+median wait but, with 200 connections per process, leave a long tail.
+Threaded or green workers pay off when requests wait on a remote database.
+
+The CPU count is the smaller of the CPUs this process may run on and the
+container's cgroup CPU limit (rounded up), so a pod limited to ``500m``
+runs three sync workers rather than one per host core.
+
+Prometheus metrics are aggregated across worker processes through files in
+PROMETHEUS_MULTIPROC_DIR, which must be set, and exist, before the app
+(and so prometheus_client) is imported. With GUNICORN_PRELOAD that happens
+in the master before any server hook runs, so the directory is prepared
+here, when gunicorn reads this file: the default directory is recreated
+empty, while in one set through the environment only the metric files
+(``*.db``) are removed.
+"""
+
+import glob
+import math
+import os
+import shutil
+from typing import Optional
+
+DEFAULT_METRICS_DIR = "/tmp/cycle-tracker-metrics"
+
+# Values left over from a previous run would be summed into the new ones
+if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+    # Chosen by the operator: never delete anything but our own files
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+    for path in glob.glob(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], "*.db")):
+        os.remove(path)
+else:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = DEFAULT_METRICS_DIR
+    shutil.rmtree(DEFAULT_METRICS_DIR, ignore_errors=True)
+    os.makedirs(DEFAULT_METRICS_DIR)
+
+from prometheus_client import multiprocess  # noqa: E402
+
+WORKER_CLASSES = ("sync", "gthread", "gevent")
+
+
+def cgroup_cpu_limit(root: str = "/sys/fs/cgroup") -> Optional[float]:
+    """The cgroup CPU quota in CPUs (v2 or v1), or None if unlimited."""
+    try:
+        with open(os.path.join(root, "cpu.max")) as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        try:
+            with open(os.path.join(root, "cpu", "cpu.cfs_quota_us")) as f:
+                quota = f.read().strip()
+            with open(os.path.join(root, "cpu", "cpu.cfs_period_us")) as f:
+                period = f.read().strip()
+        except OSError:
+            return None
+    if quota in ("max", "-1"):
+        return None
+    return int(quota) / int(period)
+
+
+def available_cpus(root: str = "/sys/fs/cgroup") -> int:
+    cpus = len(os.sched_getaffinity(0))
+    limit = cgroup_cpu_limit(root)
+    if limit is not None:
+        cpus = min(cpus, max(1, math.ceil(limit)))
+    return cpus
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+cpus = available_cpus()
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+if worker_class not in WORKER_CLASSES:
+    raise ValueError(
+        f"GUNICORN_WORKER_CLASS must be one of {', '.join(WORKER_CLASSES)}, "
+        f"not {worker_class!r}"
+    )
+# gevent workers serve many requests each from one core; the others are
+# given more processes than cores to cover time spent waiting on I/O
+workers = _env_int(
+    "GUNICORN_WORKERS", cpus if worker_class == "gevent" else cpus * 2 + 1
+)
+threads = _env_int("GUNICORN_THREADS", 4) if worker_class == "gthread" else 1
+worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", 100)
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() != "false"
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+
+
+def post_fork(server, worker):
+    if worker_class == "gevent":
+        # Let psycopg2 yield to other greenlets while waiting on PostgreSQL
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+    if not server.cfg.preload_app:
+        return
+    # Connections the master opened while loading the app are shared with
+    # every worker through fork; drop them from this worker's pools without
+    # closing them (which would close them for the master and the other
+    # workers too), so each worker opens its own.
+    from app.extensions import db
+
+    with server.app.wsgi().app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
@@ -93,6 +93,13 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        if connection.dialect.name == "sqlite":
+            # Batch operations rebuild tables by copying, dropping and
+            # renaming them, which enforced foreign keys (SQLITE_FOREIGN_KEYS)
+            # would refuse for referenced tables. The pragma is a no-op inside
+            # a transaction, so it is committed before the migrations begin.
+            connection.exec_driver_sql("PRAGMA foreign_keys = OFF")
+            connection.commit()
         context.configure(
             connection=connection, target_metadata=get_metadata(), **conf_args
         )
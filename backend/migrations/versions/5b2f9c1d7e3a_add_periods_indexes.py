@@ -0,0 +1,45 @@
+"""Add per-user indexes on periods
+
+Revision ID: 5b2f9c1d7e3a
+Revises: 376d034c3243
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b2f9c1d7e3a"
+down_revision = "376d034c3243"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_periods_user_id_start_date",
+        "periods",
+        ["user_id", "start_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_periods_user_id_id",
+        "periods",
+        ["user_id", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_periods_user_id_active",
+        "periods",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("end_date IS NULL"),
+        sqlite_where=sa.text("end_date IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_periods_user_id_active", table_name="periods")
+    op.drop_index("ix_periods_user_id_id", table_name="periods")
+    op.drop_index("ix_periods_user_id_start_date", table_name="periods")
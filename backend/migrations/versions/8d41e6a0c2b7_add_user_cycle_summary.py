@@ -0,0 +1,47 @@
+"""Add user_cycle_summary table
+
+Revision ID: 8d41e6a0c2b7
+Revises: 5b2f9c1d7e3a
+Create Date: 2026-10-18 11:02:55.904117
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d41e6a0c2b7"
+down_revision = "5b2f9c1d7e3a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user_cycle_summary",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("period_count", sa.Integer(), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("duration_sum", sa.Integer(), nullable=False),
+        sa.Column("duration_sq_sum", sa.BigInteger(), nullable=False),
+        sa.Column("duration_min", sa.Integer(), nullable=True),
+        sa.Column("duration_max", sa.Integer(), nullable=True),
+        sa.Column("cycle_count", sa.Integer(), nullable=False),
+        sa.Column("cycle_sum", sa.Integer(), nullable=False),
+        sa.Column("cycle_sq_sum", sa.BigInteger(), nullable=False),
+        sa.Column("cycle_min", sa.Integer(), nullable=True),
+        sa.Column("cycle_max", sa.Integer(), nullable=True),
+        sa.Column("last_start_date", sa.Date(), nullable=True),
+        sa.Column("active_period_id", sa.Integer(), nullable=True),
+        sa.Column("active_start_date", sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # No backfill: rows are built from the period history on first use
+
+
+def downgrade():
+    op.drop_table("user_cycle_summary")
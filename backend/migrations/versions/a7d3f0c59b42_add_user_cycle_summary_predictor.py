@@ -0,0 +1,29 @@
+"""Add cycle predictor state to user_cycle_summary
+
+Revision ID: a7d3f0c59b42
+Revises: f4c2a7b9e815
+Create Date: 2026-10-18 18:24:10.318422
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7d3f0c59b42"
+down_revision = "f4c2a7b9e815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows keep a NULL predictor and are replayed on first read
+    with op.batch_alter_table("user_cycle_summary", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("predictor", sa.String(length=32), nullable=True))
+        batch_op.add_column(sa.Column("predictor_state", sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("user_cycle_summary", schema=None) as batch_op:
+        batch_op.drop_column("predictor_state")
+        batch_op.drop_column("predictor")
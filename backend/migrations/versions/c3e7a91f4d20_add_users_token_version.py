@@ -0,0 +1,28 @@
+"""Add token_version to users
+
+Revision ID: c3e7a91f4d20
+Revises: 8d41e6a0c2b7
+Create Date: 2026-10-18 14:03:27.511862
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3e7a91f4d20"
+down_revision = "8d41e6a0c2b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("token_version", sa.Integer(), nullable=False, server_default="0")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.drop_column("token_version")
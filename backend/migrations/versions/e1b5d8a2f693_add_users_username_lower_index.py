@@ -0,0 +1,48 @@
+"""Add case-insensitive unique index on users.username
+
+Revision ID: e1b5d8a2f693
+Revises: c3e7a91f4d20
+Create Date: 2026-10-18 15:41:09.207734
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e1b5d8a2f693"
+down_revision = "c3e7a91f4d20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The index would fail on usernames differing only by case; name them
+    # so they can be renamed before retrying.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(username) FROM users "
+                "GROUP BY lower(username) HAVING count(*) > 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Usernames differing only by case must be renamed first: "
+            + ", ".join(duplicates)
+        )
+
+    op.create_index(
+        "uq_users_username_lower",
+        "users",
+        [sa.text("lower(username)")],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index("uq_users_username_lower", table_name="users")
@@ -0,0 +1,30 @@
+"""Add data_version to user_cycle_summary
+
+Revision ID: f4c2a7b9e815
+Revises: e1b5d8a2f693
+Create Date: 2026-10-18 16:27:52.640193
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f4c2a7b9e815"
+down_revision = "e1b5d8a2f693"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("user_cycle_summary", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "data_version", sa.BigInteger(), nullable=False, server_default="0"
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("user_cycle_summary", schema=None) as batch_op:
+        batch_op.drop_column("data_version")
@@ -2,11 +2,14 @@ import os
 
 import pytest
 from flask_jwt_extended import create_access_token
+from sqlalchemy import event
 
 from app import create_app
 from app.config import TestingConfig
 from app.extensions import db as _db
+from app.extensions import token_versions
 from app.models import Period, User  # Import models
+from app.utils.cache import MemoryCache
 
 
 @pytest.fixture(scope="session")
@@ -24,11 +27,13 @@ def app():
 
     yield _app  # Use the app in tests
 
+    _db.engine.dispose()
     ctx.pop()
-    # Clean up test database file after session
+    # Clean up test database file (and its WAL files) after session
     db_path = _app.config["SQLALCHEMY_DATABASE_URI"].replace("sqlite:///", "")
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 @pytest.fixture(scope="function")  # Use function scope for DB isolation
@@ -99,4 +104,24 @@ def test_period(db, test_user):
     return period
 
 
+@pytest.fixture(scope="function")
+def query_counter(db):
+    """Records every SQL statement executed while the fixture is active."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def memory_user_cache(monkeypatch):
+    """Enables the in-process token version cache for a single test."""
+    monkeypatch.setattr(token_versions, "backend", MemoryCache(maxsize=100))
+    yield token_versions
+
+
 # Add more fixtures as needed (e.g., multiple periods for reports)
@@ -0,0 +1,94 @@
+import datetime
+from functools import lru_cache
+
+import factory
+import factory.random
+from factory.alchemy import SQLAlchemyModelFactory
+
+from app.extensions import db, password_hasher
+from app.models import Period, User
+from app.services import CycleSummaryService
+from app.utils.synthetic import CycleProfile, generate_periods
+
+DEFAULT_PASSWORD = "password"
+
+
+@lru_cache(maxsize=None)
+def default_password_hash() -> str:
+    """Hash of ``DEFAULT_PASSWORD``, computed once and shared by every user."""
+    return password_hasher.hash(DEFAULT_PASSWORD)
+
+
+class BaseFactory(SQLAlchemyModelFactory):
+    class Meta:
+        abstract = True
+        sqlalchemy_session_factory = lambda: db.session
+        sqlalchemy_session_persistence = "commit"
+
+
+class UserFactory(BaseFactory):
+    """
+    Users with the default password.
+
+    ``UserFactory(periods=12)`` also creates a plausible 12-period history
+    ending today (``periods__irregular=True`` for an irregular user) and
+    builds the user's cycle summary.
+    """
+
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f"user{n}")
+    email = factory.LazyAttribute(lambda user: f"{user.username}@example.com")
+    password_hash = factory.LazyFunction(default_password_hash)
+
+    @factory.post_generation
+    def periods(user, create, extracted, irregular=None, **kwargs):
+        if not create or not extracted:
+            return
+        rng = factory.random.randgen
+        profile = CycleProfile.draw(rng, irregular=irregular)
+        for start_date, end_date in generate_periods(rng, extracted, profile):
+            db.session.add(
+                Period(user_id=user.id, start_date=start_date, end_date=end_date)
+            )
+        db.session.flush()
+        CycleSummaryService.rebuild(user.id)
+        db.session.commit()
+
+
+class PeriodFactory(BaseFactory):
+    """
+    A single completed period of plausible duration within the last year;
+    ``PeriodFactory(ongoing=True)`` leaves it without an end date. The
+    user's cycle summary is rebuilt to include it.
+    """
+
+    class Meta:
+        model = Period
+
+    class Params:
+        ongoing = factory.Trait(end_date=None)
+
+    user = factory.SubFactory(UserFactory)
+    start_date = factory.LazyFunction(
+        lambda: datetime.date.today()
+        - datetime.timedelta(days=factory.random.randgen.randint(14, 365))
+    )
+    end_date = factory.LazyAttribute(
+        lambda period: period.start_date
+        + datetime.timedelta(days=_random_duration() - 1)
+    )
+
+    @factory.post_generation
+    def summary(period, create, extracted, **kwargs):
+        if not create:
+            return
+        CycleSummaryService.rebuild(period.user_id)
+        db.session.commit()
+
+
+def _random_duration() -> int:
+    """Period duration of a randomly drawn user, in days."""
+    rng = factory.random.randgen
+    return CycleProfile.draw(rng).duration(rng)
@@ -2,10 +2,16 @@ import json
 import time
 from datetime import timedelta
 
+import pytest
 from flask import url_for
 from flask_jwt_extended import decode_token
+from sqlalchemy import func, text
+from sqlalchemy.exc import IntegrityError
 
+from app.extensions import password_hasher
 from app.models import User
+from app.services import UserService
+from app.utils.exceptions import ServiceUnavailableError
 
 
 # Helper function (optional, but can make tests cleaner)
@@ -250,3 +256,113 @@ def test_refresh_with_expired_refresh_token(client, test_user, app):
             # If it wasn't set before, remove it or set to a default
             # For testing, it's often better to let fixtures handle app setup/teardown per test.
             pass
+
+
+def test_revoked_tokens_rejected(client, test_user):
+    """Bumping the user's token version revokes access and refresh tokens."""
+    tokens = login_user_and_get_tokens(client, test_user.username, "password")
+    tokens = tokens.get_json()
+    assert decode_token(tokens["access_token"])["ver"] == 0
+
+    UserService.revoke_tokens(test_user)
+
+    response = client.get(
+        url_for("periods.get_periods"),
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+    assert response.status_code == 401
+    assert response.get_json()["error"] == "token_revoked"
+
+    response = client.post(
+        url_for("auth.refresh"),
+        headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+    )
+    assert response.status_code == 401
+
+    tokens = login_user_and_get_tokens(client, test_user.username, "password")
+    response = client.get(
+        url_for("periods.get_periods"),
+        headers={"Authorization": f"Bearer {tokens.get_json()['access_token']}"},
+    )
+    assert response.status_code == 200
+
+
+def test_identity_only_endpoint_skips_user_lookup(
+    auth_client, query_counter, memory_user_cache
+):
+    """Views without @requires_current_user never load the user row."""
+    auth_client.get(url_for("periods.get_periods"))
+    query_counter.clear()
+
+    response = auth_client.get(url_for("periods.get_periods"))
+    assert response.status_code == 200
+    assert not [s for s in query_counter if "FROM users" in s]
+
+    response = auth_client.get(url_for("users.get_own_user"))
+    assert response.status_code == 200
+    assert [s for s in query_counter if "FROM users" in s]
+
+
+def test_deleted_user_token_rejected(auth_client, memory_user_cache):
+    """Deleting a user drops its cached token version."""
+    assert auth_client.get(url_for("periods.get_periods")).status_code == 200
+    auth_client.delete(url_for("users.delete_own_user"))
+
+    response = auth_client.get(url_for("periods.get_periods"))
+    assert response.status_code == 401
+
+
+def test_login_rehashes_outdated_password(client, test_user, monkeypatch):
+    """A hash made with old parameters is upgraded on successful login."""
+    old_hash = test_user.password_hash
+    monkeypatch.setattr(password_hasher, "method", "pbkdf2:sha256:2000")
+
+    response = login_user_and_get_tokens(client, test_user.username, "password")
+    assert response.status_code == 200
+    assert test_user.password_hash != old_hash
+    assert test_user.password_hash.startswith("pbkdf2:sha256:2000$")
+    assert test_user.check_password("password")
+
+
+def test_login_returns_503_when_hashing_saturated(client, test_user, monkeypatch):
+    def saturated(*args):
+        raise ServiceUnavailableError("Busy.", retry_after=3)
+
+    monkeypatch.setattr(password_hasher, "verify", saturated)
+    response = login_user_and_get_tokens(client, test_user.username, "password")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_login_resolves_user_in_single_query(client, test_user, query_counter):
+    """Email-or-username resolution is one indexed query, case-insensitive."""
+    response = login_user_and_get_tokens(client, "TestUser", "password")
+    assert response.status_code == 200
+    assert len([s for s in query_counter if "FROM users" in s]) == 1
+
+
+def test_login_prefers_email_match(client, test_user, db):
+    """A login equal to one user's email and another's username picks the email."""
+    other = User(username=test_user.email, email="other@example.com")
+    other.set_password("other")
+    db.session.add(other)
+    db.session.commit()
+
+    response = login_user_and_get_tokens(client, test_user.email, "password")
+    assert response.status_code == 200
+
+
+def test_username_unique_case_insensitive(test_user, db):
+    user = User(username="TESTUSER", email="upper@example.com")
+    user.set_password("password")
+    db.session.add(user)
+    with pytest.raises(IntegrityError):
+        db.session.commit()
+    db.session.rollback()
+
+
+def test_username_lookup_uses_index(db):
+    statement = User.query.filter(func.lower(User.username) == "testuser").statement
+    compiled = statement.compile(db.engine, compile_kwargs={"literal_binds": True})
+    plan = db.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    assert "uq_users_username_lower" in " ".join(row[-1] for row in plan)
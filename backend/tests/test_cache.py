@@ -0,0 +1,40 @@
+import time
+
+from app.utils.cache import MemoryCache, ReportCache
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_memory_cache_expires_entries(monkeypatch):
+    cache = MemoryCache(default_ttl=10)
+    cache.set("a", 1)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("a") is None
+
+
+def test_report_cache_invalidate_bumps_version():
+    cache = ReportCache()
+    cache.backend = MemoryCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_load(1, loader) == 1
+    assert cache.get_or_load(1, loader) == 1
+    cache.invalidate(1)
+    assert cache.get_or_load(1, loader) == 2
+    # Other users are unaffected
+    assert cache.get_or_load(2, loader) == 3
@@ -0,0 +1,86 @@
+import datetime
+import gzip
+import json
+
+import brotli
+import pytest
+from flask import url_for
+
+from app.models import Period
+
+
+@pytest.fixture
+def history(db, test_user):
+    """Fifty periods, enough for list responses above the size threshold."""
+    start = datetime.date(2020, 1, 1)
+    for _ in range(50):
+        db.session.add(
+            Period(
+                user_id=test_user.id,
+                start_date=start,
+                end_date=start + datetime.timedelta(days=4),
+            )
+        )
+        start += datetime.timedelta(days=28)
+    db.session.commit()
+
+
+def decompress(response) -> bytes:
+    body = response.get_data()
+    encoding = response.headers.get("Content-Encoding")
+    if encoding == "br":
+        return brotli.decompress(body)
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encoding",
+    [("gzip, deflate, br", "br"), ("gzip", "gzip"), ("br;q=0.5, gzip", "gzip")],
+)
+def test_json_responses_are_compressed(auth_client, history, accept_encoding, encoding):
+    url = url_for("periods.get_periods", per_page=50)
+    plain = auth_client.get(url)
+
+    response = auth_client.get(url, headers={"Accept-Encoding": accept_encoding})
+
+    assert plain.headers.get("Content-Encoding") is None
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert len(response.get_data()) < len(plain.get_data())
+    assert json.loads(decompress(response)) == plain.json
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/health", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") is None
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_streamed_exports_are_compressed_incrementally(auth_client, history, encoding):
+    url = url_for("periods.export_periods", format="csv")
+    plain = auth_client.get(url).get_data()
+
+    response = auth_client.get(url, headers={"Accept-Encoding": encoding})
+
+    assert response.is_streamed
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Content-Length" not in response.headers
+    assert decompress(response) == plain
+
+
+def test_compressed_etag_is_weak_and_still_revalidates(auth_client, history):
+    url = url_for("periods.export_periods")
+    headers = {"Accept-Encoding": "gzip"}
+
+    response = auth_client.get(url, headers=headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = auth_client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
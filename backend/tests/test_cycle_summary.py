@@ -0,0 +1,190 @@
+import datetime
+import random
+
+import pytest
+from sqlalchemy import insert
+
+from app.extensions import db as _db
+from app.models import Period, UserCycleSummary
+from app.services import CycleSummaryService, PeriodService
+from app.services.cycle_predictor import get_predictor
+
+
+@pytest.mark.parametrize("predictor", ["mean", "ewma", "rolling"])
+def test_summary_matches_recompute_after_random_writes(
+    app, db, test_user, monkeypatch, predictor
+):
+    """Out-of-order inserts, end dates and deletes keep the summary exact."""
+    monkeypatch.setitem(app.config, "CYCLE_PREDICTOR", predictor)
+    rng = random.Random(1234)
+    base = datetime.date(2022, 1, 1)
+    period_ids = []
+
+    for _ in range(60):
+        action = rng.random()
+        if action < 0.55 or not period_ids:
+            start = base + datetime.timedelta(days=rng.randint(0, 600))
+            period = PeriodService.record_period_start(test_user.id, start)
+            period_ids.append(period.id)
+        elif action < 0.8:
+            period = Period.get_by_id(rng.choice(period_ids))
+            if period.end_date is None:
+                end = period.start_date + datetime.timedelta(days=rng.randint(0, 7))
+                PeriodService.update_period_end(test_user.id, period.id, end)
+        else:
+            period_id = rng.choice(period_ids)
+            PeriodService.delete_period_for_user(test_user.id, period_id)
+            period_ids.remove(period_id)
+
+        assert CycleSummaryService.check(test_user.id) == {}
+
+
+def test_summary_rebuilt_when_missing(db, test_user, test_period):
+    """Periods written outside the service are picked up by a lazy rebuild."""
+    assert _db.session.get(UserCycleSummary, test_user.id) is None
+
+    snapshot = CycleSummaryService.get_snapshot(test_user.id)
+
+    assert snapshot.period_count == 1
+    assert snapshot.duration_min == 5
+    assert CycleSummaryService.check(test_user.id) == {}
+
+
+def test_concurrent_first_reads_do_not_fail(db, test_user, test_period, monkeypatch):
+    """The loser of two racing rebuilds reads the winner's row instead."""
+    store = CycleSummaryService._store
+
+    def store_after_competitor(summary, snapshot):
+        # Another request inserts the row after our rebuild found none
+        with db.engine.begin() as connection:
+            connection.execute(
+                insert(UserCycleSummary).values(
+                    user_id=summary.user_id, period_count=1, predictor="mean"
+                )
+            )
+        store(summary, snapshot)
+
+    monkeypatch.setattr(CycleSummaryService, "_store", store_after_competitor)
+
+    snapshot = CycleSummaryService.get_snapshot(test_user.id)
+
+    assert snapshot.period_count == 1
+    assert _db.session.get(UserCycleSummary, test_user.id) is not None
+
+
+def test_concurrent_first_writes_do_not_fail(db, test_user, test_period, monkeypatch):
+    """A summary row inserted by a racing first write is locked, not re-inserted."""
+    select_for_update = CycleSummaryService._select_for_update
+    reads = []
+
+    def select_after_competitor(user_id):
+        reads.append(user_id)
+        if len(reads) == 1:
+            # The other request inserts the row right after our read missed it
+            # (through this session: SQLite lets one connection write at once)
+            db.session.execute(
+                insert(UserCycleSummary).values(
+                    user_id=user_id, period_count=1, predictor="other"
+                )
+            )
+            return None
+        return select_for_update(user_id)
+
+    monkeypatch.setattr(
+        CycleSummaryService, "_select_for_update", select_after_competitor
+    )
+
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 29))
+
+    assert len(reads) == 2
+    assert CycleSummaryService.check(test_user.id) == {}
+
+
+def test_check_command_reports_and_fixes_drift(runner, db, test_user, test_period):
+    CycleSummaryService.get_snapshot(test_user.id)
+    # Written behind the service's back, so the summary is now stale
+    Period(user_id=test_user.id, start_date=datetime.date(2023, 1, 29)).save()
+
+    result = runner.invoke(args=["cycle-summary", "check"])
+    assert result.exit_code == 1
+    assert "period_count: 1 != 2" in result.output
+
+    result = runner.invoke(args=["cycle-summary", "check", "--fix"])
+    assert result.exit_code == 0
+    assert CycleSummaryService.check(test_user.id) == {}
+
+
+def test_predictors_weigh_cycles_by_recency():
+    cycles = [35, 35, 35, 26, 28]
+    expected = {"mean": 32, "ewma:0.5": 29, "rolling:3:1": 28}
+    for key, length in expected.items():
+        predictor = get_predictor(key)
+        state = predictor.initial_state()
+        for cycle in cycles:
+            state = predictor.update(state, cycle)
+        assert round(predictor.predict(state)) == length, key
+
+
+def test_appended_period_advances_predictor_without_replay(
+    app, db, test_user, monkeypatch, query_counter
+):
+    monkeypatch.setitem(app.config, "CYCLE_PREDICTOR", "ewma")
+    base = datetime.date(2023, 1, 1)
+    for days in (0, 30, 60):
+        PeriodService.record_period_start(test_user.id, base + datetime.timedelta(days))
+
+    query_counter.clear()
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 3, 23))
+
+    # Only the appended period and its neighbours are read, not the history
+    history_reads = [
+        q for q in query_counter if "FROM periods" in q and "LIMIT" not in q
+    ]
+    assert history_reads == []
+    snapshot = CycleSummaryService.get_snapshot(test_user.id)
+    assert snapshot.predictor == "ewma:0.3"
+    assert snapshot.predictor_state == {"mean": 30 + 0.3 * (21 - 30)}
+    assert snapshot.predicted_next_period() == datetime.date(2023, 4, 18)
+
+
+def test_mean_predictor_handles_middle_writes_without_replay(
+    db, test_user, query_counter
+):
+    base = datetime.date(2023, 1, 1)
+    periods = [
+        PeriodService.record_period_start(test_user.id, base + datetime.timedelta(d))
+        for d in (0, 20, 50, 80, 110, 150)
+    ]
+
+    # Neither touches the shortest or longest cycle, which would need a rescan
+    query_counter.clear()
+    PeriodService.delete_period_for_user(test_user.id, periods[2].id)
+    PeriodService.record_period_start(test_user.id, base + datetime.timedelta(95))
+
+    # The deleted period is looked up by id; the history is never scanned
+    history_reads = [
+        q
+        for q in query_counter
+        if "FROM periods" in q and "ORDER BY" in q and "LIMIT" not in q
+    ]
+    assert history_reads == []
+    snapshot = CycleSummaryService.get_snapshot(test_user.id)
+    assert snapshot.predictor_state == {"sum": 150, "count": 5}
+    assert CycleSummaryService.check(test_user.id) == {}
+
+
+def test_summary_replayed_when_predictor_setting_changes(
+    app, db, test_user, monkeypatch
+):
+    base = datetime.date(2023, 1, 1)
+    for days in (0, 35, 70, 96):
+        PeriodService.record_period_start(test_user.id, base + datetime.timedelta(days))
+    assert CycleSummaryService.get_snapshot(test_user.id).predicted_cycle_length == 32
+
+    monkeypatch.setitem(app.config, "CYCLE_PREDICTOR", "rolling")
+    monkeypatch.setitem(app.config, "CYCLE_PREDICTOR_WINDOW", 1)
+
+    snapshot = CycleSummaryService.get_snapshot(test_user.id)
+    assert snapshot.predictor == "rolling:1:1"
+    assert snapshot.predicted_cycle_length == 26
+    assert CycleSummaryService.check(test_user.id) == {}
@@ -0,0 +1,167 @@
+import os
+import runpy
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..")
+CONF_PATH = os.path.join(BACKEND_DIR, "gunicorn.conf.py")
+
+
+@pytest.fixture
+def load_conf(tmp_path, monkeypatch):
+    """Evaluates gunicorn.conf.py with the given GUNICORN_* variables."""
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path / "metrics"))
+
+    def load(**env):
+        for name in list(os.environ):
+            if name.startswith("GUNICORN_"):
+                monkeypatch.delenv(name)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return runpy.run_path(CONF_PATH)
+
+    return load
+
+
+def write_cgroup(root, files):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return str(root)
+
+
+@pytest.mark.parametrize(
+    "files, expected",
+    [
+        ({"cpu.max": "150000 100000\n"}, 1.5),
+        ({"cpu.max": "max 100000\n"}, None),
+        (
+            {"cpu/cpu.cfs_quota_us": "50000\n", "cpu/cpu.cfs_period_us": "100000\n"},
+            0.5,
+        ),
+        (
+            {"cpu/cpu.cfs_quota_us": "-1\n", "cpu/cpu.cfs_period_us": "100000\n"},
+            None,
+        ),
+        ({}, None),
+    ],
+)
+def test_cgroup_cpu_limit(load_conf, tmp_path, files, expected):
+    conf = load_conf()
+    root = write_cgroup(tmp_path / "cgroup", files)
+
+    assert conf["cgroup_cpu_limit"](root) == expected
+
+
+def test_available_cpus_rounds_fractional_limits_up(load_conf, tmp_path):
+    conf = load_conf()
+    affinity = len(os.sched_getaffinity(0))
+
+    quarter = write_cgroup(tmp_path / "quarter", {"cpu.max": "25000 100000"})
+    assert conf["available_cpus"](quarter) == 1
+    unlimited = write_cgroup(tmp_path / "unlimited", {"cpu.max": "max 100000"})
+    assert conf["available_cpus"](unlimited) == affinity
+
+
+def test_defaults_derive_workers_from_cpus(load_conf):
+    conf = load_conf()
+
+    assert conf["worker_class"] == "sync"
+    assert conf["workers"] == conf["cpus"] * 2 + 1
+    assert conf["threads"] == 1
+    assert conf["preload_app"] is True
+    assert conf["max_requests"] == 1000
+    assert conf["max_requests_jitter"] == 100
+
+
+def test_settings_come_from_environment(load_conf):
+    conf = load_conf(
+        GUNICORN_WORKER_CLASS="gthread",
+        GUNICORN_WORKERS="3",
+        GUNICORN_THREADS="8",
+        GUNICORN_PRELOAD="false",
+        GUNICORN_MAX_REQUESTS="0",
+        GUNICORN_BIND="127.0.0.1:8000",
+    )
+
+    assert conf["worker_class"] == "gthread"
+    assert conf["workers"] == 3
+    assert conf["threads"] == 8
+    assert conf["preload_app"] is False
+    assert conf["max_requests"] == 0
+    assert conf["bind"] == "127.0.0.1:8000"
+
+
+def test_unknown_worker_class_is_rejected(load_conf):
+    with pytest.raises(ValueError, match="GUNICORN_WORKER_CLASS"):
+        load_conf(GUNICORN_WORKER_CLASS="eventlet")
+
+
+def test_load_removes_only_metric_files_from_configured_directory(load_conf, tmp_path):
+    stale = tmp_path / "metrics" / "counter_1.db"
+    other = tmp_path / "metrics" / "keep" / "notes.txt"
+    other.parent.mkdir(parents=True)
+    stale.write_bytes(b"stale")
+    other.write_text("not ours")
+
+    load_conf()
+
+    assert not stale.exists()
+    assert other.read_text() == "not ours"
+
+
+def test_load_creates_configured_metrics_directory(load_conf, tmp_path):
+    load_conf()
+
+    assert (tmp_path / "metrics").is_dir()
+
+
+def test_preloaded_server_starts_without_metrics_directory(tmp_path):
+    """The master imports the app, and so prometheus_client, before any hook."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    metrics_dir = tmp_path / "missing" / "metrics"
+    env = {
+        **os.environ,
+        "FLASK_ENV": "production",
+        "DB_TYPE": "sqlite",
+        "SQLITE_PATH": str(tmp_path / "app.db"),
+        "JWT_SECRET_KEY": "gunicorn-test",
+        "PASSWORD_HASH_WORKERS": "0",
+        "PROMETHEUS_MULTIPROC_DIR": str(metrics_dir),
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_WORKERS": "1",
+        "GUNICORN_PRELOAD": "true",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "app:create_app()"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            assert server.poll() is None, server.stderr.read().decode()
+            try:
+                # Answered by a forked worker, after post_fork
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health") as r:
+                    assert r.status == 200
+                break
+            except OSError:
+                assert time.monotonic() < deadline, "gunicorn did not start"
+                time.sleep(0.2)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+        server.stderr.close()
+
+    assert metrics_dir.is_dir()
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from flask import Flask
+
+from app.utils.exceptions import ServiceUnavailableError
+from app.utils.hashing import PasswordHasher, canonical_method
+
+
+def make_hasher(**config) -> PasswordHasher:
+    app = Flask(__name__)
+    app.config.update(PASSWORD_HASH_METHOD="pbkdf2:sha256:1000", **config)
+    return PasswordHasher(app)
+
+
+def test_canonical_method_expands_defaults():
+    assert canonical_method("scrypt") == "scrypt:32768:8:1"
+    assert canonical_method("scrypt:16384") == "scrypt:16384:8:1"
+    assert canonical_method("pbkdf2:sha256:1000") == "pbkdf2:sha256:1000"
+
+
+def test_needs_rehash_when_parameters_change():
+    hasher = make_hasher()
+    pwhash = hasher.hash("secret")
+    assert hasher.verify(pwhash, "secret")
+    assert not hasher.needs_rehash(pwhash)
+
+    hasher.method = "pbkdf2:sha256:2000"
+    assert hasher.needs_rehash(pwhash)
+    assert hasher.verify(pwhash, "secret")  # Old hashes keep working
+
+
+def test_pool_hashes_in_worker_process():
+    hasher = make_hasher(PASSWORD_HASH_WORKERS=1)
+    try:
+        pwhash = hasher.hash("secret")
+        assert pwhash.startswith("pbkdf2:sha256:1000$")
+        assert hasher.verify(pwhash, "secret")
+        assert not hasher.verify(pwhash, "wrong")
+    finally:
+        hasher.shutdown()
+
+
+def test_pool_rejects_when_queue_is_full():
+    hasher = make_hasher(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_MAX_PENDING=1)
+    hasher._slots.acquire()  # Another request holds the only slot
+    with pytest.raises(ServiceUnavailableError) as excinfo:
+        hasher.hash("secret")
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.headers == {"Retry-After": "1"}
+
+
+def test_timed_out_operation_holds_its_slot_until_done():
+    hasher = make_hasher(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_MAX_PENDING=1)
+    try:
+        hasher.hash("warm up")  # Start the pool's process
+        hasher.timeout = 0.2
+        with pytest.raises(ServiceUnavailableError, match="timed out"):
+            hasher._run(time.sleep, 1)
+
+        # Still running in the pool, so nothing new is admitted
+        with pytest.raises(ServiceUnavailableError, match="Too many"):
+            hasher.hash("secret")
+
+        deadline = time.monotonic() + 10
+        while not hasher._slots.acquire(blocking=False):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        hasher._slots.release()
+    finally:
+        hasher.shutdown()
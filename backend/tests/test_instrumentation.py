@@ -0,0 +1,77 @@
+import json
+import logging
+import re
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app.config import TestingConfig, config_by_name
+from app.extensions import db as _db
+from app.models import User
+
+
+@pytest.fixture
+def timed_app(tmp_path):
+    """A separate app with request instrumentation enabled."""
+    config_by_name["timed"] = type(
+        "TimedConfig",
+        (TestingConfig,),
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'timed.db'}",
+            "REQUEST_TIMING_ENABLED": True,
+            "REQUEST_SLOW_THRESHOLD_MS": 10_000,
+        },
+    )
+    app = create_app("timed")
+    with app.app_context():
+        _db.create_all()
+        user = User(username="timed", email="timed@example.com")
+        user.set_password("password")
+        _db.session.add(user)
+        _db.session.commit()
+        app.config["TEST_TOKEN"] = create_access_token(identity=str(user.id))
+        yield app
+        _db.session.remove()
+        _db.drop_all()
+    del config_by_name["timed"]
+
+
+def test_server_timing_and_access_log(timed_app, caplog):
+    client = timed_app.test_client()
+    headers = {"Authorization": f"Bearer {timed_app.config['TEST_TOKEN']}"}
+
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        response = client.get("/reports/period-stats", headers=headers)
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert re.fullmatch(
+        r'db;dur=[\d.]+;desc="(\d+) queries", serialize;dur=[\d.]+, total;dur=[\d.]+',
+        timing,
+    )
+    line = json.loads(caplog.records[-1].getMessage())
+    assert line["endpoint"] == "reports.get_period_statistics"
+    assert line["status"] == 200
+    assert line["db_queries"] == int(re.search(r"(\d+) queries", timing).group(1))
+    assert line["db_queries"] >= 1
+
+
+def test_slow_requests_log_their_statements(timed_app, caplog):
+    timed_app.extensions["request_instrumentation"].slow_threshold = 0
+    client = timed_app.test_client()
+    headers = {"Authorization": f"Bearer {timed_app.config['TEST_TOKEN']}"}
+
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        client.get("/reports/period-stats", headers=headers)
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "Slow request GET /reports/period-stats" in warnings[0].getMessage()
+    assert "user_cycle_summary" in warnings[0].getMessage()
+
+
+def test_disabled_by_default(client):
+    response = client.get("/health")
+
+    assert "Server-Timing" not in response.headers
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from flask import url_for
+
+
+def test_metrics_exposes_request_db_and_cache_metrics(auth_client, client):
+    auth_client.get(url_for("reports.get_period_statistics"))
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert (
+        'http_requests_total{blueprint="reports",'
+        'endpoint="reports.get_period_statistics",method="GET",status="200"}'
+    ) in body
+    assert (
+        'http_request_duration_seconds_bucket{blueprint="reports",'
+        'endpoint="reports.get_period_statistics",le="0.005"}'
+    ) in body
+    assert 'db_queries_total{blueprint="reports"}' in body
+    assert 'report_cache_requests_total{result="miss"}' in body
+    assert "db_pool_checkout_wait_seconds_count" in body
+    assert "password_hash_pending" in body
+    # Scrapes are not counted as requests
+    assert 'endpoint="metrics"' not in body
+
+
+def test_metrics_aggregate_worker_processes(client, tmp_path, monkeypatch):
+    """Values written by other processes are summed when multiprocess is on."""
+    script = (
+        "from app.utils.metrics import REQUESTS; "
+        "REQUESTS.labels('auth', 'auth.login', 'POST', 200).inc(3)"
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)},
+        )
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    body = client.get("/metrics").get_data(as_text=True)
+
+    assert (
+        'http_requests_total{blueprint="auth",endpoint="auth.login",'
+        'method="POST",status="200"} 6.0'
+    ) in body
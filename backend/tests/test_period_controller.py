@@ -1,9 +1,12 @@
 import datetime
+import io
 import json
 
-from app.models import Period
 from flask import url_for
 
+from app.models import Period
+from app.services import CycleSummaryService
+
 
 # Use the 'auth_client' fixture which provides a client with a valid JWT
 def test_create_period_success(auth_client, db, test_user):
@@ -50,6 +53,68 @@ def test_create_period_unauthorized(client):
     assert response.status_code == 401  # Unauthorized
 
 
+def test_import_periods_json(auth_client, db, test_user):
+    """Bulk import accepts a JSON array and keeps the cycle summary exact."""
+    response = auth_client.post(
+        url_for("periods.import_periods"),
+        json=[
+            {"start_date": "2023-02-01", "end_date": "2023-02-05"},
+            {"start_date": "2023-01-01", "end_date": "2023-01-04"},
+            {"start_date": "2023-03-02"},
+        ],
+    )
+    assert response.status_code == 201
+    assert response.get_json() == {"imported": 3}
+    assert Period.query.filter_by(user_id=test_user.id).count() == 3
+    assert CycleSummaryService.check(test_user.id) == {}
+
+
+def test_import_periods_csv_upload(auth_client, db, test_user):
+    csv_data = b"start_date,end_date\n2023-01-01,2023-01-05\n2023-01-29,\n"
+    response = auth_client.post(
+        url_for("periods.import_periods"),
+        data={"file": (io.BytesIO(csv_data), "periods.csv")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 201
+    assert response.get_json() == {"imported": 2}
+
+
+def test_import_periods_reports_row_errors(auth_client, db, test_period):
+    """Invalid or overlapping rows reject the whole import with per-row errors."""
+    response = auth_client.post(
+        url_for("periods.import_periods"),
+        json=[
+            {"start_date": "2023-01-03", "end_date": "2023-01-06"},  # overlaps fixture
+            {"start_date": "2023-02-01", "end_date": "2023-01-20"},  # end before start
+            {"start_date": "not-a-date"},
+            {"start_date": "2023-03-01", "end_date": "2023-03-05"},
+            {"start_date": "2023-03-04", "end_date": "2023-03-08"},  # overlaps row 4
+        ],
+    )
+    assert response.status_code == 422
+    rows = response.get_json()["detail"]["messages"]["rows"]
+    assert [row["row"] for row in rows] == [1, 2, 3, 5]
+    assert rows[0]["errors"] == ["Overlaps an existing period."]
+    assert rows[3]["errors"] == ["Overlaps row 4."]
+    assert Period.query.count() == 1
+
+
+def test_import_periods_ten_thousand_rows(auth_client, db, test_user):
+    start = datetime.date(1200, 1, 1)
+    records = []
+    for _ in range(10000):
+        end = start + datetime.timedelta(days=4)
+        records.append({"start_date": start.isoformat(), "end_date": end.isoformat()})
+        start += datetime.timedelta(days=28)
+
+    response = auth_client.post(url_for("periods.import_periods"), json=records)
+
+    assert response.status_code == 201
+    assert response.get_json() == {"imported": 10000}
+    assert Period.query.count() == 10000
+
+
 def test_update_period_end_success(auth_client, db, test_user):
     """Test successfully updating a period's end date."""
     # Create a period without an end date first
@@ -185,6 +250,78 @@ def test_get_periods_pagination(auth_client, test_user, db):
     assert len(data) == 0
 
 
+def test_get_periods_cursor_pagination(auth_client, test_user, db, query_counter):
+    """Cursor pagination walks the whole history without a COUNT query."""
+    for i in range(12):
+        db.session.add(
+            Period(
+                user_id=test_user.id,
+                # Pairs of periods share a start date to exercise the id tiebreak
+                start_date=datetime.date(2023, 1, 1) + datetime.timedelta(days=i // 2),
+            )
+        )
+    db.session.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        query_counter.clear()
+        args = {"limit": 5, **({"cursor": cursor} if cursor else {})}
+        response = auth_client.get(url_for("periods.get_periods", **args))
+        assert response.status_code == 200
+        assert not [s for s in query_counter if "count(" in s.lower()]
+        seen.extend(p["id"] for p in response.get_json())
+        cursor = response.headers.get("X-Next-Cursor")
+
+    assert cursor is None
+    assert len(seen) == len(set(seen)) == 12
+    expected = Period.query.order_by(Period.start_date.desc(), Period.id.desc())
+    assert seen == [p.id for p in expected]
+
+
+def test_get_periods_invalid_cursor(auth_client):
+    response = auth_client.get(url_for("periods.get_periods", cursor="not-a-cursor"))
+    assert response.status_code == 422
+
+
+def test_export_periods_ndjson(auth_client, test_user, db):
+    """Export streams every period as one JSON object per line, oldest first."""
+    base = datetime.date(2023, 1, 1)
+    for i in range(3):
+        start = base + datetime.timedelta(days=28 * i)
+        end = start + datetime.timedelta(days=4) if i < 2 else None
+        db.session.add(Period(user_id=test_user.id, start_date=start, end_date=end))
+    db.session.commit()
+
+    response = auth_client.get(url_for("periods.export_periods"))
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row["start_date"] for row in rows] == [
+        "2023-01-01",
+        "2023-01-29",
+        "2023-02-26",
+    ]
+    assert rows[0]["duration"] == 5
+    assert rows[2]["end_date"] is None and rows[2]["duration"] is None
+
+
+def test_export_periods_csv(auth_client, test_period):
+    response = auth_client.get(url_for("periods.export_periods", format="csv"))
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert "attachment" in response.headers["Content-Disposition"]
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0] == "id,start_date,end_date,duration,created_at"
+    assert lines[1].startswith(f"{test_period.id},{test_period.start_date}")
+
+
+def test_export_periods_invalid_format(auth_client):
+    response = auth_client.get(url_for("periods.export_periods", format="xml"))
+    assert response.status_code == 400
+
+
 def test_get_specific_period_success(auth_client, test_period):
     """Test getting a single period by ID."""
     response = auth_client.get(url_for("periods.get_period", period_id=test_period.id))
@@ -227,3 +364,34 @@ def test_delete_period_not_found(auth_client):
 def test_delete_period_unauthorized(client, test_period):
     response = client.delete(url_for("periods.delete_period", period_id=test_period.id))
     assert response.status_code == 401
+
+
+def test_get_periods_conditional_get(auth_client, test_user, db):
+    """Period lists carry a data-version ETag; writes through the API change it."""
+    for day in (1, 29):
+        auth_client.post(
+            url_for("periods.create_period"),
+            json={"start_date": f"2023-01-{day:02d}"},
+        )
+        auth_client.put(
+            url_for("periods.update_period", period_id=1),
+            json={"end_date": "2023-01-05"},
+        )
+
+    response = auth_client.get(url_for("periods.get_periods", limit=1))
+    assert response.status_code == 200
+    assert "X-Next-Cursor" in response.headers
+    etag = response.headers["ETag"]
+
+    response = auth_client.get(
+        url_for("periods.get_periods", limit=1), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+    auth_client.delete(url_for("periods.delete_period", period_id=2))
+    response = auth_client.get(
+        url_for("periods.get_periods", limit=1), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert len(response.get_json()) == 1
@@ -0,0 +1,113 @@
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app.config import TestingConfig, config_by_name
+from app.extensions import db as _db
+from app.models import User
+from app.utils.metrics import POOL_CHECKOUT_TIMEOUTS
+from app.utils.pooling import TimedNullPool, TimedQueuePool, engine_options
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Builds separate apps with the given pool settings."""
+    names = []
+
+    def make(**settings):
+        name = f"pooling{len(names)}"
+        names.append(name)
+        config_by_name[name] = type(
+            "PoolingConfig",
+            (TestingConfig,),
+            {
+                "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / f'{name}.db'}",
+                **settings,
+            },
+        )
+        return create_app(name)
+
+    yield make
+    for name in names:
+        del config_by_name[name]
+
+
+def test_engine_options_for_queue_mode():
+    options = engine_options(
+        {
+            "DB_POOL_SIZE": 2,
+            "DB_MAX_OVERFLOW": 3,
+            "DB_POOL_TIMEOUT": 4,
+            "DB_POOL_RECYCLE": 600,
+            "DB_POOL_PRE_PING": True,
+        }
+    )
+
+    assert options == {
+        "poolclass": TimedQueuePool,
+        "pool_size": 2,
+        "max_overflow": 3,
+        "pool_timeout": 4,
+        "pool_recycle": 600,
+        "pool_pre_ping": True,
+    }
+
+
+def test_engine_options_for_null_mode_leave_out_queue_settings():
+    options = engine_options({"DB_POOL_MODE": "null", "DB_POOL_SIZE": 2})
+
+    assert options == {"poolclass": TimedNullPool, "pool_pre_ping": False}
+
+
+def test_unknown_pool_mode_is_rejected():
+    with pytest.raises(ValueError, match="DB_POOL_MODE"):
+        engine_options({"DB_POOL_MODE": "static"})
+
+
+def test_engine_uses_configured_pool(make_app):
+    queue_app = make_app(DB_POOL_SIZE=2, DB_MAX_OVERFLOW=1)
+    null_app = make_app(DB_POOL_MODE="null")
+    explicit_app = make_app(SQLALCHEMY_ENGINE_OPTIONS={"pool_size": 7})
+
+    with queue_app.app_context():
+        pool = _db.engine.pool
+        assert isinstance(pool, TimedQueuePool)
+        assert (pool.size(), pool._max_overflow) == (2, 1)
+    with null_app.app_context():
+        assert isinstance(_db.engine.pool, TimedNullPool)
+    with explicit_app.app_context():
+        assert _db.engine.pool.size() == 7
+
+
+def test_exhausted_pool_answers_503_with_retry_after(make_app):
+    app = make_app(
+        DB_POOL_SIZE=1,
+        DB_MAX_OVERFLOW=0,
+        DB_POOL_TIMEOUT=1,
+        DB_POOL_RETRY_AFTER=3,
+    )
+    with app.app_context():
+        _db.create_all()
+        user = User(username="pooled", email="pooled@example.com")
+        user.set_password("password")
+        _db.session.add(user)
+        _db.session.commit()
+        headers = {
+            "Authorization": f"Bearer {create_access_token(identity=str(user.id))}"
+        }
+        _db.session.remove()
+        timeouts = POOL_CHECKOUT_TIMEOUTS._value.get()
+
+        with _db.engine.connect():  # Holds the only connection
+            response = app.test_client().get("/reports/period-stats", headers=headers)
+        _db.session.remove()
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.json == {"error": "No database connection available."}
+        assert POOL_CHECKOUT_TIMEOUTS._value.get() == timeouts + 1
+
+        response = app.test_client().get("/reports/period-stats", headers=headers)
+        assert response.status_code == 200
+        _db.session.remove()
+        _db.drop_all()
@@ -0,0 +1,98 @@
+import csv
+import datetime
+import json
+import random
+
+import pytest
+
+from app.models import Period, User
+from app.services import CycleSummaryService
+
+np = pytest.importorskip("numpy")
+
+from app.services.population_analytics import PopulationAnalytics  # noqa: E402
+
+
+def seed_population(db, user_count: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    for n in range(user_count):
+        user = User(username=f"user{n}", email=f"user{n}@example.com")
+        user.password_hash = "x"
+        db.session.add(user)
+        db.session.flush()
+        start = datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randint(0, 30))
+        for i in range(rng.randint(0, 8)):
+            ongoing = rng.random() < 0.1
+            end = None if ongoing else start + datetime.timedelta(rng.randint(2, 7))
+            db.session.add(Period(user_id=user.id, start_date=start, end_date=end))
+            # Occasional duplicate start dates, as CycleSnapshot must ignore them
+            start += datetime.timedelta(days=rng.choice([0, 21, 26, 28, 30, 35]))
+    db.session.commit()
+
+
+def test_population_matches_per_user_snapshots(db):
+    """Vectorised per-user aggregates agree with CycleSnapshot, across chunks."""
+    seed_population(db, 40)
+    rows = {}
+
+    def collect(columns):
+        for values in zip(*(c.tolist() for c in columns.values())):
+            rows[int(values[0])] = dict(zip(columns, values))
+
+    summary = PopulationAnalytics().run(chunk_size=7, on_users=collect)
+
+    expected_cycles = []
+    for user_id, row in rows.items():
+        snapshot = CycleSummaryService.compute(user_id)
+        assert row["period_count"] == snapshot.period_count
+        assert row["completed_count"] == snapshot.completed_count
+        assert row["cycle_count"] == snapshot.cycle_count
+        if snapshot.cycle_count:
+            assert row["cycle_mean"] == pytest.approx(
+                snapshot.cycle_sum / snapshot.cycle_count
+            )
+            assert row["cycle_min"] == snapshot.cycle_min
+            assert row["cycle_max"] == snapshot.cycle_max
+        if snapshot.completed_count:
+            assert row["duration_min"] == snapshot.duration_min
+            assert row["duration_max"] == snapshot.duration_max
+        expected_cycles.append(snapshot.cycle_count)
+
+    assert summary["periods"] == Period.query.count()
+    assert summary["cycle_length"].get("count", 0) == sum(expected_cycles)
+
+
+def test_prediction_error_replays_mean_predictor():
+    analytics = PopulationAnalytics()
+    # One user with starts on days 0, 28, 58, 86: cycles 28, 30, 28
+    starts = np.array([0.0, 28.0, 58.0, 86.0])
+    columns = analytics.add(np.ones(4), starts, starts + 4)
+    # Predicted next starts are last + round(mean) - 1: 55 and 86
+    errors = analytics.summary()["prediction"]
+    assert errors["count"] == 2
+    assert errors["mean_error"] == pytest.approx((3 + 0) / 2)
+    assert columns["prediction_mae"][0] == pytest.approx(1.5)
+
+
+def test_population_command_writes_outputs(runner, db, tmp_path):
+    seed_population(db, 5)
+    users_csv = tmp_path / "users.csv"
+    summary_json = tmp_path / "summary.json"
+
+    result = runner.invoke(
+        args=[
+            "analytics",
+            "population",
+            "--users-csv",
+            str(users_csv),
+            "--summary-json",
+            str(summary_json),
+        ]
+    )
+    assert result.exit_code == 0, result.output
+
+    summary = json.loads(summary_json.read_text())
+    with users_csv.open() as f:
+        users = list(csv.DictReader(f))
+    assert summary["users"] == len(users)
+    assert sum(int(u["period_count"]) for u in users) == summary["periods"]
@@ -1,8 +1,19 @@
 import datetime
 
+import pytest
 from flask import url_for
 
+from app.extensions import report_cache
 from app.models import Period
+from app.services import PeriodService, ReportService
+from app.utils.cache import MemoryCache
+
+
+@pytest.fixture
+def memory_report_cache(monkeypatch):
+    """Enables the in-process report cache for a single test."""
+    monkeypatch.setattr(report_cache, "backend", MemoryCache(maxsize=100))
+    yield report_cache
 
 
 def test_get_period_stats_success(auth_client, test_user, db):
@@ -267,3 +278,178 @@ def test_get_cycle_context_unauthorized(client):
     """Should return 401 without a JWT token."""
     response = client.get(url_for("reports.get_cycle_context"))
     assert response.status_code == 401
+
+
+def test_report_endpoints_only_read_cycle_summary(
+    auth_client, test_user, db, query_counter, memory_user_cache
+):
+    """
+    Every report is served from one primary-key read of the user's cycle
+    summary, shared by the ETag version and the report.
+    """
+    period = PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 1))
+    PeriodService.update_period_end(test_user.id, period.id, datetime.date(2023, 1, 5))
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 29))
+
+    # Warm the token version cache
+    auth_client.get(url_for("reports.get_period_statistics"))
+
+    for endpoint in [
+        "reports.get_period_statistics",
+        "reports.get_cycle_statistics",
+        "reports.get_predicted_next_period",
+        "reports.get_ovulation_window",
+        "reports.get_cycle_context",
+    ]:
+        query_counter.clear()
+        response = auth_client.get(url_for(endpoint))
+        assert response.status_code == 200
+        # No user lookup: the token identity is enough for reports
+        assert len(query_counter) == 1, endpoint
+        assert all("FROM user_cycle_summary" in s for s in query_counter)
+
+
+def test_reports_served_from_cache_until_period_write(
+    auth_client, test_user, db, query_counter, memory_report_cache
+):
+    """Cached snapshots are reused and invalidated by PeriodService writes."""
+    Period(
+        user_id=test_user.id,
+        start_date=datetime.date(2023, 1, 1),
+        end_date=datetime.date(2023, 1, 5),
+    ).save()
+
+    response = auth_client.get(url_for("reports.get_period_statistics"))
+    assert response.get_json()["count"] == 1
+
+    query_counter.clear()
+    response = auth_client.get(url_for("reports.get_cycle_context"))
+    assert response.status_code == 200
+    assert not [s for s in query_counter if "FROM periods" in s]
+
+    auth_client.post(
+        url_for("periods.create_period"), json={"start_date": "2023-01-29"}
+    )
+
+    response = auth_client.get(url_for("reports.get_cycle_statistics"))
+    data = response.get_json()
+    assert data["count"] == 1
+    assert data["average_length"] == 28
+
+
+def test_general_stats_cached_with_conditional_headers(
+    client, test_user, query_counter, memory_report_cache
+):
+    """The public user count is cached, cacheable and honours If-None-Match."""
+    response = client.get(url_for("reports.get_app_stats"))
+    assert response.status_code == 200
+    assert response.get_json() == {"number_of_users": 1}
+    assert "public" in response.headers["Cache-Control"]
+    assert "max-age=" in response.headers["Cache-Control"]
+    etag = response.headers["ETag"]
+
+    query_counter.clear()
+    response = client.get(
+        url_for("reports.get_app_stats"), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert not query_counter
+
+    client.post(
+        url_for("auth.register"),
+        json={
+            "username": "second",
+            "email": "second@example.com",
+            "password": "password",
+            "confirm_password": "password",
+        },
+    )
+    response = client.get(
+        url_for("reports.get_app_stats"), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.get_json() == {"number_of_users": 2}
+
+
+def test_report_conditional_get(
+    auth_client, test_user, db, query_counter, memory_user_cache, monkeypatch
+):
+    """A matching If-None-Match is answered with 304 without building the report."""
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 1))
+
+    response = auth_client.get(url_for("reports.get_period_statistics"))
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    etag = response.headers["ETag"]
+
+    def not_called(*args):
+        raise AssertionError("report computed for a matching ETag")
+
+    monkeypatch.setattr(ReportService, "get_period_stats", not_called)
+    query_counter.clear()
+    response = auth_client.get(
+        url_for("reports.get_period_statistics"), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert len(query_counter) == 1  # The data version read
+    monkeypatch.undo()
+
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 29))
+    response = auth_client.get(
+        url_for("reports.get_period_statistics"), headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_cycle_context_etag_includes_date(auth_client, test_user):
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 1))
+    response = auth_client.get(url_for("reports.get_cycle_context"))
+    assert datetime.date.today().isoformat() in response.headers["ETag"]
+
+
+def test_dashboard_bundles_every_section(
+    auth_client, test_user, db, query_counter, memory_user_cache
+):
+    """The dashboard matches the individual endpoints, from two queries."""
+    period = PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 1))
+    PeriodService.update_period_end(test_user.id, period.id, datetime.date(2023, 1, 5))
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 29))
+    auth_client.get(url_for("reports.get_dashboard"))  # Warm the token cache
+
+    query_counter.clear()
+    response = auth_client.get(url_for("reports.get_dashboard"))
+    assert response.status_code == 200
+    assert len(query_counter) == 2  # Cycle summary, then user + active period
+    dashboard = response.get_json()
+
+    expected = {
+        "user": "users.get_own_user",
+        "active_period": "periods.get_active_period",
+        "cycle_context": "reports.get_cycle_context",
+        "cycle_stats": "reports.get_cycle_statistics",
+        "period_stats": "reports.get_period_statistics",
+        "predicted_next_period": "reports.get_predicted_next_period",
+        "ovulation_window": "reports.get_ovulation_window",
+    }
+    assert set(dashboard) == set(expected)
+    for section, endpoint in expected.items():
+        assert dashboard[section] == auth_client.get(url_for(endpoint)).get_json()
+
+
+def test_dashboard_include_selects_sections(auth_client, test_user, query_counter):
+    PeriodService.record_period_start(test_user.id, datetime.date(2023, 1, 1))
+
+    query_counter.clear()
+    response = auth_client.get(
+        url_for("reports.get_dashboard", include="cycle_stats, period_stats")
+    )
+    assert response.status_code == 200
+    assert set(response.get_json()) == {"cycle_stats", "period_stats"}
+    assert not [s for s in query_counter if "FROM periods" in s]
+
+
+def test_dashboard_unknown_section(auth_client):
+    response = auth_client.get(url_for("reports.get_dashboard", include="weather"))
+    assert response.status_code == 400
@@ -0,0 +1,68 @@
+import datetime
+import random
+
+from sqlalchemy import func, select
+
+from app.extensions import db as _db
+from app.models import Period, User
+from app.services import CycleSummaryService, ReportService
+from app.utils.synthetic import CycleProfile, generate_periods
+from tests.factories import DEFAULT_PASSWORD, PeriodFactory, UserFactory
+
+
+def test_generated_history_is_plausible():
+    rng = random.Random(7)
+    today = datetime.date(2024, 6, 1)
+    profile = CycleProfile(cycle_mean=28, cycle_sd=2, duration_mean=5)
+
+    periods = generate_periods(rng, 24, profile, today=today)
+
+    starts = [start for start, _ in periods]
+    assert len(periods) == 24
+    assert starts == sorted(starts)
+    assert all(18 <= (b - a).days <= 60 for a, b in zip(starts, starts[1:]))
+    assert today - datetime.timedelta(days=28) < starts[-1] <= today
+    # Only the latest period may still be running
+    assert all(end is not None and start <= end < today for start, end in periods[:-1])
+
+
+def test_seed_command_bulk_inserts_users_periods_and_summaries(runner, db):
+    result = runner.invoke(
+        args=["seed", "--users", "30", "--periods-per-user", "8", "--batch-size", "50"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Seeded 30 users and 240 periods" in result.output
+    assert _db.session.scalar(select(func.count()).select_from(Period)) == 240
+    hashes = _db.session.scalars(select(User.password_hash).distinct()).all()
+    assert len(hashes) == 1
+    for user_id in _db.session.scalars(select(User.id)):
+        assert CycleSummaryService.check(user_id) == {}
+    user = _db.session.scalars(select(User)).first()
+    assert user.check_password("password")
+    assert ReportService.get_cycle_context(user.id)["cycle_length"] is not None
+
+
+def test_seed_command_appends_after_existing_rows(runner, db, test_user, test_period):
+    result = runner.invoke(args=["seed", "--users", "2", "--periods-per-user", "3"])
+
+    assert result.exit_code == 0, result.output
+    assert _db.session.scalar(select(func.count()).select_from(User)) == 3
+    assert _db.session.scalar(select(func.count()).select_from(Period)) == 7
+
+
+def test_user_factory_builds_history_and_summary(db):
+    user = UserFactory(periods=6, periods__irregular=True)
+
+    assert user.check_password(DEFAULT_PASSWORD)
+    assert len(user.periods) == 6
+    assert CycleSummaryService.check(user.id) == {}
+
+
+def test_period_factory_ongoing_trait(db):
+    period = PeriodFactory(ongoing=True)
+    completed = PeriodFactory(user=period.user)
+
+    assert period.end_date is None
+    assert 1 <= completed.duration <= 10
+    assert CycleSummaryService.check(period.user_id) == {}
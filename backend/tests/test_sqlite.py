@@ -0,0 +1,40 @@
+import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Period
+from app.utils.sqlite import sqlite_pragmas
+
+
+def pragma(db, name):
+    return db.session.connection().exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_connections_get_configured_pragmas(app, db):
+    assert pragma(db, "journal_mode") == "wal"
+    assert pragma(db, "synchronous") == 1  # NORMAL
+    assert pragma(db, "busy_timeout") == app.config["SQLITE_BUSY_TIMEOUT"]
+    assert pragma(db, "cache_size") == app.config["SQLITE_CACHE_SIZE"]
+    assert pragma(db, "temp_store") == 2  # MEMORY
+    assert pragma(db, "foreign_keys") == 1
+
+
+def test_foreign_keys_are_enforced(db):
+    db.session.add(Period(user_id=12345, start_date=datetime.date(2024, 1, 1)))
+
+    with pytest.raises(IntegrityError):
+        db.session.commit()
+    db.session.rollback()
+
+
+def test_unset_pragmas_are_left_out():
+    statements = sqlite_pragmas(
+        {
+            "SQLITE_JOURNAL_MODE": "WAL",
+            "SQLITE_MMAP_SIZE": None,
+            "SQLITE_FOREIGN_KEYS": False,
+        }
+    )
+
+    assert statements == ["PRAGMA journal_mode = WAL", "PRAGMA foreign_keys = OFF"]
@@ -0,0 +1,126 @@
+import gzip
+import shutil
+
+import brotli
+import pytest
+
+from app import create_app
+from app.config import TestingConfig, config_by_name
+from app.utils.static_assets import precompress
+
+BUNDLE = "assets/index-AbC_12-z.js"
+BUNDLE_SOURCE = b"export const messages = {};\n" * 200
+INDEX_HTML = b"<!doctype html><html><body><div id='app'></div></body></html>"
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    """A small Vite build with precompressed variants."""
+    build = tmp_path / "dist"
+    (build / "assets" / "icons").mkdir(parents=True)
+    (build / "index.html").write_bytes(INDEX_HTML)
+    (build / BUNDLE).write_bytes(BUNDLE_SOURCE)
+    (build / "assets" / "icons" / "home.png").write_bytes(b"\x89PNG" + bytes(2000))
+    (build / "sw.js").write_bytes(b"self.skipWaiting();")
+    list(precompress(str(build)))
+    return build
+
+
+@pytest.fixture
+def make_client(build_dir):
+    """Test clients of separate apps serving ``build_dir``."""
+    names = []
+
+    def make(**settings):
+        name = f"static{len(names)}"
+        names.append(name)
+        config_by_name[name] = type(
+            "StaticConfig",
+            (TestingConfig,),
+            {"STATIC_ASSETS_DIR": str(build_dir), **settings},
+        )
+        return create_app(name).test_client()
+
+    yield make
+    for name in names:
+        del config_by_name[name]
+
+
+def test_precompress_only_writes_worthwhile_variants(build_dir):
+    assert (build_dir / f"{BUNDLE}.br").exists()
+    assert (build_dir / f"{BUNDLE}.gz").exists()
+    # Too small, and not compressible
+    assert not (build_dir / "sw.js.br").exists()
+    assert not (build_dir / "assets" / "icons" / "home.png.gz").exists()
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encoding",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("", None),
+    ],
+)
+def test_bundles_are_negotiated_and_immutable(make_client, accept_encoding, encoding):
+    client = make_client()
+
+    response = client.get(f"/{BUNDLE}", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.mimetype in ("text/javascript", "application/javascript")
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.headers.get("Content-Encoding") == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]
+    body = response.get_data()
+    if encoding == "br":
+        body = brotli.decompress(body)
+    elif encoding == "gzip":
+        body = gzip.decompress(body)
+    assert body == BUNDLE_SOURCE
+
+
+def test_client_routes_get_index_with_etag(make_client):
+    client = make_client()
+
+    response = client.get("/dashboard")
+
+    assert response.status_code == 200
+    assert response.get_data() == INDEX_HTML
+    assert response.headers["Cache-Control"] == "no-cache"
+    etag = response.headers["ETag"]
+
+    response = client.get("/account", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_unfingerprinted_files_are_revalidated(make_client):
+    client = make_client(STATIC_MAX_AGE=600)
+
+    assert client.get("/sw.js").headers["Cache-Control"] == "public, max-age=600"
+    icon = client.get("/assets/icons/home.png")
+    assert icon.mimetype == "image/png"
+    assert icon.headers["Cache-Control"] == "public, max-age=600"
+
+
+def test_assets_are_served_from_memory(make_client, build_dir):
+    client = make_client()
+    shutil.rmtree(build_dir)
+
+    assert client.get(f"/{BUNDLE}").get_data() == BUNDLE_SOURCE
+    assert client.get("/").get_data() == INDEX_HTML
+
+
+def test_large_files_are_sent_from_disk(make_client):
+    client = make_client(STATIC_MEMORY_MAX_FILE_SIZE=1000)
+
+    response = client.get("/assets/icons/home.png")
+
+    assert response.status_code == 200
+    assert response.get_data().startswith(b"\x89PNG")
+    assert response.headers["ETag"]
+
+
+def test_missing_build_answers_404(client):
+    assert client.get("/dashboard").status_code == 404
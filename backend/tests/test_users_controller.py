@@ -93,3 +93,53 @@ def test_patch_own_user_unauthorized(client):
     assert response.status_code == 401
     data = response.get_json()
     assert data["message"] == "Request does not contain an access token."
+
+
+def login(client, login_identifier, password):
+    response = client.post(
+        url_for("auth.login"),
+        json={"login": login_identifier, "password": password},
+    )
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_change_password_revokes_existing_tokens(client, test_user):
+    tokens = login(client, test_user.username, "password")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = client.post(
+        url_for("users.change_own_password"),
+        json={"current_password": "password", "new_password": "new-password"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get(url_for("users.get_own_user"), headers=headers)
+    assert response.status_code == 401
+    response = client.post(
+        url_for("auth.refresh"),
+        headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+    )
+    assert response.status_code == 401
+
+    tokens = login(client, test_user.username, "new-password")
+    response = client.get(
+        url_for("users.get_own_user"),
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+    assert response.status_code == 200
+
+
+def test_changing_username_revokes_existing_tokens(client, test_user):
+    tokens = login(client, test_user.username, "password")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = client.patch(
+        url_for("users.patch_own_user"), json={"username": "renamed"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.get_json()["username"] == "renamed"
+
+    response = client.get(url_for("users.get_own_user"), headers=headers)
+    assert response.status_code == 401